@@ -0,0 +1,166 @@
+import argparse
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.suite import find_input, scaled_input_path
+from common import cache, instrument
+from generators.generate import write_input
+from runner.registry import experimental, solvers, load_solver
+
+MB = 1024 * 1024
+
+# (day, part, variant) -> {input scale: peak traced memory budget in MB}
+# Budgets are about twice the peaks measured on generated inputs (seed 0)
+memory_budgets: Dict[Tuple[int, int, str], Dict[int, float]] = {
+    (1, 1, 'default'): {1: 1, 10: 1},
+    (1, 2, 'default'): {1: 1, 10: 1},
+    (1, 1, 'numpy'): {1: 1, 10: 7},
+    (1, 2, 'numpy'): {1: 1, 10: 7},
+    (1, 1, 'parallel'): {1: 1, 10: 7},
+    (1, 2, 'parallel'): {1: 1, 10: 7},
+    (2, 1, 'default'): {1: 1, 10: 1},
+    (2, 2, 'default'): {1: 1, 10: 1},
+    (2, 1, 'numpy'): {1: 1, 10: 1},
+    (2, 2, 'numpy'): {1: 1, 10: 1},
+    (3, 1, 'default'): {1: 1, 10: 1},
+    (3, 2, 'default'): {1: 1, 10: 1},
+    (3, 1, 'bitmask'): {1: 1, 10: 2},
+    (3, 2, 'bitmask'): {1: 1, 10: 2},
+    # all integers of the file are extracted at once
+    (4, 1, 'default'): {1: 1, 10: 7},
+    (4, 2, 'default'): {1: 1, 10: 7},
+    (4, 1, 'numpy'): {1: 1, 10: 7},
+    (4, 2, 'numpy'): {1: 1, 10: 7},
+    (5, 1, 'default'): {1: 1, 10: 4},
+    (5, 2, 'default'): {1: 1, 10: 4},
+    (5, 1, 'array'): {1: 1, 10: 4},
+    (5, 2, 'array'): {1: 1, 10: 4},
+    (5, 1, 'trace'): {1: 1, 10: 4},
+    (5, 2, 'trace'): {1: 1, 10: 4},
+    (5, 1, 'rope'): {1: 1, 10: 4},
+    (5, 2, 'rope'): {1: 1, 10: 4},
+    (6, 1, 'default'): {1: 1, 10: 1},
+    (6, 2, 'default'): {1: 1, 10: 1},
+    (6, 1, 'numpy'): {1: 1, 10: 2},
+    (6, 2, 'numpy'): {1: 1, 10: 2},
+    (7, 1, 'default'): {1: 1, 10: 2},
+    (7, 2, 'default'): {1: 1, 10: 2},
+    (8, 1, 'default'): {1: 1, 10: 2},
+    (8, 2, 'default'): {1: 1, 10: 2},
+    (9, 1, 'default'): {1: 4, 10: 36},
+    (9, 2, 'default'): {1: 4, 10: 32},
+    (10, 1, 'default'): {1: 1, 10: 1},
+    (10, 2, 'default'): {1: 1, 10: 1},
+    (11, 1, 'default'): {1: 1, 10: 1},
+    (11, 2, 'default'): {1: 1, 10: 1},
+    (12, 1, 'default'): {1: 1, 10: 1},
+    (12, 2, 'default'): {1: 1, 10: 1},
+    (13, 1, 'default'): {1: 1, 10: 4},
+    (13, 2, 'default'): {1: 1, 10: 4},
+    (14, 1, 'sets'): {1: 2},
+    (14, 2, 'sets'): {1: 3},
+    (14, 1, 'sets_optim'): {1: 2},
+    (14, 2, 'sets_optim'): {1: 3},
+    (14, 1, 'numpy_optim'): {1: 2, 10: 25},
+    (14, 2, 'numpy_optim'): {1: 3, 10: 33},
+    # every position of the checked row covered by a sensor is stored in a set
+    (15, 1, 'default'): {1: 2048},
+    (15, 2, 'default'): {1: 1},
+    (16, 1, 'default'): {1: 1},
+    # all orders of opening the valves (with their pressure) are collected before the best pair is searched for
+    (16, 2, 'default'): {1: 56},
+    (17, 1, 'default'): {1: 2},
+    (17, 2, 'default'): {1: 2},
+    (18, 1, 'default'): {1: 2},
+    (18, 2, 'default'): {1: 2},
+}
+
+
+@dataclass
+class MemoryResult:
+    day: int
+    part: int
+    variant: str
+    scale: int
+    peak_memory: int
+    budget: Optional[float] = None
+    phase_peaks: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f'day_{self.day:02d}/part{self.part}/{self.variant}/x{self.scale}'
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.peak_memory > self.budget * MB
+
+
+def profile(solver: Callable, path: str) -> Tuple[int, Dict[str, int]]:
+    """Return (peak traced memory of the solver, peaks of the phases reported by the solver)."""
+    instrument.reset()
+    instrument.enable(memory=True)
+    try:
+        with instrument.phase('solve'):
+            solver(path)
+    finally:
+        instrument.enable(False)
+
+    phase_peaks = dict(instrument.memory_peaks)
+    return phase_peaks.pop('solve'), phase_peaks
+
+
+def run(days: List[int], scale: int, inputs_dir: str, budgeted_only: bool = False,
+        generate_seed: Optional[int] = None, include_experimental: bool = False) -> List[MemoryResult]:
+    """Experimental solvers are skipped unless include_experimental is set."""
+    results = []
+    for (day, part, variant), target in solvers.items():
+        budget = memory_budgets.get((day, part, variant), {}).get(scale)
+        if day not in days or (budgeted_only and budget is None):
+            continue
+        if (day, part, variant) in experimental and not include_experimental:
+            continue
+
+        path = find_input(inputs_dir, day, scale)
+        if path is None and generate_seed is not None:
+            path = scaled_input_path(inputs_dir, day, scale)
+            write_input(day, path, scale, generate_seed)
+        if path is None:
+            print(f'day_{day:02d}/part{part}/{variant}: no input for x{scale}, skipped', file=sys.stderr)
+            continue
+
+        peak_memory, phase_peaks = profile(load_solver(target), path)
+        result = MemoryResult(day, part, variant, scale, peak_memory, budget, phase_peaks)
+        results.append(result)
+
+        budget_info = 'no budget' if budget is None else f'budget {budget:.2f} MB'
+        print(f'{result.key:<35} {peak_memory / MB:10.2f} MB  {budget_info}{"  OVER BUDGET" * result.over_budget}')
+        for name, peak in phase_peaks.items():
+            print(f'    {name:<31} {peak / MB:10.2f} MB')
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Profile peak memory of solvers and check it against budgets.')
+    parser.add_argument('--days', type=int, nargs='+', default=list(range(1, 26)))
+    parser.add_argument('--scale', type=int, default=1, help='input scale, e.g. 10 for inputs 10x the puzzle size')
+    parser.add_argument('--inputs', default='inputs', help='directory with scaled inputs')
+    parser.add_argument('--generate', action='store_true', help='generate missing inputs')
+    parser.add_argument('--seed', type=int, default=0, help='seed for generated inputs')
+    parser.add_argument('--budgeted-only', action='store_true', help='profile only solvers with a budget for the scale')
+    parser.add_argument('--include-experimental', action='store_true',
+                        help='also profile experimental solvers (they may run for a very long time)')
+    args = parser.parse_args()
+
+    # Parsing is a part of the solution, so parsed inputs are never taken from the cache
+    cache.enabled = False
+
+    results = run(args.days, args.scale, args.inputs, args.budgeted_only, args.seed if args.generate else None,
+                  args.include_experimental)
+
+    over_budget = [result for result in results if result.over_budget]
+    for result in over_budget:
+        print(f'OVER BUDGET {result.key}: {result.peak_memory / MB:.2f} MB > {result.budget:.2f} MB', file=sys.stderr)
+
+    sys.exit(1 if over_budget else 0)
@@ -0,0 +1,54 @@
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable, Iterable
+
+from common.reader import yield_rows, yield_byte_rows, yield_memoryview_rows
+from day_02.solution import yield_rows as yield_rows_readline
+
+readers = {
+    'readline (day_02)': yield_rows_readline,
+    'mmap str': yield_rows,
+    'mmap bytes': yield_byte_rows,
+    'mmap memoryview': yield_memoryview_rows,
+}
+
+
+def write_sample_file(path: str, size_mb: int) -> None:
+    row = b'Sensor at x=2557568, y=3759110: closest beacon is at x=2594124, y=3746832\n'
+    with open(path, 'wb') as f:
+        f.write(row * (size_mb * 1024 * 1024 // len(row)))
+
+
+def measure(reader: Callable[[str], Iterable], path: str, repeats: int) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        st = time.perf_counter()
+        for _ in reader(path):
+            pass
+        best = min(best, time.perf_counter() - st)
+    return best
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare throughput of the row readers.')
+    parser.add_argument('path', nargs='?', help='input file; a sample file is generated if omitted')
+    parser.add_argument('--size-mb', type=int, default=100, help='size of the generated sample file')
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    path = args.path
+    if path is None:
+        fd, path = tempfile.mkstemp(suffix='.txt')
+        os.close(fd)
+        write_sample_file(path, args.size_mb)
+
+    try:
+        file_size_mb = os.path.getsize(path) / 1024 / 1024
+        for name, reader in readers.items():
+            duration = measure(reader, path, args.repeats)
+            print(f'{name:<20} {duration:8.3f} s {file_size_mb / duration:10.1f} MB/s')
+    finally:
+        if args.path is None:
+            os.remove(path)
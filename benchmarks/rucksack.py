@@ -0,0 +1,64 @@
+import argparse
+import math
+import os
+import tempfile
+import time
+from typing import Callable, Dict, Tuple
+
+from day_03 import solution, solution_bitmask, solution_part2
+from generators.generate import generate_rows
+
+# name -> (part 1, part 2)
+solvers: Dict[str, Tuple[Callable[[str], int], Callable[[str], int]]] = {
+    'sets': (solution.part1, solution_part2.part2),
+    'bitmask': (solution_bitmask.part1, solution_bitmask.part2),
+}
+
+# Rucksacks in a generated input of scale 1
+RUCKSACKS_PER_SCALE = 300
+# Generating rucksacks is slow, bigger inputs repeat an input of this scale
+MAX_GENERATED_SCALE = 100
+
+
+def write_sample_file(path: str, rucksacks: int, seed: int) -> None:
+    """Write at least the given number of rucksacks, in complete groups of three."""
+    scale = min(math.ceil(rucksacks / RUCKSACKS_PER_SCALE), MAX_GENERATED_SCALE)
+    rows = list(generate_rows(3, scale, seed))
+    block = ''.join(row + '\n' for row in rows)
+    with open(path, 'w', encoding='utf-8') as f:
+        for _ in range(math.ceil(rucksacks / len(rows))):
+            f.write(block)
+
+
+def measure(solver: Callable[[str], int], path: str, repeats: int) -> Tuple[float, int]:
+    best = float('inf')
+    answer = None
+    for _ in range(repeats):
+        st = time.perf_counter()
+        answer = solver(path)
+        best = min(best, time.perf_counter() - st)
+    return best, answer
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare set-based and bitmask solutions of day 3.')
+    parser.add_argument('path', nargs='?', help='input file; an input is generated if omitted')
+    parser.add_argument('--rucksacks', type=int, default=10 ** 7, help='size of the generated input')
+    parser.add_argument('--repeats', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    path = args.path
+    if path is None:
+        fd, path = tempfile.mkstemp(suffix='.txt')
+        os.close(fd)
+        write_sample_file(path, args.rucksacks, args.seed)
+
+    try:
+        for part in (1, 2):
+            for name, parts in solvers.items():
+                duration, answer = measure(parts[part - 1], path, args.repeats)
+                print(f'part {part} {name:<10} {duration:8.3f} s {answer:>14}')
+    finally:
+        if args.path is None:
+            os.remove(path)
@@ -0,0 +1,139 @@
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from common import cache
+from generators.generate import write_input
+from runner.registry import experimental, solvers, load_solver
+
+
+@dataclass
+class BenchmarkResult:
+    day: int
+    part: int
+    variant: str
+    scale: int
+    time: float
+    peak_memory: int
+
+    @property
+    def key(self) -> str:
+        return f'day_{self.day:02d}/part{self.part}/{self.variant}/x{self.scale}'
+
+
+def scaled_input_path(inputs_dir: str, day: int, scale: int) -> str:
+    return os.path.join(inputs_dir, f'day_{day:02d}', f'input_x{scale}.txt')
+
+
+def find_input(inputs_dir: str, day: int, scale: int) -> Optional[str]:
+    """Inputs are stored as <inputs_dir>/day_XX/input_x<scale>.txt. Puzzle input (day_XX/input.txt) is used for x1."""
+    candidates = [scaled_input_path(inputs_dir, day, scale)]
+    if scale == 1:
+        candidates.append(os.path.join(f'day_{day:02d}', 'input.txt'))
+
+    return next((path for path in candidates if os.path.isfile(path)), None)
+
+
+def measure(solver: Callable, path: str, repeats: int) -> Tuple[float, int]:
+    """Return (best wall time, peak traced memory). Memory is measured in a separate run - tracing slows down code."""
+    best_time = float('inf')
+    for _ in range(repeats):
+        st = time.perf_counter()
+        solver(path)
+        best_time = min(best_time, time.perf_counter() - st)
+
+    tracemalloc.start()
+    try:
+        solver(path)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return best_time, peak_memory
+
+
+def run(days: List[int], scale: int, inputs_dir: str, repeats: int,
+        generate_seed: Optional[int] = None) -> List[BenchmarkResult]:
+    """Missing inputs are generated when generate_seed is set. Experimental solvers are skipped."""
+    results = []
+    for (day, part, variant), target in solvers.items():
+        if day not in days or (day, part, variant) in experimental:
+            continue
+
+        path = find_input(inputs_dir, day, scale)
+        if path is None and generate_seed is not None:
+            path = scaled_input_path(inputs_dir, day, scale)
+            write_input(day, path, scale, generate_seed)
+        if path is None:
+            print(f'day_{day:02d}/part{part}/{variant}: no input for x{scale}, skipped', file=sys.stderr)
+            continue
+
+        duration, peak_memory = measure(load_solver(target), path, repeats)
+        results.append(BenchmarkResult(day, part, variant, scale, duration, peak_memory))
+        print(f'{results[-1].key:<35} {duration:10.4f} s {peak_memory / 1024 / 1024:10.2f} MB')
+
+    return results
+
+
+def load_baseline(path: str) -> Dict[str, Dict]:
+    if not os.path.isfile(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, baseline: Dict[str, Dict], results: List[BenchmarkResult]) -> None:
+    for result in results:
+        baseline[result.key] = asdict(result)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+
+
+def find_regressions(baseline: Dict[str, Dict], results: List[BenchmarkResult], tolerance: float) -> List[str]:
+    regressions = []
+    for result in results:
+        if result.key not in baseline:
+            continue
+        for metric in ['time', 'peak_memory']:
+            baseline_value = baseline[result.key][metric]
+            value = getattr(result, metric)
+            if value > baseline_value * (1 + tolerance):
+                regressions.append(f'{result.key}: {metric} {value:.4g} > baseline {baseline_value:.4g}')
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark solvers and compare them with the stored baseline.')
+    parser.add_argument('--days', type=int, nargs='+', default=list(range(1, 26)))
+    parser.add_argument('--scale', type=int, default=1, help='input scale, e.g. 10 for inputs 10x the puzzle size')
+    parser.add_argument('--inputs', default='inputs', help='directory with scaled inputs')
+    parser.add_argument('--generate', action='store_true', help='generate missing inputs')
+    parser.add_argument('--seed', type=int, default=0, help='seed for generated inputs')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--baseline', default=os.path.join('benchmarks', 'baseline.json'))
+    parser.add_argument('--update-baseline', action='store_true', help='store results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative regression, 0.2 = 20%%')
+    parser.add_argument('--cache', action='store_true',
+                        help='store parsed inputs in AOC_CACHE_DIR and reuse them (measures warm runs, off by default)')
+    args = parser.parse_args()
+
+    # Cold runs are measured by default, parsing is part of the solution
+    cache.enabled = args.cache
+
+    results = run(args.days, args.scale, args.inputs, args.repeats, args.seed if args.generate else None)
+    baseline = load_baseline(args.baseline)
+
+    if args.update_baseline:
+        save_baseline(args.baseline, baseline, results)
+        sys.exit(0)
+
+    regressions = find_regressions(baseline, results, args.tolerance)
+    for regression in regressions:
+        print(f'REGRESSION {regression}', file=sys.stderr)
+
+    sys.exit(1 if regressions else 0)
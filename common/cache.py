@@ -0,0 +1,102 @@
+import functools
+import hashlib
+import os
+import pickle
+import sys
+from typing import Any, Callable, Optional
+
+# The cache is off unless AOC_CACHE=1 (or --cache of the runner and the benchmark suite) enables it. Parsed inputs
+# are stored in AOC_CACHE_DIR (default ~/.cache/advent-of-code-2022).
+cache_dir = os.environ.get('AOC_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'advent-of-code-2022'))
+enabled = os.environ.get('AOC_CACHE', '0') == '1'
+
+
+def enable() -> None:
+    """Enable the cache in this process and in the worker processes it starts."""
+    global enabled
+    enabled = True
+    os.environ['AOC_CACHE'] = '1'
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_ndarray(value: Any) -> bool:
+    # numpy is imported only if it is already used by the parser
+    np = sys.modules.get('numpy')
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def _parser_name(parser: Callable) -> str:
+    module_name = parser.__module__
+    if module_name == '__main__':
+        # Pickled objects reference classes from __main__, so entries of a script are kept apart from its module
+        spec = getattr(sys.modules['__main__'], '__spec__', None)
+        module_name = f'{spec.name if spec else "script"}.__main__'
+    return f'{module_name}.{parser.__qualname__}'
+
+
+def _load(entry_path: str) -> Optional[Any]:
+    try:
+        if os.path.isfile(entry_path + '.npy'):
+            import numpy as np
+            return np.load(entry_path + '.npy', allow_pickle=False)
+        if os.path.isfile(entry_path + '.pickle'):
+            with open(entry_path + '.pickle', 'rb') as f:
+                return pickle.load(f)
+    except (OSError, ValueError, EOFError, AttributeError, pickle.UnpicklingError):
+        # Unreadable entries are parsed again and overwritten
+        pass
+    return None
+
+
+def _store(entry_path: str, value: Any) -> None:
+    os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+
+    extension = '.npy' if _is_ndarray(value) else '.pickle'
+    # Write to a temporary file first, so other processes never read a partially written entry
+    tmp_path = f'{entry_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        if extension == '.npy':
+            import numpy as np
+            np.save(f, value, allow_pickle=False)
+        else:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, entry_path + extension)
+
+
+def cached_parser(version: int = 1) -> Callable:
+    """
+    Cache the result of a parser which takes the input path as the first argument.
+
+    Entries are keyed by the parser name, its version and the hash of the input content, so a changed input or
+    a bumped version (required whenever the parser output changes) never returns a stale result. numpy arrays are
+    stored as .npy files, everything else is pickled. Every call returns a new object, so callers may modify it.
+    """
+
+    def decorator(parser: Callable) -> Callable:
+        @functools.wraps(parser)
+        def wrapper(path: str, *args, **kwargs) -> Any:
+            if not enabled:
+                return parser(path, *args, **kwargs)
+
+            key = f'{_parser_name(parser)}-v{version}-{file_digest(path)}'
+            if args or kwargs:
+                arguments = repr((args, sorted(kwargs.items()))).encode()
+                key += '-' + hashlib.blake2b(arguments, digest_size=8).hexdigest()
+            entry_path = os.path.join(cache_dir, key)
+
+            value = _load(entry_path)
+            if value is None:
+                value = parser(path, *args, **kwargs)
+                _store(entry_path, value)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+# Value of the cells around the grid
+BORDER = 255
+
+
+class Grid:
+    """
+    Grid of uint8 cells (any number of dimensions) stored in a flat bytearray.
+
+    Cells are addressed with flat indexes and neighbours are reached by adding offsets to the index, so hot loops
+    use only integer arithmetic and bytearray indexing. The grid is surrounded by `padding` cells set to `border`,
+    so the bounds check for a neighbour of an inner cell is a check of the neighbour value.
+    `array` and `inner` are numpy views of the same memory, for vectorised operations.
+    """
+
+    def __init__(self, shape: Tuple[int, ...], fill: int = 0, padding: int = 1, border: int = BORDER) -> None:
+        self.shape = tuple(shape)
+        self.padding = padding
+        self.border = border
+
+        self.padded_shape = tuple(n + 2 * padding for n in self.shape)
+        self.strides = tuple(int(np.prod(self.padded_shape[axis + 1:])) for axis in range(len(self.shape)))
+
+        # Offsets of the cells sharing a side (an edge in 2D, a face in 3D) with a cell
+        self.neighbour_offsets = tuple(offset for stride in self.strides for offset in (-stride, stride))
+
+        self.data = bytearray([border]) * int(np.prod(self.padded_shape))
+        if fill != border:
+            self.inner[...] = fill
+
+    @classmethod
+    def from_array(cls, array: np.ndarray, padding: int = 1, border: int = BORDER) -> Grid:
+        grid = cls(array.shape, padding=padding, border=border)
+        grid.inner[...] = array
+        return grid
+
+    @classmethod
+    def from_text(cls, path: str, padding: int = 1, border: int = BORDER) -> Grid:
+        """Load a 2D grid of characters, one row per line. Cells hold the character codes."""
+        with open(path, 'rb') as f:
+            lines = [line for line in f.read().splitlines() if line]
+
+        n_cols = len(lines[0])
+        if any(len(line) != n_cols for line in lines):
+            raise ValueError('Rows of the grid have different lengths')
+
+        array = np.frombuffer(b''.join(lines), dtype=np.uint8).reshape(len(lines), n_cols)
+        return cls.from_array(array, padding, border)
+
+    @property
+    def array(self) -> np.ndarray:
+        """Numpy view of the grid including the border."""
+        return np.frombuffer(self.data, dtype=np.uint8).reshape(self.padded_shape)
+
+    @property
+    def inner(self) -> np.ndarray:
+        """Numpy view of the grid without the border."""
+        return self.array[tuple(slice(self.padding, self.padding + n) for n in self.shape)]
+
+    def index(self, *coord: int) -> int:
+        return sum((c + self.padding) * stride for c, stride in zip(coord, self.strides))
+
+    def coord(self, index: int) -> Tuple[int, ...]:
+        coord = []
+        for stride in self.strides:
+            c, index = divmod(index, stride)
+            coord.append(c - self.padding)
+        return tuple(coord)
+
+    def offset(self, *delta: int) -> int:
+        return sum(d * stride for d, stride in zip(delta, self.strides))
+
+    def find(self, value: int) -> int:
+        index = self.data.find(value)
+        if index == -1:
+            raise ValueError(f'Value {value} not found')
+        return index
+
+    def count(self, value: int) -> int:
+        return int(np.count_nonzero(self.inner == value))
+
+    def extend(self, n: int, fill: int = 0) -> None:
+        """Add n cells along the first axis, e.g. rows at the bottom of a 2D grid. Existing indexes stay valid."""
+        block = np.full((n,) + self.padded_shape[1:], self.border, dtype=np.uint8)
+        block[(slice(None),) + tuple(slice(self.padding, self.padding + size) for size in self.shape[1:])] = fill
+
+        end = (self.padding + self.shape[0]) * self.strides[0]
+        self.data[end:end] = block.tobytes()
+
+        self.shape = (self.shape[0] + n,) + self.shape[1:]
+        self.padded_shape = (self.padded_shape[0] + n,) + self.padded_shape[1:]
+
+    def __getitem__(self, index: int) -> int:
+        return self.data[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.data[index] = value
+
+    def __len__(self) -> int:
+        return len(self.data)
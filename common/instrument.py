@@ -0,0 +1,101 @@
+import contextlib
+import os
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from typing import ContextManager, Dict, Iterator, List
+
+# Instrumentation is disabled by default, AOC_INSTRUMENT=1 enables it.
+# Hot loops should guard the calls with `if instrument.enabled:`, so a disabled counter costs a single attribute check.
+enabled = os.environ.get('AOC_INSTRUMENT', '0') == '1'
+# Record tracemalloc peaks of phases as well (slows the code down a lot), AOC_PROFILE_MEMORY=1 enables it
+profile_memory = os.environ.get('AOC_PROFILE_MEMORY', '0') == '1'
+
+counters: Counter = Counter()
+timers: Dict[str, float] = defaultdict(float)
+calls: Counter = Counter()
+# Highest peak of traced memory allocated during a phase (above the memory allocated when the phase started)
+memory_peaks: Dict[str, int] = defaultdict(int)
+
+_disabled_phase = contextlib.nullcontext()
+
+# [memory at the start, highest memory seen] of the phases being measured, innermost last
+_memory_stack: List[List[int]] = []
+_tracing_started = False
+
+
+def enable(flag: bool = True, memory: bool = False) -> None:
+    global enabled, profile_memory
+    enabled = flag
+    profile_memory = flag and memory
+
+
+def reset() -> None:
+    counters.clear()
+    timers.clear()
+    calls.clear()
+    memory_peaks.clear()
+
+
+def count(name: str, n: int = 1) -> None:
+    if enabled:
+        counters[name] += n
+
+
+def _start_memory_phase() -> None:
+    global _tracing_started
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _tracing_started = True
+
+    current, peak = tracemalloc.get_traced_memory()
+    if _memory_stack:
+        # The peak is reset for the new phase, so keep the peak reached so far by the outer phase
+        _memory_stack[-1][1] = max(_memory_stack[-1][1], peak)
+    tracemalloc.reset_peak()
+    _memory_stack.append([current, current])
+
+
+def _stop_memory_phase(name: str) -> None:
+    global _tracing_started
+    start, highest = _memory_stack.pop()
+    highest = max(highest, tracemalloc.get_traced_memory()[1])
+    memory_peaks[name] = max(memory_peaks[name], highest - start)
+
+    if _memory_stack:
+        _memory_stack[-1][1] = max(_memory_stack[-1][1], highest)
+    elif _tracing_started:
+        tracemalloc.stop()
+        _tracing_started = False
+
+
+@contextlib.contextmanager
+def _phase(name: str) -> Iterator[None]:
+    if profile_memory:
+        _start_memory_phase()
+    st = time.perf_counter()
+    try:
+        yield
+    finally:
+        timers[name] += time.perf_counter() - st
+        calls[name] += 1
+        if profile_memory:
+            _stop_memory_phase(name)
+
+
+def phase(name: str) -> ContextManager:
+    """Measure the time (and memory peak in memory profiling mode) of the block. Repeated phases are summed up."""
+    if not enabled:
+        return _disabled_phase
+    return _phase(name)
+
+
+def report() -> str:
+    lines = []
+    for name in timers:
+        line = f'{name:<40} {timers[name]:10.4f} s  ({calls[name]} calls)'
+        if name in memory_peaks:
+            line += f'  peak {memory_peaks[name] / 1024 / 1024:.2f} MB'
+        lines.append(line)
+    lines.extend(f'{name:<40} {value:12d}' for name, value in counters.items())
+    return '\n'.join(lines)
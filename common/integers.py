@@ -0,0 +1,66 @@
+from typing import Union
+
+import numpy as np
+
+from common.reader import BLOCK_SIZE, map_file, yield_blocks
+
+# 10 ** n for every number of digits which fits in int64
+_POWERS_OF_10 = 10 ** np.arange(19, dtype=np.int64)
+
+
+def extract_integers(data: Union[bytes, bytearray, memoryview], signed: bool = True) -> np.ndarray:
+    """
+    Return all integers found in the text (in order) as an int64 array, in a single vectorised pass.
+
+    With signed=True a '-' directly before a number is its sign, unless the '-' itself follows a digit,
+    so '2-4' gives 2 and 4, while 'x=-4' gives -4.
+    """
+    text = np.frombuffer(data, dtype=np.uint8)
+
+    is_digit = (text >= ord('0')) & (text <= ord('9'))
+    edges = np.diff(is_digit.view(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64)
+
+    lengths = ends - starts
+    if lengths.max() >= len(_POWERS_OF_10):
+        raise ValueError('Integer too large for int64')
+
+    # Every digit is multiplied by 10 ** (number of digits after it in its number), then the numbers are summed up
+    digits = text[is_digit] - ord('0')
+    first_digits = np.zeros(len(starts), dtype=np.int64)
+    first_digits[1:] = np.cumsum(lengths)[:-1]
+    digits_after = np.repeat(ends, lengths) - 1 - np.flatnonzero(is_digit)
+    values = np.add.reduceat(digits * _POWERS_OF_10[digits_after], first_digits)
+
+    if signed:
+        has_minus = np.zeros(len(starts), dtype=bool)
+        has_minus[starts > 0] = text[starts[starts > 0] - 1] == ord('-')
+        # '-' between two numbers is a separator (e.g. a range), not a sign
+        after_digit = np.zeros(len(starts), dtype=bool)
+        after_digit[starts > 1] = is_digit[starts[starts > 1] - 2]
+        values[has_minus & ~after_digit] *= -1
+
+    return values
+
+
+def read_integers(path: str, signed: bool = True, block_size: int = BLOCK_SIZE) -> np.ndarray:
+    """Return all integers found in the file. The file is processed in blocks, so the temporary arrays stay small."""
+    data = map_file(path)
+    try:
+        # Blocks end with a newline, so a number is never split between two blocks
+        chunks = [extract_integers(data[start:end], signed) for start, end in yield_blocks(data, block_size)]
+    finally:
+        if not isinstance(data, bytes):
+            data.close()
+    return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+
+
+def read_integer_rows(path: str, row_length: int, signed: bool = True) -> np.ndarray:
+    """Return integers of the file as a (n, row_length) array, e.g. 4 integers per line of '2-4,6-8' lines."""
+    integers = read_integers(path, signed)
+    if len(integers) % row_length:
+        raise ValueError(f'Number of integers ({len(integers)}) is not a multiple of {row_length}')
+    return integers.reshape(-1, row_length)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import dataclasses
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Tuple
+
+from common.reader import yield_rows
+
+
+class Accumulator(ABC):
+    """
+    Incremental solver for line-oriented puzzles. Subclasses are dataclasses holding state of a constant size.
+
+    Lines may be fed in any number of calls. A checkpoint is a json-serialisable dict of the fields. Accumulators of
+    consecutive shards of the input are combined with merge, the merged accumulator must contain the later shard.
+    """
+
+    @abstractmethod
+    def feed(self, lines: Iterable[str]) -> None:
+        pass
+
+    @abstractmethod
+    def result(self) -> Tuple[int, int]:
+        """Answers of (part 1, part 2) for the lines fed so far."""
+
+    @abstractmethod
+    def merge(self, other: Accumulator) -> None:
+        """Update the state with the state of the shard which directly follows the shard of this accumulator."""
+
+    def checkpoint(self) -> Dict[str, Any]:
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def restore(cls, state: Dict[str, Any]) -> Accumulator:
+        return cls(**state)
+
+    @classmethod
+    def from_file(cls, path: str) -> Accumulator:
+        accumulator = cls()
+        accumulator.feed(yield_rows(path))
+        return accumulator
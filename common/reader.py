@@ -0,0 +1,97 @@
+import mmap
+from itertools import accumulate
+from typing import Generator, Optional, Union, Tuple
+
+# Files are split in blocks of roughly this size, so memory used for splitting does not grow with the file
+BLOCK_SIZE = 1 << 24
+
+
+def map_file(path: str) -> Union[mmap.mmap, bytes]:
+    """Read-only memory map of the file (b'' for an empty file). Callers close the mapping."""
+    with open(path, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return b''
+
+
+def yield_blocks(data: Union[mmap.mmap, bytes], block_size: int,
+                 start: int = 0, end: Optional[int] = None) -> Generator[Tuple[int, int], None, None]:
+    """
+    Yield (start, end) ranges of data[start:end]. Every range except the last one ends right after a newline.
+    """
+    size = len(data) if end is None else end
+    while start < size:
+        block_end = data.find(b'\n', min(start + block_size, size) - 1, size)
+        block_end = size if block_end == -1 else block_end + 1
+        yield start, block_end
+        start = block_end
+
+
+def _split_block(block: bytes) -> list:
+    rows = block.split(b'\n')
+    if rows[-1] == b'':
+        # Block ends with a newline - there is no row after it
+        rows.pop()
+    return rows
+
+
+def yield_rows(path: str, encoding: str = 'utf-8',
+               block_size: int = BLOCK_SIZE) -> Generator[str, None, None]:
+    """Drop-in replacement for day_02.solution.yield_rows. The file is decoded and split in bulk."""
+    data = map_file(path)
+    try:
+        for start, end in yield_blocks(data, block_size):
+            text = data[start:end].decode(encoding)
+            if '\r' in text:
+                # Same newline handling as a file opened in text mode
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            rows = text.split('\n')
+            if rows[-1] == '':
+                rows.pop()
+            yield from rows
+    finally:
+        # Blocks are copied, so the mapping is closed even if the generator is abandoned
+        if not isinstance(data, bytes):
+            data.close()
+
+
+def yield_byte_rows(path: str, block_size: int = BLOCK_SIZE) -> Generator[bytes, None, None]:
+    """Like yield_rows, but rows are not decoded."""
+    data = map_file(path)
+    try:
+        for start, end in yield_blocks(data, block_size):
+            block = data[start:end]
+            if b'\r' in block:
+                yield from block.splitlines()
+            else:
+                yield from _split_block(block)
+    finally:
+        if not isinstance(data, bytes):
+            data.close()
+
+
+def yield_memoryview_rows(path: str, block_size: int = BLOCK_SIZE) -> Generator[memoryview, None, None]:
+    """
+    Zero-copy rows - every row is a memoryview slice of the memory-mapped file. Rows are split on '\\n'.
+
+    The mapping stays open as long as any of the yielded rows is referenced, so rows should be released
+    (or converted with bytes()) once they are no longer needed.
+    """
+    data = map_file(path)
+    view = memoryview(data)
+    for start, end in yield_blocks(data, block_size):
+        row_lengths = [len(row) for row in _split_block(data[start:end])]
+        # Every row is followed by a newline
+        row_starts = list(accumulate(map((1).__add__, row_lengths[:-1]), initial=start))
+        if data.find(b'\r', start, end) == -1:
+            row_ends = map(int.__add__, row_starts, row_lengths)
+            yield from map(view.__getitem__, map(slice, row_starts, row_ends))
+        else:
+            for row_start, row_length in zip(row_starts, row_lengths):
+                row_end = row_start + row_length
+                if row_length and data[row_end - 1] == 13:
+                    # '\r\n' line ending
+                    row_end -= 1
+                yield view[row_start:row_end]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple
+
+from common.online import Accumulator
+from day_01.solution import TotalElfCalories
+
+
+def _join(calories: Optional[int], other_calories: Optional[int]) -> Optional[int]:
+    """Join two parts of the items of one elf (None - no items)."""
+    if calories is None:
+        return other_calories
+    if other_calories is None:
+        return calories
+    return calories + other_calories
+
+
+@dataclass
+class ElfCaloriesAccumulator(Accumulator):
+    """
+    Keeps the top elves only. An elf before the first blank line (leading) and after the last one (trailing) may
+    continue in the previous or the next shard, so they are kept apart from the complete elves in between.
+    Indexes in `top` are indexes of the complete elves.
+    """
+    top_count: int = 3
+    separated: bool = False
+    leading: Optional[int] = None
+    elves: int = 0
+    top: List[Tuple[int, int]] = field(default_factory=list)
+    trailing: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.top_count < 3:
+            raise ValueError('At least 3 top elves are required for part 2')
+
+    def _add_to_top(self, top: List[Tuple[int, int]], elf: int, calories: int) -> List[Tuple[int, int]]:
+        top = top + [(elf, calories)]
+        top.sort(key=lambda x: (-x[1], x[0]))
+        return top[:self.top_count]
+
+    def feed(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            line = line.rstrip('\r\n')
+            if line == '':
+                if not self.separated:
+                    self.separated = True
+                elif self.trailing is not None:
+                    self.top = self._add_to_top(self.top, self.elves, self.trailing)
+                    self.elves += 1
+                    self.trailing = None
+            elif self.separated:
+                self.trailing = _join(self.trailing, int(line))
+            else:
+                self.leading = _join(self.leading, int(line))
+
+    def merge(self, other: ElfCaloriesAccumulator) -> None:
+        if not isinstance(other, ElfCaloriesAccumulator):
+            raise TypeError(f'Cannot merge {type(other).__name__}')
+
+        if not self.separated:
+            self.leading = _join(self.leading, other.leading)
+            self.separated = other.separated
+            self.elves, self.top, self.trailing = other.elves, list(other.top), other.trailing
+            return
+
+        if not other.separated:
+            self.trailing = _join(self.trailing, other.leading)
+            return
+
+        # The last elf of this shard ends with the first elf of the other shard
+        joined = _join(self.trailing, other.leading)
+        top = list(self.top)
+        if joined is not None:
+            top = self._add_to_top(top, self.elves, joined)
+            self.elves += 1
+        for elf, calories in other.top:
+            top = self._add_to_top(top, self.elves + elf, calories)
+
+        self.elves += other.elves
+        self.top = top
+        self.trailing = other.trailing
+
+    def top_elves(self) -> List[TotalElfCalories]:
+        """Top elves of the input fed so far, as if it was complete."""
+        top = []
+        first_elf = 0
+        if self.leading is not None:
+            top.append((0, self.leading))
+            first_elf = 1
+        top.extend((first_elf + elf, calories) for elf, calories in self.top)
+        if self.trailing is not None:
+            top.append((first_elf + self.elves, self.trailing))
+
+        top.sort(key=lambda x: (-x[1], x[0]))
+        return [TotalElfCalories(elf, calories) for elf, calories in top[:self.top_count]]
+
+    def result(self) -> Tuple[int, int]:
+        top = self.top_elves()
+        return max((elf.calories for elf in top), default=0), sum(elf.calories for elf in top[:3])
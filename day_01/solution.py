@@ -24,14 +24,18 @@ def yield_elf_items_calories(path: str) -> Generator[List[int], None, None]:
             yield elf_calories
 
 
-if __name__ == '__main__':
-    list_with_elf_calories = './input.txt'
-
+def part1(path: str) -> int:
     elf_with_max_calories = TotalElfCalories(-1, 0)
-    for elf_index, elf_items_calories in enumerate(yield_elf_items_calories(list_with_elf_calories)):
+    for elf_index, elf_items_calories in enumerate(yield_elf_items_calories(path)):
         elf_calories = sum(elf_items_calories)
 
         if elf_calories > elf_with_max_calories.calories:
             elf_with_max_calories = TotalElfCalories(elf_index, elf_calories)
 
-    print(elf_with_max_calories.calories)
+    return elf_with_max_calories.calories
+
+
+if __name__ == '__main__':
+    list_with_elf_calories = './input.txt'
+
+    print(part1(list_with_elf_calories))
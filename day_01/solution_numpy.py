@@ -0,0 +1,100 @@
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from common.integers import extract_integers
+from common.reader import BLOCK_SIZE, map_file, yield_blocks
+from day_01.solution import TotalElfCalories
+
+
+def elf_totals_of_text(data: Union[bytes, memoryview]) -> Tuple[np.ndarray, bool, bool]:
+    """
+    Return (calories of every elf, the text starts with an item, the text ends with an item).
+
+    Elves are separated by blank lines, every other line holds calories of one item. When the text is a part of a
+    bigger file, an elf starting or ending the text may continue in the previous or the next part.
+    """
+    text = np.frombuffer(data, dtype=np.uint8)
+
+    newlines = np.flatnonzero(text == ord('\n'))
+    line_starts = np.concatenate(([0], newlines + 1))
+    line_ends = np.concatenate((newlines, [len(text)]))
+    if len(text) and text[-1] == ord('\n'):
+        # There is no line after the last newline
+        line_starts, line_ends = line_starts[:-1], line_ends[:-1]
+
+    line_lengths = line_ends - line_starts
+    # '\r' of '\r\n' line endings does not make a line non-empty
+    ends_with_cr = line_lengths > 0
+    ends_with_cr[ends_with_cr] = text[line_ends[ends_with_cr] - 1] == ord('\r')
+    non_empty = line_lengths - ends_with_cr > 0
+
+    items = extract_integers(data, signed=False)
+    if len(items) != np.count_nonzero(non_empty):
+        raise ValueError('Every non-empty line should hold calories of one item')
+    if not len(items):
+        return np.zeros(0, dtype=np.int64), False, False
+
+    # First item of an elf follows a blank line (or starts the text)
+    elf_starts = non_empty.copy()
+    elf_starts[1:] &= ~non_empty[:-1]
+    totals = np.add.reduceat(items, np.flatnonzero(elf_starts[non_empty]))
+
+    return totals, bool(non_empty[0]), bool(non_empty[-1])
+
+
+def load_elf_totals(path: str, block_size: int = BLOCK_SIZE, start: int = 0, end: Optional[int] = None) -> np.ndarray:
+    """
+    Calories of every elf of the file (or of its [start, end) byte range).
+    The file is processed in blocks, so the temporary arrays stay small.
+    """
+    data = map_file(path)
+    try:
+        parts = []
+        previous_ends_with_item = False
+        for block_start, block_end in yield_blocks(data, block_size, start, end):
+            totals, starts_with_item, ends_with_item = elf_totals_of_text(data[block_start:block_end])
+            if previous_ends_with_item and starts_with_item:
+                # Blocks are split at newlines, not blank lines - the last elf continues in this block
+                parts[-1][-1] += totals[0]
+                totals = totals[1:]
+            if len(totals):
+                parts.append(totals)
+            previous_ends_with_item = ends_with_item
+    finally:
+        if not isinstance(data, bytes):
+            data.close()
+
+    return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+
+def find_top_elves(elf_totals: np.ndarray, k: int) -> List[TotalElfCalories]:
+    """k elves with the most calories, in descending order (ties in order of elves)."""
+    if k <= 0:
+        return []
+    if k < len(elf_totals):
+        candidates = np.argpartition(-elf_totals, k - 1)[:k]
+        # argpartition does not care which of equal elves is taken, the first ones should be
+        threshold = elf_totals[candidates].min()
+        candidates = np.concatenate((np.flatnonzero(elf_totals > threshold),
+                                     np.flatnonzero(elf_totals == threshold)))[:k]
+    else:
+        candidates = np.arange(len(elf_totals))
+
+    top = sorted(zip(candidates.tolist(), elf_totals[candidates].tolist()), key=lambda x: (-x[1], x[0]))
+    return [TotalElfCalories(elf, calories) for elf, calories in top]
+
+
+def part1(path: str) -> int:
+    return sum(elf.calories for elf in find_top_elves(load_elf_totals(path), 1))
+
+
+def part2(path: str) -> int:
+    return sum(elf.calories for elf in find_top_elves(load_elf_totals(path), 3))
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    print(part1(path))
+    print(part2(path))
@@ -0,0 +1,90 @@
+import heapq
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import List, Optional, Tuple
+
+from common.reader import map_file
+from day_01.solution import TotalElfCalories
+from day_01.solution_numpy import find_top_elves, load_elf_totals
+
+# Smaller files are not worth starting processes for
+MIN_SHARD_SIZE = 1 << 26
+
+_BLANK_LINE = re.compile(b'\n\r?\n')
+
+
+def find_shards(path: str, shard_count: int) -> List[Tuple[int, int]]:
+    """
+    Split the file into at most shard_count (start, end) byte ranges of similar size.
+    Every range except the last one ends right after a blank line, so no elf is split between two shards.
+    """
+    data = map_file(path)
+    try:
+        size = len(data)
+        shards = []
+        start = 0
+        for i in range(1, shard_count):
+            if start >= size:
+                break
+            match = _BLANK_LINE.search(data, max(start, size * i // shard_count - 1))
+            if match is None:
+                break
+            shards.append((start, match.end()))
+            start = match.end()
+        if start < size:
+            shards.append((start, size))
+    finally:
+        if not isinstance(data, bytes):
+            data.close()
+    return shards
+
+
+def top_elves_of_shard(path: str, start: int, end: int, k: int) -> Tuple[int, List[TotalElfCalories]]:
+    """Return (number of elves in the shard, top k elves of the shard). Indexes of elves are local to the shard."""
+    elf_totals = load_elf_totals(path, start=start, end=end)
+    return len(elf_totals), find_top_elves(elf_totals, k)
+
+
+def merge_top_elves(shard_results: List[Tuple[int, List[TotalElfCalories]]], k: int) -> List[TotalElfCalories]:
+    """Merge the results of consecutive shards into the top k elves of the whole file."""
+    shard_tops = []
+    first_elf = 0
+    for elf_count, top in shard_results:
+        shard_tops.append([TotalElfCalories(first_elf + elf.elf, elf.calories) for elf in top])
+        first_elf += elf_count
+
+    # Every top is sorted by calories (descending), then by elf
+    merged = heapq.merge(*shard_tops, key=lambda elf: (-elf.calories, elf.elf))
+    return list(islice(merged, k))
+
+
+def find_top_elves_parallel(path: str, k: int, workers: Optional[int] = None) -> List[TotalElfCalories]:
+    workers = workers or os.cpu_count() or 1
+    shard_count = max(1, min(workers, os.path.getsize(path) // MIN_SHARD_SIZE))
+    shards = find_shards(path, shard_count)
+
+    if len(shards) <= 1:
+        results = [top_elves_of_shard(path, start, end, k) for start, end in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as executor:
+            futures = [executor.submit(top_elves_of_shard, path, start, end, k) for start, end in shards]
+            results = [future.result() for future in futures]
+
+    return merge_top_elves(results, k)
+
+
+def part1(path: str) -> int:
+    return sum(elf.calories for elf in find_top_elves_parallel(path, 1))
+
+
+def part2(path: str) -> int:
+    return sum(elf.calories for elf in find_top_elves_parallel(path, 3))
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    print(part1(path))
+    print(part2(path))
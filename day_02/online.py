@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Tuple
+
+from common.online import Accumulator
+from day_02 import solution, solution_part2
+from day_02.solution import decode_row, get_outcome_score, get_shape_score, outcome_scores, shape_scores, \
+    win_pairs_map
+from day_02.solution_part2 import find_player_shape
+
+
+def _score_part1(row: str) -> int:
+    opponent_shape, player_shape = decode_row(row, solution.opponent_encoding, solution.player_encoding)
+    return get_outcome_score(opponent_shape, player_shape, outcome_scores, win_pairs_map) + \
+        get_shape_score(player_shape, shape_scores)
+
+
+def _score_part2(row: str) -> int:
+    opponent_shape, desired_outcome = decode_row(row, solution_part2.opponent_encoding,
+                                                 solution_part2.player_encoding)
+    player_shape = find_player_shape(opponent_shape, desired_outcome, win_pairs_map)
+    return get_outcome_score(opponent_shape, player_shape, outcome_scores, win_pairs_map) + \
+        get_shape_score(player_shape, shape_scores)
+
+
+# Scores of both parts for every possible round, e.g. 'A Y' -> (8, 4)
+round_scores: Dict[str, Tuple[int, int]] = {
+    f'{opponent} {player}': (_score_part1(f'{opponent} {player}'), _score_part2(f'{opponent} {player}'))
+    for opponent in solution.opponent_encoding for player in solution.player_encoding
+}
+
+
+@dataclass
+class StrategyScoreAccumulator(Accumulator):
+    rounds: int = 0
+    score_part1: int = 0
+    score_part2: int = 0
+
+    def feed(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            line = line.rstrip('\r\n')
+            try:
+                score_part1, score_part2 = round_scores[line]
+            except KeyError:
+                # Not a canonical row (e.g. more whitespace), decode it as the solutions do
+                score_part1, score_part2 = _score_part1(line), _score_part2(line)
+
+            self.rounds += 1
+            self.score_part1 += score_part1
+            self.score_part2 += score_part2
+
+    def merge(self, other: StrategyScoreAccumulator) -> None:
+        if not isinstance(other, StrategyScoreAccumulator):
+            raise TypeError(f'Cannot merge {type(other).__name__}')
+
+        self.rounds += other.rounds
+        self.score_part1 += other.score_part1
+        self.score_part2 += other.score_part2
+
+    def result(self) -> Tuple[int, int]:
+        return self.score_part1, self.score_part2
@@ -66,9 +66,7 @@ def get_outcome_score(opponent_shape: Shape, your_shape: Shape, outcome_map: Dic
     return outcome_map[Outcome.LOSS]
 
 
-if __name__ == '__main__':
-    path = './input.txt'
-
+def part1(path: str) -> int:
     total_score = 0
     for encoded_row in yield_rows(path):
         opponent_shape, player_shape = decode_row(encoded_row, opponent_encoding, player_encoding)
@@ -78,4 +76,10 @@ if __name__ == '__main__':
                                         win_pairs_map) + get_shape_score(player_shape, shape_scores)
         total_score += round_score
 
-    print(total_score)
+    return total_score
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    print(part1(path))
@@ -0,0 +1,113 @@
+from itertools import permutations
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from common.reader import BLOCK_SIZE, map_file, yield_blocks
+from day_02 import solution, solution_part2
+from day_02.solution import Outcome, Shape, get_outcome_score, get_shape_score, outcome_scores, shape_scores, \
+    win_pairs_map
+from day_02.solution_part2 import find_player_shape
+
+# Order of rows and columns of the tables
+OPPONENT_CODES = 'ABC'
+PLAYER_CODES = 'XYZ'
+
+
+def score_table_part1(player_encoding: Dict[str, Shape] = solution.player_encoding) -> np.ndarray:
+    """table[opponent, player] - score of a round, rows in order of OPPONENT_CODES, columns of PLAYER_CODES."""
+    table = np.zeros((3, 3), dtype=np.int64)
+    for i, opponent_code in enumerate(OPPONENT_CODES):
+        opponent_shape = solution.opponent_encoding[opponent_code]
+        for j, player_code in enumerate(PLAYER_CODES):
+            player_shape = player_encoding[player_code]
+            table[i, j] = get_outcome_score(opponent_shape, player_shape, outcome_scores, win_pairs_map) + \
+                get_shape_score(player_shape, shape_scores)
+    return table
+
+
+def score_table_part2(player_encoding: Dict[str, Outcome] = solution_part2.player_encoding) -> np.ndarray:
+    """Like score_table_part1, but the player codes are the desired outcomes."""
+    table = np.zeros((3, 3), dtype=np.int64)
+    for i, opponent_code in enumerate(OPPONENT_CODES):
+        opponent_shape = solution_part2.opponent_encoding[opponent_code]
+        for j, player_code in enumerate(PLAYER_CODES):
+            player_shape = find_player_shape(opponent_shape, player_encoding[player_code], win_pairs_map)
+            table[i, j] = get_outcome_score(opponent_shape, player_shape, outcome_scores, win_pairs_map) + \
+                get_shape_score(player_shape, shape_scores)
+    return table
+
+
+# Every canonical round 'A X\n' as a little-endian uint32, in order of the counts
+_ROUND_WORDS = np.frombuffer(''.join(f'{opponent} {player}\n' for opponent in OPPONENT_CODES
+                                     for player in PLAYER_CODES).encode(), dtype='<u4')
+
+
+def count_rounds_of_text(data: Union[bytes, memoryview]) -> np.ndarray:
+    """counts[opponent, player] - number of rounds of every kind in the text."""
+    if len(data) % 4 == 0:
+        # Rounds are usually 'A X\n' - each one is a single 4-byte word, and there are only 9 possible words
+        words = np.frombuffer(data, dtype='<u4')
+        counts = np.array([np.count_nonzero(words == word) for word in _ROUND_WORDS], dtype=np.int64)
+        if counts.sum() == len(words):
+            return counts.reshape(3, 3)
+
+    text = np.frombuffer(data, dtype=np.uint8)
+    opponents = text[(text >= ord('A')) & (text <= ord('C'))] - ord('A')
+    players = text[(text >= ord('X')) & (text <= ord('Z'))] - ord('X')
+    if len(opponents) != len(players):
+        raise ValueError('Every round should have one opponent code and one player code')
+
+    return np.bincount(opponents * 3 + players, minlength=9).reshape(3, 3)
+
+
+def count_rounds(path: str, block_size: int = BLOCK_SIZE) -> np.ndarray:
+    data = map_file(path)
+    try:
+        counts = np.zeros((3, 3), dtype=np.int64)
+        for start, end in yield_blocks(data, block_size):
+            counts += count_rounds_of_text(data[start:end])
+    finally:
+        if not isinstance(data, bytes):
+            data.close()
+    return counts
+
+
+def total_scores(path: str) -> Tuple[int, int]:
+    """Scores of (part 1, part 2), the file is read once."""
+    counts = count_rounds(path)
+    return int((counts * score_table_part1()).sum()), int((counts * score_table_part2()).sum())
+
+
+def score_encodings_part1(counts: np.ndarray) -> List[Tuple[Dict[str, Shape], int]]:
+    """Part 1 score of the rounds counted by count_rounds for every possible player encoding of shapes."""
+    encodings = [dict(zip(PLAYER_CODES, shapes)) for shapes in permutations(Shape)]
+    return [(encoding, int((counts * score_table_part1(encoding)).sum())) for encoding in encodings]
+
+
+def score_encodings_part2(counts: np.ndarray) -> List[Tuple[Dict[str, Outcome], int]]:
+    """Like score_encodings_part1, but for every possible player encoding of outcomes."""
+    encodings = [dict(zip(PLAYER_CODES, outcomes)) for outcomes in permutations(Outcome)]
+    return [(encoding, int((counts * score_table_part2(encoding)).sum())) for encoding in encodings]
+
+
+def part1(path: str) -> int:
+    return total_scores(path)[0]
+
+
+def part2(path: str) -> int:
+    return total_scores(path)[1]
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    counts = count_rounds(path)
+    print(int((counts * score_table_part1()).sum()))
+    print(int((counts * score_table_part2()).sum()))
+
+    # Scores of the other ways to read the strategy guide
+    for encoding, score in score_encodings_part1(counts):
+        print(' '.join(f'{code}={shape.name}' for code, shape in encoding.items()), score)
+    for encoding, score in score_encodings_part2(counts):
+        print(' '.join(f'{code}={outcome.name}' for code, outcome in encoding.items()), score)
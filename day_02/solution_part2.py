@@ -24,9 +24,7 @@ def find_player_shape(opponent_shape: Shape, outcome: Outcome, win_pairs_map: Li
     return next(pair[0] for pair in win_pairs_map if pair[1] == opponent_shape)
 
 
-if __name__ == '__main__':
-    path = './input.txt'
-
+def part2(path: str) -> int:
     total_score = 0
     for encoded_row in yield_rows(path):
         opponent_shape, desired_outcome = decode_row(encoded_row, opponent_encoding, player_encoding)
@@ -37,4 +35,10 @@ if __name__ == '__main__':
                                         win_pairs_map) + get_shape_score(player_shape, shape_scores)
         total_score += round_score
 
-    print(total_score)
+    return total_score
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    print(part2(path))
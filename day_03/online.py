@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple
+
+from common.online import Accumulator
+from day_03.solution import split_list, get_priority, char_priority_map
+
+GROUP_SIZE = 3
+
+
+def _single_item(items: set) -> str:
+    if len(items) != 1:
+        raise ValueError(f'Expected one common item, found {len(items)}')
+    return next(iter(items))
+
+
+def _badge_priority(group: List[str]) -> Optional[int]:
+    """None if the rucksacks do not have exactly one common item."""
+    common_items = set(group[0]).intersection(*group[1:])
+    return get_priority(next(iter(common_items)), char_priority_map) if len(common_items) == 1 else None
+
+
+def _add(priorities: Optional[int], other_priorities: Optional[int]) -> Optional[int]:
+    if priorities is None or other_priorities is None:
+        return None
+    return priorities + other_priorities
+
+
+@dataclass
+class RucksackPriorityAccumulator(Accumulator):
+    """
+    A shard does not know where groups start, so priorities of badges are summed for every alignment -
+    priorities_part2[i] assumes groups start at the i-th, (i + GROUP_SIZE)-th, ... rucksack of the shard (None - one
+    of the groups has no single badge). The first and the last GROUP_SIZE - 1 rucksacks (leading, trailing) complete
+    groups shared with the previous and the next shard.
+    """
+    rucksacks: int = 0
+    priorities_part1: int = 0
+    priorities_part2: List[Optional[int]] = field(default_factory=lambda: [0] * GROUP_SIZE)
+    leading: List[str] = field(default_factory=list)
+    trailing: List[str] = field(default_factory=list)
+
+    def feed(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            rucksack_content = line.rstrip('\r\n')
+
+            first_compartment, second_compartment = split_list(rucksack_content)
+            item_from_both = _single_item(set(first_compartment).intersection(second_compartment))
+            self.priorities_part1 += get_priority(item_from_both, char_priority_map)
+
+            if len(self.trailing) == GROUP_SIZE - 1:
+                # The rucksack completes the group which starts GROUP_SIZE - 1 rucksacks earlier
+                alignment = (self.rucksacks - GROUP_SIZE + 1) % GROUP_SIZE
+                self.priorities_part2[alignment] = _add(self.priorities_part2[alignment],
+                                                        _badge_priority(self.trailing + [rucksack_content]))
+
+            self.rucksacks += 1
+            if len(self.leading) < GROUP_SIZE - 1:
+                self.leading.append(rucksack_content)
+            self.trailing = (self.trailing + [rucksack_content])[-(GROUP_SIZE - 1):]
+
+    def merge(self, other: RucksackPriorityAccumulator) -> None:
+        if not isinstance(other, RucksackPriorityAccumulator):
+            raise TypeError(f'Cannot merge {type(other).__name__}')
+
+        priorities_part2 = []
+        for alignment in range(GROUP_SIZE):
+            # Groups of the other shard start at other_alignment, other.rucksacks later
+            other_alignment = (alignment - self.rucksacks) % GROUP_SIZE
+            priorities = _add(self.priorities_part2[alignment], other.priorities_part2[other_alignment])
+
+            # Group which starts in this shard and ends in the other one
+            in_this = (self.rucksacks - alignment) % GROUP_SIZE
+            in_other = GROUP_SIZE - in_this
+            if in_this and alignment < self.rucksacks and in_other <= other.rucksacks:
+                group = self.trailing[len(self.trailing) - in_this:] + other.leading[:in_other]
+                priorities = _add(priorities, _badge_priority(group))
+
+            priorities_part2.append(priorities)
+
+        self.rucksacks += other.rucksacks
+        self.priorities_part1 += other.priorities_part1
+        self.priorities_part2 = priorities_part2
+        self.leading = (self.leading + other.leading)[:GROUP_SIZE - 1]
+        self.trailing = (self.trailing + other.trailing)[-(GROUP_SIZE - 1):]
+
+    def result(self) -> Tuple[int, int]:
+        """Part 2 answer covers complete groups only."""
+        if self.priorities_part2[0] is None:
+            raise ValueError('Expected one common item in every group')
+        return self.priorities_part1, self.priorities_part2[0]
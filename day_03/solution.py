@@ -1,7 +1,7 @@
 from collections import namedtuple
 from typing import List, Tuple, Union
 
-from day_02.solution import yield_rows
+from common.reader import yield_rows
 
 
 def split_list(lst: Union[List, str]) -> Tuple[List, List]:
@@ -27,9 +27,7 @@ def get_priority(char: str, priority_map: List[CharPriorityEntry]) -> int:
     raise ValueError
 
 
-if __name__ == '__main__':
-    path = './input.txt'
-
+def part1(path: str) -> int:
     sum_of_priorities = 0
     for rucksack_content in yield_rows(path):
         first_compartment, second_compartment = split_list(rucksack_content)
@@ -40,4 +38,10 @@ if __name__ == '__main__':
         item_from_both = next(x for x in items_from_both)
         sum_of_priorities += get_priority(item_from_both, char_priority_map)
 
-    print(sum_of_priorities)
+    return sum_of_priorities
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    print(part1(path))
@@ -0,0 +1,105 @@
+import string
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from common.reader import BLOCK_SIZE, map_file, yield_blocks
+from day_03.solution import get_priority, char_priority_map
+
+# Item of priority i is bit i of a mask, bytes which are not items have no bits
+item_bits = np.zeros(256, dtype=np.uint64)
+for _char in string.ascii_letters:
+    item_bits[ord(_char)] = 1 << get_priority(_char, char_priority_map)
+
+
+def rucksack_masks_of_text(data: Union[bytes, memoryview]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (masks of items in both compartments, masks of all items) of every rucksack of the text."""
+    text = np.frombuffer(data, dtype=np.uint8)
+
+    newlines = np.flatnonzero(text == ord('\n'))
+    line_starts = np.concatenate(([0], newlines + 1))
+    line_ends = np.concatenate((newlines, [len(text)]))
+    if len(text) and text[-1] == ord('\n'):
+        line_starts, line_ends = line_starts[:-1], line_ends[:-1]
+    # '\r\n' line endings
+    has_cr = line_ends > line_starts
+    has_cr[has_cr] = text[line_ends[has_cr] - 1] == ord('\r')
+    line_ends = line_ends - has_cr
+
+    lengths = line_ends - line_starts
+    if (lengths < 2).any():
+        raise ValueError('Every rucksack should have at least one item in each compartment')
+
+    bits = item_bits[text]
+    if np.count_nonzero(bits) != lengths.sum():
+        raise ValueError('Rucksacks should contain letters only')
+
+    # If a rucksack has odd number of items, the first compartment is smaller (like split_list)
+    compartment_starts = np.empty(2 * len(line_starts), dtype=np.int64)
+    compartment_starts[0::2] = line_starts
+    compartment_starts[1::2] = line_starts + lengths // 2
+    # Bytes between rucksacks (newlines) have no bits, so they do not change the masks
+    compartments = np.bitwise_or.reduceat(bits, compartment_starts) if len(bits) else bits
+
+    first, second = compartments[0::2], compartments[1::2]
+    return first & second, first | second
+
+
+def priorities(masks: np.ndarray) -> np.ndarray:
+    """
+    Priority of the single item of every mask. ValueError is raised if a mask has no items or more than one - no item
+    is picked. The set-based solutions reject such rucksacks too, but with a bare Exception.
+    """
+    if not ((masks != 0) & (masks & (masks - np.uint64(1)) == 0)).all():
+        raise ValueError('Expected exactly one common item')
+    # Masks are powers of two below 2 ** 53, so they are exact as floats
+    return np.frexp(masks.astype(np.float64))[1] - 1
+
+
+def sum_of_priorities(path: str, group_size: Optional[int] = 3,
+                      block_size: int = BLOCK_SIZE) -> Tuple[int, Optional[int]]:
+    """
+    Return (sum of priorities of items in both compartments, sum of priorities of badges of groups).
+    The file is read once, in blocks. Groups are skipped if group_size is None.
+    """
+    data = map_file(path)
+    try:
+        priorities_part1 = priorities_part2 = 0
+        # Rucksacks of the group which is split between blocks
+        group = np.zeros(0, dtype=np.uint64)
+        for start, end in yield_blocks(data, block_size):
+            common, rucksacks = rucksack_masks_of_text(data[start:end])
+            priorities_part1 += int(priorities(common).sum())
+            if group_size is None:
+                continue
+
+            rucksacks = np.concatenate((group, rucksacks))
+            complete = len(rucksacks) - len(rucksacks) % group_size
+            if complete:
+                badges = np.bitwise_and.reduceat(rucksacks[:complete], np.arange(0, complete, group_size))
+                priorities_part2 += int(priorities(badges).sum())
+            group = rucksacks[complete:]
+    finally:
+        if not isinstance(data, bytes):
+            data.close()
+
+    if group_size is None:
+        return priorities_part1, None
+    if len(group):
+        raise ValueError(f'The last group has {len(group)} rucksacks instead of {group_size}')
+    return priorities_part1, priorities_part2
+
+
+def part1(path: str) -> int:
+    return sum_of_priorities(path, group_size=None)[0]
+
+
+def part2(path: str) -> int:
+    return sum_of_priorities(path)[1]
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    print(part1(path))
+    print(part2(path))
@@ -1,6 +1,6 @@
 from typing import List, Generator
 
-from day_02.solution import yield_rows
+from common.reader import yield_rows
 from day_03.solution import get_priority, char_priority_map
 
 
@@ -18,9 +18,7 @@ def yield_chunks(path: str, chunk_size: int) -> Generator[List[str], None, None]
         yield chunk
 
 
-if __name__ == '__main__':
-    path = './input.txt'
-
+def part2(path: str) -> int:
     sum_of_priorities = 0
     for group_rucksack_content in yield_chunks(path, 3):
         if len(group_rucksack_content) != 3:
@@ -34,4 +32,10 @@ if __name__ == '__main__':
         common_item = next(x for x in common_items)
         sum_of_priorities += get_priority(common_item, char_priority_map)
 
-    print(sum_of_priorities)
+    return sum_of_priorities
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    print(part2(path))
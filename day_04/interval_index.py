@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import Iterable, List
+
+import numpy as np
+
+from day_04.solution import Assignment, yield_assignment_pairs
+
+
+class AssignmentIndex:
+    """
+    Static index of assignments (closed ranges of sections) for queries across the whole roster.
+
+    Assignments are sorted by start. A sparse table of the positions of the maximal end over every range of
+    2 ** j assignments answers 'which assignment in positions [l, r] ends last' in O(1), so the assignments with
+    start <= a and end >= b are listed in O(log n + k).
+    """
+
+    def __init__(self, assignments: Iterable[Assignment]) -> None:
+        assignments = list(assignments)
+        if any(assignment.start > assignment.end for assignment in assignments):
+            raise ValueError('Assignment should start before it ends')
+
+        starts = np.array([assignment.start for assignment in assignments], dtype=np.int64)
+        ends = np.array([assignment.end for assignment in assignments], dtype=np.int64)
+        order = np.argsort(starts, kind='stable')
+
+        self.assignments = [assignments[i] for i in order.tolist()]
+        self.starts = starts[order]
+        self.ends = ends[order]
+        self.sorted_ends = np.sort(ends)
+
+        # max_end_positions[j][i] - position of the assignment which ends last among positions [i, i + 2 ** j)
+        self.max_end_positions = [np.arange(len(self.assignments))]
+        width = 1
+        while 2 * width <= len(self.assignments):
+            previous = self.max_end_positions[-1]
+            left, right = previous[:-width], previous[width:]
+            self.max_end_positions.append(np.where(self.ends[left] >= self.ends[right], left, right))
+            width *= 2
+
+    @classmethod
+    def from_file(cls, path: str) -> AssignmentIndex:
+        """Both assignments of every pair are indexed."""
+        return cls(assignment for pair in yield_assignment_pairs(path) for assignment in pair)
+
+    def __len__(self) -> int:
+        return len(self.assignments)
+
+    def _max_end_position(self, first: int, last: int) -> int:
+        level = (last - first + 1).bit_length() - 1
+        left = self.max_end_positions[level][first]
+        right = self.max_end_positions[level][last - (1 << level) + 1]
+        return int(left if self.ends[left] >= self.ends[right] else right)
+
+    def _find(self, max_start: int, min_end: int) -> List[Assignment]:
+        """Assignments with start <= max_start and end >= min_end, in order of start."""
+        found = []
+        # Ranges of positions to search, assignments in them start early enough
+        ranges = [(0, int(np.searchsorted(self.starts, max_start, side='right')) - 1)]
+        while ranges:
+            first, last = ranges.pop()
+            if first > last:
+                continue
+            position = self._max_end_position(first, last)
+            if self.ends[position] < min_end:
+                # No assignment in the range ends late enough
+                continue
+            found.append(position)
+            ranges.append((first, position - 1))
+            ranges.append((position + 1, last))
+
+        return [self.assignments[position] for position in sorted(found)]
+
+    def overlapping(self, assignment: Assignment) -> List[Assignment]:
+        """Indexed assignments which overlap the given one (Assignment.overlap)."""
+        return self._find(assignment.end, assignment.start)
+
+    def containing(self, assignment: Assignment) -> List[Assignment]:
+        """Indexed assignments which contain the given one (assignment in indexed)."""
+        return self._find(assignment.start, assignment.end)
+
+    def count_overlapping(self, assignment: Assignment) -> int:
+        """Like len(overlapping(...)), in O(log n)."""
+        # All except those which start after the assignment and those which end before it
+        starting_before_end = np.searchsorted(self.starts, assignment.end, side='right')
+        ending_before_start = np.searchsorted(self.sorted_ends, assignment.start, side='left')
+        return int(starting_before_end - ending_before_start)
+
+    def count_containing(self, assignment: Assignment) -> int:
+        return len(self.containing(assignment))
+
+    def count_overlapping_pairs(self) -> int:
+        """Number of pairs of indexed assignments which overlap, in O(n log n)."""
+        n = len(self.assignments)
+        # Assignments of a disjoint pair are counted once - by the one which starts after the other ends
+        disjoint = int(np.searchsorted(self.sorted_ends, self.starts, side='left').sum())
+        return n * (n - 1) // 2 - disjoint
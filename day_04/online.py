@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Tuple
+
+from common.online import Accumulator
+from day_04.solution import decode_row
+
+
+@dataclass
+class AssignmentPairsAccumulator(Accumulator):
+    pairs: int = 0
+    covered: int = 0
+    overlapped: int = 0
+
+    def feed(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            assignment1, assignment2 = decode_row(line.rstrip('\r\n'))
+
+            self.pairs += 1
+            if assignment1 in assignment2 or assignment2 in assignment1:
+                self.covered += 1
+            if assignment1.overlap(assignment2):
+                self.overlapped += 1
+
+    def merge(self, other: AssignmentPairsAccumulator) -> None:
+        if not isinstance(other, AssignmentPairsAccumulator):
+            raise TypeError(f'Cannot merge {type(other).__name__}')
+
+        self.pairs += other.pairs
+        self.covered += other.covered
+        self.overlapped += other.overlapped
+
+    def result(self) -> Tuple[int, int]:
+        return self.covered, self.overlapped
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Generator, Tuple
 
-from day_02.solution import yield_rows
+from common.integers import read_integer_rows
 
 
 class Assignment:
+    __slots__ = ('start', 'end')
+
     def __init__(self, start: int, end: int) -> None:
         self.start = start
         self.end = end
@@ -40,17 +42,30 @@ def decode_row(line: str) -> Tuple[Assignment, Assignment]:
     return Assignment.from_range(a1), Assignment.from_range(a2)
 
 
-if __name__ == '__main__':
-    path = './input.txt'
+def yield_assignment_pairs(path: str) -> Generator[Tuple[Assignment, Assignment], None, None]:
+    # 'start1-end1,start2-end2' lines, '-' is a separator, so the integers are never negative
+    for start1, end1, start2, end2 in read_integer_rows(path, 4, signed=False).tolist():
+        yield Assignment(start1, end1), Assignment(start2, end2)
 
+
+def part1(path: str) -> int:
     assignments_covered = 0
-    assignments_overlapped = 0
-    for line in yield_rows(path):
-        assignment1, assignment2 = decode_row(line)
+    for assignment1, assignment2 in yield_assignment_pairs(path):
         if assignment1 in assignment2 or assignment2 in assignment1:
             assignments_covered += 1
+    return assignments_covered
+
+
+def part2(path: str) -> int:
+    assignments_overlapped = 0
+    for assignment1, assignment2 in yield_assignment_pairs(path):
         if assignment1.overlap(assignment2):
             assignments_overlapped += 1
+    return assignments_overlapped
+
+
+if __name__ == '__main__':
+    path = './input.txt'
 
-    print(assignments_covered)
-    print(assignments_overlapped)
+    print(part1(path))
+    print(part2(path))
@@ -0,0 +1,41 @@
+from collections import namedtuple
+
+import numpy as np
+
+from common.integers import read_integer_rows
+
+# Columns of all assignment pairs, every field is an int array with one value per line
+AssignmentColumns = namedtuple('AssignmentColumns', 'start1 end1 start2 end2')
+
+
+def load_assignment_columns(path: str) -> AssignmentColumns:
+    rows = read_integer_rows(path, 4, signed=False)
+    return AssignmentColumns(*(np.ascontiguousarray(column) for column in rows.T))
+
+
+def covered(columns: AssignmentColumns) -> np.ndarray:
+    """For every pair - one assignment contains the other (Assignment.__contains__ either way)."""
+    start1, end1, start2, end2 = columns
+    return (start1 <= start2) & (end2 <= end1) | (start2 <= start1) & (end1 <= end2)
+
+
+def overlapping(columns: AssignmentColumns) -> np.ndarray:
+    """For every pair - the assignments overlap (Assignment.overlap)."""
+    start1, end1, start2, end2 = columns
+    return ~((start2 < start1) & (end2 < start1) | (start2 > end1) & (end2 > end1))
+
+
+def part1(path: str) -> int:
+    return int(np.count_nonzero(covered(load_assignment_columns(path))))
+
+
+def part2(path: str) -> int:
+    return int(np.count_nonzero(overlapping(load_assignment_columns(path))))
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    columns = load_assignment_columns(path)
+    print(int(np.count_nonzero(covered(columns))))
+    print(int(np.count_nonzero(overlapping(columns))))
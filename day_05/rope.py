@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import random
+from typing import Any, Generator, Iterable, List, Optional, Tuple
+
+from day_05.solution import Stack, StackSegment
+
+
+class _Node:
+    __slots__ = ('value', 'priority', 'size', 'left', 'right', 'reversed')
+
+    def __init__(self, value: Any, priority: float) -> None:
+        self.value = value
+        self.priority = priority
+        self.size = 1
+        self.left: Optional[_Node] = None
+        self.right: Optional[_Node] = None
+        # Children are in reversed order - applied lazily, when the node is visited
+        self.reversed = False
+
+
+def _size(node: Optional[_Node]) -> int:
+    return node.size if node is not None else 0
+
+
+def _push_down(node: _Node) -> None:
+    if node.reversed:
+        node.left, node.right = node.right, node.left
+        for child in (node.left, node.right):
+            if child is not None:
+                child.reversed = not child.reversed
+        node.reversed = False
+
+
+def _update(node: _Node) -> None:
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    if left is None:
+        return right
+    if right is None:
+        return left
+
+    if left.priority > right.priority:
+        _push_down(left)
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+
+    _push_down(right)
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+
+def _split(node: Optional[_Node], count: int) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """Split into the first count elements and the rest."""
+    if node is None:
+        return None, None
+
+    _push_down(node)
+    if _size(node.left) < count:
+        node.right, rest = _split(node.right, count - _size(node.left) - 1)
+        _update(node)
+        return node, rest
+
+    first, node.left = _split(node.left, count)
+    _update(node)
+    return first, node
+
+
+def _build(values: List) -> Optional[_Node]:
+    """Treap of the values in O(n) - nodes are added on the right spine, which is kept in heap order."""
+    spine: List[_Node] = []
+    for value in values:
+        node = _Node(value, random.random())
+        last = None
+        while spine and spine[-1].priority < node.priority:
+            last = spine.pop()
+            _update(last)
+        node.left = last
+        if spine:
+            spine[-1].right = node
+        spine.append(node)
+
+    while len(spine) > 1:
+        _update(spine.pop())
+    if not spine:
+        return None
+    _update(spine[0])
+    return spine[0]
+
+
+class Rope:
+    """
+    Sequence kept in an implicit treap (a treap ordered by position). Splitting and concatenation take O(log n),
+    reversal is O(1) - it is applied lazily. Ropes are the stack segments (StackSegment) of RopeStack.
+    """
+
+    def __init__(self, values: Iterable = (), root: Optional[_Node] = None) -> None:
+        self.root = root if root is not None else _build(list(values))
+
+    def __len__(self) -> int:
+        return _size(self.root)
+
+    def __iter__(self) -> Generator[Any, None, None]:
+        # In-order traversal, reversal flags are pushed down on the way
+        path = []
+        node = self.root
+        while path or node is not None:
+            if node is not None:
+                _push_down(node)
+                path.append(node)
+                node = node.left
+            else:
+                node = path.pop()
+                yield node.value
+                node = node.right
+
+    def reverse(self) -> None:
+        if self.root is not None:
+            self.root.reversed = not self.root.reversed
+
+    def split(self, count: int) -> Tuple[Rope, Rope]:
+        """Return the first count elements and the rest. This rope becomes empty."""
+        first, rest = _split(self.root, count)
+        self.root = None
+        return Rope(root=first), Rope(root=rest)
+
+    def extend(self, other: Rope) -> None:
+        """Append elements of the other rope, which becomes empty."""
+        self.root = _merge(self.root, other.root)
+        other.root = None
+
+    def last(self) -> Any:
+        if self.root is None:
+            raise IndexError('Rope is empty')
+        # Flags of the nodes above are not pushed down - the parity of the reversals tells which child is last
+        node = self.root
+        reversed_ = False
+        while True:
+            reversed_ ^= node.reversed
+            child = node.left if reversed_ else node.right
+            if child is None:
+                return node.value
+            node = child
+
+
+class RopeStack(Stack):
+    """Stack kept in a rope (top at the end), so moving a group of any size takes O(log n)."""
+
+    def __init__(self) -> None:
+        self.rope = Rope()
+
+    def push(self, value: Any) -> None:
+        self.rope.extend(Rope([value]))
+
+    def pop(self) -> Any:
+        return self.take_top(1).last()
+
+    def get(self) -> Any:
+        if not len(self.rope):
+            raise IndexError('Stack is empty')
+        return self.rope.last()
+
+    def get_all(self, top_first: bool = True) -> List:
+        elements = list(self.rope)
+        return elements[::-1] if top_first else elements
+
+    def take_top(self, count: int) -> Rope:
+        """The segment is a rope - it is reversed in O(1) and put on another RopeStack in O(log n)."""
+        if count > len(self.rope):
+            raise IndexError('Stack is empty')
+        self.rope, top = self.rope.split(len(self.rope) - max(count, 0))
+        return top
+
+    def put_on_top(self, elements: StackSegment) -> None:
+        self.rope.extend(elements if isinstance(elements, Rope) else Rope(elements))
+
+    def __len__(self) -> int:
+        return len(self.rope)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Any, Optional, List, Dict
+from typing import Any, Iterable, Iterator, Optional, List, Dict, Protocol, Tuple, Type, Union
 
-from day_02.solution import yield_rows
+import numpy as np
+
+from common.integers import extract_integers
 
 
 class StackElement:
@@ -12,6 +15,22 @@ class StackElement:
         self.next_elem = next_elem
 
 
+class StackSegment(Protocol):
+    """
+    Elements taken off a stack with take_top, in stack order - the top one is the last. A segment can be reversed
+    and put on a stack of the same class. Lists are segments of Stack and ArrayStack.
+    """
+
+    def __len__(self) -> int:
+        ...
+
+    def __iter__(self) -> Iterator[Any]:
+        ...
+
+    def reverse(self) -> None:
+        ...
+
+
 class Stack:
     def __init__(self) -> None:
         self.head: Optional[StackElement] = None
@@ -45,10 +64,59 @@ class Stack:
             return elements
         return list(reversed(elements))
 
+    def take_top(self, count: int) -> StackSegment:
+        """Remove count elements from the top. They are returned in stack order - the top one is the last."""
+        elements = [self.pop() for _ in range(count)]
+        elements.reverse()
+        return elements
+
+    def put_on_top(self, elements: StackSegment) -> None:
+        """Put elements on the top in the given order - the last one becomes the top."""
+        for element in elements:
+            self.push(element)
+
     def __len__(self) -> int:
         return self.size
 
 
+class ArrayStack(Stack):
+    """Stack kept in a list (top at the end), so a group of elements is moved with one slice."""
+
+    def __init__(self) -> None:
+        self.elements: List = []
+
+    def push(self, value: Any) -> None:
+        self.elements.append(value)
+
+    def pop(self) -> Any:
+        if not self.elements:
+            raise IndexError('Stack is empty')
+        return self.elements.pop()
+
+    def get(self) -> Any:
+        if not self.elements:
+            raise IndexError('Stack is empty')
+        return self.elements[-1]
+
+    def get_all(self, top_first: bool = True) -> List:
+        return self.elements[::-1] if top_first else list(self.elements)
+
+    def take_top(self, count: int) -> StackSegment:
+        if count > len(self.elements):
+            raise IndexError('Stack is empty')
+        if count <= 0:
+            return []
+        elements = self.elements[-count:]
+        del self.elements[-count:]
+        return elements
+
+    def put_on_top(self, elements: StackSegment) -> None:
+        self.elements.extend(elements)
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+
 class Instruction:
     def __init__(self, how_many: int, from_stack: int, to_stack: int) -> None:
         self.how_many = how_many  # move
@@ -64,6 +132,10 @@ class Instruction:
         instruction_words = instruction.split()
         return cls(int(instruction_words[1]), int(instruction_words[3]), int(instruction_words[5]))
 
+    @classmethod
+    def parse(cls, instruction: Union[Instruction, str]) -> Instruction:
+        return instruction if isinstance(instruction, Instruction) else cls.from_string(instruction)
+
 
 @dataclass
 class StackInfo:
@@ -76,12 +148,12 @@ class Cargo:
         self.stacks = stacks
 
     @classmethod
-    def from_drawing(cls, drawing: List[str]) -> Cargo:
+    def from_drawing(cls, drawing: List[str], stack_class: Type[Stack] = Stack) -> Cargo:
         # line with stack indexes
         stack_indexes_line: str = drawing[-1]
         stack_indexes = [StackInfo(int(value), position) for position, value in enumerate(stack_indexes_line) if
                          value.isdigit()]
-        stacks = {stack_index.id: Stack() for stack_index in stack_indexes}
+        stacks = {stack_index.id: stack_class() for stack_index in stack_indexes}
 
         # Reversed - decode the drawing from bottom to top, skip last line
         for cargo_line in reversed(drawing[:-1]):
@@ -92,27 +164,59 @@ class Cargo:
 
         return cls(stacks)
 
-    def _take_off_the_top(self, count: int, stack_id: int) -> Stack:
-        removed_crates = Stack()
-        for _ in range(count):
-            removed_crates.push(self.stacks[stack_id].pop())
-        return removed_crates
-
-    def _put_on_top(self, crates: Stack, stack_id: int) -> None:
-        for _ in range(len(crates)):
-            self.stacks[stack_id].push(crates.pop())
-
-    def move_crates_in_batch(self, instruction: str) -> None:
-        instruction = Instruction.from_string(instruction)
-
-        crates = self._take_off_the_top(instruction.how_many, instruction.from_stack)
-        self._put_on_top(crates, instruction.to_stack)
-
-    def move_crates(self, instruction: str) -> None:
-        instruction = Instruction.from_string(instruction)
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[int, List], stack_class: Type[Stack] = Stack) -> Cargo:
+        stacks = {}
+        for stack_id, crates in snapshot.items():
+            stacks[stack_id] = stack_class()
+            stacks[stack_id].put_on_top(crates)
+        return cls(stacks)
 
-        for _ in range(instruction.how_many):
-            self.stacks[instruction.to_stack].push(self.stacks[instruction.from_stack].pop())
+    def snapshot(self) -> Dict[int, List]:
+        """Crates of every stack, bottom first."""
+        return {stack_id: stack.get_all(top_first=False) for stack_id, stack in self.stacks.items()}
+
+    def _move(self, how_many: int, from_stack: int, to_stack: int, in_batch: bool) -> None:
+        if how_many <= 0:
+            return
+
+        # Stacks are checked in the order of the crane loops, so errors are the same - CrateMover 9001 takes
+        # the crates off the source first, CrateMover 9000 moves them with stacks[to].push(stacks[from].pop())
+        if in_batch:
+            source = self.stacks[from_stack]
+            if how_many > len(source):
+                raise IndexError('Stack is empty')
+            target = self.stacks[to_stack]
+        else:
+            target = self.stacks[to_stack]
+            source = self.stacks[from_stack]
+
+        if source is target:
+            # Crates are put back where they were taken from - CrateMover 9000 needs only one crate for that
+            if not len(source):
+                raise IndexError('Stack is empty')
+            return
+
+        crates = source.take_top(how_many)
+        if not in_batch:
+            crates.reverse()
+        target.put_on_top(crates)
+
+    def move_crates_in_batch(self, instruction: Union[Instruction, str]) -> None:
+        """CrateMover 9001 - crates keep their order."""
+        instruction = Instruction.parse(instruction)
+        self._move(instruction.how_many, instruction.from_stack, instruction.to_stack, True)
+
+    def move_crates(self, instruction: Union[Instruction, str]) -> None:
+        """CrateMover 9000 - crates are moved one at a time, so their order is reversed."""
+        instruction = Instruction.parse(instruction)
+        self._move(instruction.how_many, instruction.from_stack, instruction.to_stack, False)
+
+    def run(self, program: np.ndarray, task_part: int) -> None:
+        """Execute a compiled program (see compile_instructions) with the crane of the given task part."""
+        in_batch = task_part != 1
+        for how_many, from_stack, to_stack in program.tolist():
+            self._move(how_many, from_stack, to_stack, in_batch)
 
     def get_top_elements(self) -> str:
         stacks_top_elements = [(stack_id, stack.get()) for stack_id, stack in self.stacks.items()]
@@ -152,33 +256,116 @@ class CargoPrinter:
             print(''.join(i))
 
 
+class CargoHistory:
+    """
+    States of the cargo during execution of a program. A snapshot is taken every checkpoint_interval instructions,
+    so any state is restored by replaying less than checkpoint_interval instructions.
+    """
+
+    def __init__(self, cargo: Cargo, program: np.ndarray, task_part: int, checkpoint_interval: int = 1000,
+                 stack_class: Type[Stack] = ArrayStack) -> None:
+        if checkpoint_interval < 1:
+            raise ValueError('Checkpoint interval has to be a positive integer')
+
+        self.program = program
+        self.task_part = task_part
+        self.checkpoint_interval = checkpoint_interval
+        self.stack_class = stack_class
+
+        # checkpoints[i] - state after i * checkpoint_interval instructions
+        self.checkpoints = [cargo.snapshot()]
+        replayed = Cargo.from_snapshot(self.checkpoints[0], stack_class)
+        for start in range(0, len(program), checkpoint_interval):
+            replayed.run(program[start:start + checkpoint_interval], task_part)
+            if start + checkpoint_interval <= len(program):
+                self.checkpoints.append(replayed.snapshot())
+
+    def __len__(self) -> int:
+        return len(self.program)
+
+    def cargo_after(self, count: int) -> Cargo:
+        """State after the first count instructions (0 - the drawing)."""
+        if not 0 <= count <= len(self.program):
+            raise IndexError(f'Program has {len(self.program)} instructions')
+
+        checkpoint = count // self.checkpoint_interval
+        cargo = Cargo.from_snapshot(self.checkpoints[checkpoint], self.stack_class)
+        cargo.run(self.program[checkpoint * self.checkpoint_interval:count], self.task_part)
+        return cargo
+
+
+def compile_instructions(instructions: Iterable[Union[Instruction, str]]) -> np.ndarray:
+    """(n, 3) array of how_many, from_stack, to_stack of every instruction."""
+    rows = [(instruction.how_many, instruction.from_stack, instruction.to_stack)
+            for instruction in map(Instruction.parse, instructions)]
+    return np.array(rows, dtype=np.int64).reshape(-1, 3)
+
+
+# move <how_many> from <from_stack> to <to_stack>
+_INSTRUCTION = rb'[ \t]*move[ \t]+\d+[ \t]+from[ \t]+\d+[ \t]+to[ \t]+\d+[ \t]*\r?'
+_INSTRUCTION_PATTERN = re.compile(_INSTRUCTION)
+# Instruction lines, then nothing but whitespace. Lines of the puzzle input are matched twice as fast by the pattern
+# without the optional whitespace.
+_INSTRUCTIONS_PATTERN = re.compile(rb'(?:%s\n)*(?:%s)?\s*' % (_INSTRUCTION, _INSTRUCTION))
+_PLAIN_INSTRUCTIONS_PATTERN = re.compile(rb'(?:move \d+ from \d+ to \d+\r?\n)*\s*')
+
+
+def load_program(path: str) -> Tuple[List[str], np.ndarray]:
+    """Return lines of the drawing and the compiled instructions."""
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    # Empty line between drawing lines and instruction lines
+    separator = re.search(b'\r?\n\r?\n', data)
+    if separator is None:
+        raise ValueError('Bad input file format. Empty line after the drawing was not found.')
+
+    drawing = data[:separator.start()].decode().splitlines()
+
+    instructions = data[separator.end():]
+    if not (_PLAIN_INSTRUCTIONS_PATTERN.fullmatch(instructions) or _INSTRUCTIONS_PATTERN.fullmatch(instructions)):
+        bad_lines = (line for line in instructions.splitlines() if not _INSTRUCTION_PATTERN.fullmatch(line))
+        bad_line = next(bad_lines, b'')
+        raise ValueError(f'Bad input file format. Incorrect instruction found: {bad_line.decode(errors="replace")!r}')
+
+    integers = extract_integers(instructions, signed=False)
+    return drawing, integers.reshape(-1, 3)
+
+
+def load_input(path: str) -> Tuple[List[str], List[Instruction]]:
+    """Return lines of the drawing and the instructions, which are parsed in bulk."""
+    drawing, program = load_program(path)
+    return drawing, [Instruction(*values) for values in program.tolist()]
+
+
+def rearrange_cargo(path: str, task_part: int, stack_class: Type[Stack] = Stack) -> Cargo:
+    drawing, instructions = load_input(path)
+
+    cargo = Cargo.from_drawing(drawing, stack_class)
+    # CargoPrinter.print(cargo)
+
+    # Move cargo according to the instructions
+    for instruction in instructions:
+        if task_part == 1:
+            cargo.move_crates(instruction)
+        else:
+            cargo.move_crates_in_batch(instruction)
+        # CargoPrinter.print(cargo)
+
+    return cargo
+
+
+def part1(path: str) -> str:
+    return rearrange_cargo(path, 1).get_top_elements()
+
+
+def part2(path: str) -> str:
+    return rearrange_cargo(path, 2).get_top_elements()
+
+
 if __name__ == '__main__':
     path = './input.txt'
 
     task_part = 1  # 1/2
 
-    initial_cargo_drawing = []
-    drawing_found = False
-    for line in yield_rows(path):
-        if line != '' and not drawing_found:
-            # Drawing line
-            initial_cargo_drawing.append(line)
-        elif line == '' and not drawing_found:
-            # Empty line between drawing lines and instruction lines
-            drawing_found = True
-            cargo = Cargo.from_drawing(initial_cargo_drawing)
-            # CargoPrinter.print(cargo)
-        else:
-            # Instruction line
-            # Move cargo according to the instruction
-            if not drawing_found:
-                raise Exception('Bad input file format. First instruction line found, but drawing was not found yet.')
-
-            if task_part == 1:
-                cargo.move_crates(line)
-            else:
-                cargo.move_crates_in_batch(line)
-            # print(line)
-            # CargoPrinter.print(cargo)
-
-    print(cargo.get_top_elements())
+    print(rearrange_cargo(path, task_part).get_top_elements())
@@ -0,0 +1,26 @@
+from typing import Type
+
+from day_05.solution import ArrayStack, Cargo, Stack, load_program
+
+
+def rearrange_cargo(path: str, task_part: int, stack_class: Type[Stack] = ArrayStack) -> Cargo:
+    drawing, program = load_program(path)
+
+    cargo = Cargo.from_drawing(drawing, stack_class)
+    cargo.run(program, task_part)
+    return cargo
+
+
+def part1(path: str) -> str:
+    return rearrange_cargo(path, 1).get_top_elements()
+
+
+def part2(path: str) -> str:
+    return rearrange_cargo(path, 2).get_top_elements()
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    print(part1(path))
+    print(part2(path))
@@ -0,0 +1,17 @@
+from day_05.rope import RopeStack
+from day_05.solution_array import rearrange_cargo
+
+
+def part1(path: str) -> str:
+    return rearrange_cargo(path, 1, RopeStack).get_top_elements()
+
+
+def part2(path: str) -> str:
+    return rearrange_cargo(path, 2, RopeStack).get_top_elements()
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    print(part1(path))
+    print(part2(path))
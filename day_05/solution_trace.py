@@ -0,0 +1,87 @@
+from typing import Dict, List
+
+import numpy as np
+
+from day_05.solution import Cargo, load_program
+
+
+def check_program(sizes: Dict[int, int], program: np.ndarray, task_part: int) -> Dict[int, int]:
+    """
+    Return sizes of stacks after the program. Errors are the same as those of Cargo - IndexError if a move takes
+    more crates than the stack has, KeyError for an unknown stack.
+    """
+    sizes = dict(sizes)
+    for how_many, from_stack, to_stack in program.tolist():
+        if how_many <= 0:
+            continue
+
+        # Same order of checks as in Cargo
+        if task_part == 1 and to_stack not in sizes:
+            raise KeyError(to_stack)
+        # A move within one stack puts the crates back - CrateMover 9000 needs only one crate for that
+        required = 1 if task_part == 1 and from_stack == to_stack else how_many
+        if required > sizes[from_stack]:
+            raise IndexError('Stack is empty')
+        if to_stack not in sizes:
+            raise KeyError(to_stack)
+
+        if from_stack != to_stack:
+            sizes[from_stack] -= how_many
+            sizes[to_stack] += how_many
+    return sizes
+
+
+def trace_top_crates(cargo: Cargo, program: np.ndarray, task_part: int) -> str:
+    """
+    Top crates after the program, like Cargo.run followed by Cargo.get_top_elements, without moving the crates.
+
+    The top of every stack is traced back through the instructions: a crate at depth d (0 - top) of a stack
+    was at depth d + how_many of the source stack, if it is the source, and a crate in the moved part of the target
+    stack came from the source stack. Moves within one stack change nothing. The cost is stacks * instructions,
+    whatever the number of moved crates.
+    """
+    snapshot = cargo.snapshot()
+    final_sizes = check_program({stack_id: len(crates) for stack_id, crates in snapshot.items()}, program, task_part)
+
+    stack_ids = sorted(snapshot)
+    for stack_id in stack_ids:
+        if not final_sizes[stack_id]:
+            raise IndexError('Stack is empty')
+
+    # [stack, depth] of the crate which ends up on the top of every stack
+    positions: List[List[int]] = [[stack_id, 0] for stack_id in stack_ids]
+    for how_many, from_stack, to_stack in reversed(program.tolist()):
+        if how_many <= 0 or from_stack == to_stack:
+            # Crates are put back where they were taken from
+            continue
+        for position in positions:
+            stack, depth = position
+            if stack == to_stack and depth < how_many:
+                # CrateMover 9000 moves crates one at a time - the moved part is reversed
+                position[0] = from_stack
+                position[1] = how_many - 1 - depth if task_part == 1 else depth
+                continue
+
+            if stack == to_stack:
+                position[1] = depth - how_many
+            elif stack == from_stack:
+                position[1] = depth + how_many
+
+    return ''.join(snapshot[stack][-1 - depth] for stack, depth in positions)
+
+
+def part1(path: str) -> str:
+    drawing, program = load_program(path)
+    return trace_top_crates(Cargo.from_drawing(drawing), program, 1)
+
+
+def part2(path: str) -> str:
+    drawing, program = load_program(path)
+    return trace_top_crates(Cargo.from_drawing(drawing), program, 2)
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    print(part1(path))
+    print(part2(path))
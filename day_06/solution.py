@@ -1,4 +1,4 @@
-from typing import Generator
+from typing import Generator, Optional
 
 
 def yield_chars(path: str) -> Generator[str, None, None]:
@@ -12,11 +12,7 @@ def yield_chars(path: str) -> Generator[str, None, None]:
                 yield character
 
 
-if __name__ == '__main__':
-    path = './input.txt'
-
-    distinct_chars_required = 14  # part1 - 4 / part2 - 14
-
+def find_marker(path: str, distinct_chars_required: int) -> Optional[int]:
     last_chars = []
     for index, character in enumerate(yield_chars(path)):
         if len(last_chars) < distinct_chars_required:
@@ -26,5 +22,21 @@ if __name__ == '__main__':
             last_chars.pop(0)
 
         if len(set(last_chars)) == distinct_chars_required:
-            print(index + 1)
-            break
+            return index + 1
+    return None
+
+
+def part1(path: str) -> Optional[int]:
+    return find_marker(path, 4)
+
+
+def part2(path: str) -> Optional[int]:
+    return find_marker(path, 14)
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    distinct_chars_required = 14  # part1 - 4 / part2 - 14
+
+    print(find_marker(path, distinct_chars_required))
@@ -0,0 +1,95 @@
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from common.reader import map_file
+
+# Markers are usually close to the start - blocks start small and grow up to the block size
+FIRST_BLOCK_SIZE = 1 << 12
+# Temporary arrays take about 40 bytes per character of a block
+BLOCK_SIZE = 1 << 20
+
+
+def new_last_seen() -> np.ndarray:
+    """Table of the last position of every byte value (-1 - not seen yet)."""
+    return np.full(256, -1, dtype=np.int64)
+
+
+def distinct_run_starts(block: bytes, offset: int, last_seen: np.ndarray, run_start: int = 0) -> np.ndarray:
+    """
+    Start of the longest run of distinct characters ending at every position of the block, as positions in the
+    stream (the block starts at offset). last_seen is updated, run_start is the start of the run ending before
+    the block.
+    """
+    chars = np.frombuffer(block, dtype=np.uint8)
+    if not len(chars):
+        return np.zeros(0, dtype=np.int64)
+
+    # Position of the previous occurrence of the character at every position. In the stable order by character
+    # (radix sort for bytes) occurrences of every character are grouped, in order of positions.
+    order = np.argsort(chars, kind='stable')
+    sorted_chars = chars[order]
+    previous_sorted = np.empty(len(chars), dtype=np.int64)
+    previous_sorted[1:] = order[:-1] + offset
+    is_first = np.ones(len(chars), dtype=bool)
+    is_first[1:] = sorted_chars[1:] != sorted_chars[:-1]
+    first_occurrences = np.flatnonzero(is_first)
+    previous_sorted[first_occurrences] = last_seen[sorted_chars[first_occurrences]]
+    last_occurrences = np.append(first_occurrences[1:], len(chars)) - 1
+    last_seen[sorted_chars[last_occurrences]] = order[last_occurrences] + offset
+
+    previous = np.empty(len(chars), dtype=np.int64)
+    previous[order] = previous_sorted
+
+    # A run cannot start at or before the previous occurrence of any of its characters
+    return np.maximum.accumulate(np.maximum(previous + 1, run_start))
+
+
+def find_markers(path: str, window_sizes: Iterable[int], block_size: int = BLOCK_SIZE) -> Dict[int, Optional[int]]:
+    """
+    Return window size -> number of characters processed before the first marker (window of distinct characters)
+    is found. All windows are searched for in one pass, which stops once every marker is found.
+    Characters are bytes - signals are ASCII.
+    """
+    pending = sorted(set(window_sizes))
+    markers: Dict[int, Optional[int]] = {window_size: None for window_size in pending}
+
+    data = map_file(path)
+    try:
+        last_seen = new_last_seen()
+        run_start = 0
+        offset = 0
+        size = min(FIRST_BLOCK_SIZE, block_size)
+        while offset < len(data):
+            run_starts = distinct_run_starts(data[offset:offset + size], offset, last_seen, run_start)
+            run_lengths = np.arange(offset + 1, offset + len(run_starts) + 1) - run_starts
+            # A marker of a window is never after a marker of a bigger window
+            while pending and (run_lengths >= pending[0]).any():
+                window_size = pending.pop(0)
+                markers[window_size] = offset + int(np.argmax(run_lengths >= window_size)) + 1
+            if not pending:
+                break
+            run_start = int(run_starts[-1])
+            offset += size
+            size = min(2 * size, block_size)
+    finally:
+        if not isinstance(data, bytes):
+            data.close()
+
+    return markers
+
+
+def part1(path: str) -> Optional[int]:
+    return find_markers(path, [4])[4]
+
+
+def part2(path: str) -> Optional[int]:
+    return find_markers(path, [14])[14]
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    markers = find_markers(path, [4, 14])
+    print(markers[4])
+    print(markers[14])
@@ -0,0 +1,84 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from common.reader import map_file
+from day_06.solution_numpy import BLOCK_SIZE, distinct_run_starts, new_last_seen
+
+# Smaller streams are not worth starting processes for
+MIN_CHUNK_SIZE = 1 << 26
+
+
+def split_into_chunks(size: int, chunk_count: int) -> List[Tuple[int, int]]:
+    """(start, end) ranges of positions of similar size."""
+    bounds = [size * i // chunk_count for i in range(chunk_count + 1)]
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def scan_chunk(path: str, start: int, end: int, window_size: int,
+               count_only: bool = False) -> Union[int, np.ndarray]:
+    """
+    Markers ending at positions [start, end) of the stream - the number of them, or their offsets (number of
+    characters processed, like find_marker). The scan starts window_size - 1 characters before the chunk, so every
+    window ending in the chunk is complete. The mmap'd file is read through zero-copy slices.
+    """
+    data = map_file(path)
+    view = memoryview(data)
+    try:
+        found = []
+        last_seen = new_last_seen()
+        run_start = offset = max(0, start - window_size + 1)
+        while offset < end:
+            block_end = min(offset + BLOCK_SIZE, end)
+            run_starts = distinct_run_starts(view[offset:block_end], offset, last_seen, run_start)
+            run_start = int(run_starts[-1])
+
+            # Windows ending before the chunk belong to the previous chunk
+            first = max(start - offset, 0)
+            run_lengths = np.arange(offset + first + 1, block_end + 1) - run_starts[first:]
+            is_marker = run_lengths >= window_size
+            if count_only:
+                found.append(int(np.count_nonzero(is_marker)))
+            else:
+                found.append(np.flatnonzero(is_marker) + offset + first + 1)
+            offset = block_end
+    finally:
+        view.release()
+        if not isinstance(data, bytes):
+            data.close()
+
+    if count_only:
+        return sum(found)
+    return np.concatenate(found) if found else np.zeros(0, dtype=np.int64)
+
+
+def _scan(path: str, window_size: int, count_only: bool, workers: Optional[int]) -> List[Union[int, np.ndarray]]:
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    chunks = split_into_chunks(size, max(1, min(workers, size // MIN_CHUNK_SIZE)))
+
+    if len(chunks) <= 1:
+        return [scan_chunk(path, start, end, window_size, count_only) for start, end in chunks]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        futures = [executor.submit(scan_chunk, path, start, end, window_size, count_only) for start, end in chunks]
+        return [future.result() for future in futures]
+
+
+def find_all_markers(path: str, window_size: int, workers: Optional[int] = None) -> np.ndarray:
+    """Sorted offsets of all markers of the stream. Chunks of the stream are scanned in a process pool."""
+    results = _scan(path, window_size, False, workers)
+    return np.concatenate(results) if results else np.zeros(0, dtype=np.int64)
+
+
+def count_markers(path: str, window_size: int, workers: Optional[int] = None) -> int:
+    return sum(_scan(path, window_size, True, workers))
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    print(count_markers(path, 4))
+    print(count_markers(path, 14))
@@ -1,13 +1,14 @@
-from day_02.solution import yield_rows
+from typing import List
 
-if __name__ == '__main__':
-    path = './input.txt'
+from common.reader import yield_rows
+
+maximum_dir_size = 100_000
 
-    maximum_dir_size = 100_000
+total_filesystem_space = 70_000_000
+required_space = 30_000_000
 
-    total_filesystem_space = 70_000_000
-    required_space = 30_000_000
 
+def calculate_dir_sizes(path: str) -> List[int]:
     visited_dirs_size = []
     current_dir_tree_size = []
     for line in yield_rows(path):
@@ -22,13 +23,18 @@ if __name__ == '__main__':
             size = int(first_word)
             current_dir_tree_size = [dir_size + size for dir_size in current_dir_tree_size]
 
-    visited_dirs_size = visited_dirs_size + current_dir_tree_size
+    return visited_dirs_size + current_dir_tree_size
 
-    # Part 1
-    total_size = sum([s for s in visited_dirs_size if s <= maximum_dir_size])
-    print(total_size)
 
-    # Part 2
+def part1(path: str) -> int:
+    visited_dirs_size = calculate_dir_sizes(path)
+
+    return sum([s for s in visited_dirs_size if s <= maximum_dir_size])
+
+
+def part2(path: str) -> int:
+    visited_dirs_size = calculate_dir_sizes(path)
+
     biggest_dir_size = max(visited_dirs_size)
     unused_space = total_filesystem_space - biggest_dir_size
 
@@ -39,4 +45,14 @@ if __name__ == '__main__':
         if missing_space <= dir_size < best_dir_size_to_delete:
             best_dir_size_to_delete = dir_size
 
-    print(best_dir_size_to_delete)
+    return best_dir_size_to_delete
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    # Part 1
+    print(part1(path))
+
+    # Part 2
+    print(part2(path))
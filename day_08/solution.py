@@ -1,125 +1,79 @@
 import numpy as np
 
+from common.cache import cached_parser
+from common.grid import Grid
 
-def load_array(path: str) -> np.ndarray:
-    with open(path, 'r') as f:
-        data = f.readlines()
 
-    data = [[int(value) for value in line.strip()] for line in data]
-    return np.array(data)
+@cached_parser()
+def load_height_map(path: str) -> Grid:
+    height_map = Grid.from_text(path)
+    height_map.inner[...] -= ord('0')
+    return height_map
 
 
-def __check_visibility(line: np.ndarray) -> np.ndarray:
-    current_highest = -1
-
-    results = []
-    for value in line:
-        if value > current_highest:
-            results.append(1)
-            current_highest = value
-        else:
-            results.append(0)
-    return np.array(results)
-
-
-def __check_visibility_from_left(height_map: np.ndarray, visibility_map: np.ndarray, row_idx: int) -> None:
-    res = __check_visibility(height_map[row_idx, :])
-
-    for col_idx, value in enumerate(res):
-        if value:
-            visibility_map[row_idx, col_idx] = 1
-
-
-def __check_visibility_from_right(height_map: np.ndarray, visibility_map: np.ndarray, row_idx: int) -> None:
-    res = __check_visibility(np.flip(height_map[row_idx, :], 0))
-
-    for col_idx, value in enumerate(np.flip(res, 0)):
-        if value:
-            visibility_map[row_idx, col_idx] = 1
-
-
-def __check_visibility_from_top(height_map: np.ndarray, visibility_map: np.ndarray, col_idx: int) -> None:
-    res = __check_visibility(height_map[:, col_idx])
-
-    for row_idx, value in enumerate(res):
-        if value:
-            visibility_map[row_idx, col_idx] = 1
-
-
-def __check_visibility_from_bottom(height_map: np.ndarray, visibility_map: np.ndarray, col_idx: int) -> None:
-    res = __check_visibility(np.flip(height_map[:, col_idx], 0))
-
-    for row_idx, value in enumerate(np.flip(res, 0)):
-        if value:
-            visibility_map[row_idx, col_idx] = 1
-
-
-def create_tree_visibility_map(height_map: np.ndarray) -> np.ndarray:
-    n_rows, n_cols = height_map.shape
-    visibility_map = np.zeros((n_rows, n_cols))
-
-    for row_idx in range(n_rows):
-        __check_visibility_from_left(height_map, visibility_map, row_idx)
-        __check_visibility_from_right(height_map, visibility_map, row_idx)
-
-    for col_idx in range(n_cols):
-        __check_visibility_from_top(height_map, visibility_map, col_idx)
-        __check_visibility_from_bottom(height_map, visibility_map, col_idx)
+def __check_visibility_from_left(height_map: np.ndarray) -> np.ndarray:
+    highest_on_left = np.maximum.accumulate(height_map, axis=1)
 
+    visibility_map = np.ones(height_map.shape, dtype=bool)
+    visibility_map[:, 1:] = height_map[:, 1:] > highest_on_left[:, :-1]
     return visibility_map
 
 
-def __find_visibility_distance(line: np.ndarray, current_height: int) -> int:
-    for index, value in enumerate(line, start=1):
-        if value >= current_height:
-            return index
-    return len(line)
-
-
-def __view_left(height_map: np.ndarray, row_idx: int, col_idx: int) -> np.ndarray:
-    return np.flip(height_map[row_idx, :col_idx])
-
+def create_tree_visibility_map(height_map: np.ndarray) -> np.ndarray:
+    from_left = __check_visibility_from_left(height_map)
+    from_right = np.fliplr(__check_visibility_from_left(np.fliplr(height_map)))
+    from_top = __check_visibility_from_left(height_map.T).T
+    from_bottom = np.flipud(__check_visibility_from_left(np.flipud(height_map).T).T)
 
-def __view_right(height_map: np.ndarray, row_idx: int, col_idx: int) -> np.ndarray:
-    return height_map[row_idx, col_idx + 1:]
+    return from_left | from_right | from_top | from_bottom
 
 
-def __view_up(height_map: np.ndarray, row_idx: int, col_idx: int) -> np.ndarray:
-    return np.flip(height_map[:row_idx, col_idx])
+def __find_visibility_distance(height_map: Grid, index: int, offset: int) -> int:
+    data = height_map.data
+    current_height = data[index]
 
+    distance = 0
+    index += offset
+    while data[index] < current_height:
+        distance += 1
+        index += offset
 
-def __view_down(height_map: np.ndarray, row_idx: int, col_idx: int) -> np.ndarray:
-    return height_map[row_idx + 1:, col_idx]
+    # The border is higher than any tree, but it is not a tree
+    return distance if data[index] == height_map.border else distance + 1
 
 
-def calculate_scenic_scores(height_map: np.ndarray) -> np.ndarray:
+def calculate_scenic_scores(height_map: Grid) -> np.ndarray:
     n_rows, n_cols = height_map.shape
-    scenic_scores = np.zeros((n_rows, n_cols))
+    scenic_scores = np.zeros((n_rows, n_cols), dtype=np.int64)
 
     for row_idx in range(n_rows):
         for col_idx in range(n_cols):
-            current_height = height_map[row_idx, col_idx]
-            left_dist = __find_visibility_distance(__view_left(height_map, row_idx, col_idx), current_height)
-            right_dist = __find_visibility_distance(__view_right(height_map, row_idx, col_idx), current_height)
-            up_dist = __find_visibility_distance(__view_up(height_map, row_idx, col_idx), current_height)
-            down_dist = __find_visibility_distance(__view_down(height_map, row_idx, col_idx), current_height)
-            score = left_dist * right_dist * up_dist * down_dist
+            index = height_map.index(row_idx, col_idx)
+            score = 1
+            for offset in height_map.neighbour_offsets:
+                score *= __find_visibility_distance(height_map, index, offset)
             scenic_scores[row_idx, col_idx] = score
 
     return scenic_scores
 
 
+def part1(path: str) -> int:
+    tree_height_map = load_height_map(path)
+    visible_trees = create_tree_visibility_map(tree_height_map.inner)
+    return int(visible_trees.sum())
+
+
+def part2(path: str) -> int:
+    tree_height_map = load_height_map(path)
+    scenic_scores = calculate_scenic_scores(tree_height_map)
+    return int(scenic_scores.max())
+
+
 if __name__ == '__main__':
     path = './input.txt'
 
-    tree_height_map = load_array(path)
-
     # Part 1
-    visible_trees = create_tree_visibility_map(tree_height_map)
-
-    print(int(visible_trees.sum()))
+    print(part1(path))
 
     # Part 2
-    scenic_scores = calculate_scenic_scores(tree_height_map)
-
-    print(int(scenic_scores.max()))
+    print(part2(path))
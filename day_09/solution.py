@@ -2,7 +2,8 @@ from collections import namedtuple
 from enum import Enum
 from typing import Tuple, List
 
-from day_02.solution import yield_rows
+from common.cache import cached_parser
+from common.reader import yield_rows
 
 Position = namedtuple('Position', 'x y')
 
@@ -72,40 +73,48 @@ class Rope:
         self.elements = new_elements
 
 
-if __name__ == '__main__':
-    path = './input.txt'
+@cached_parser()
+def load_motions(path: str) -> List[Tuple[Direction, int]]:
+    motions = []
+    for line in yield_rows(path):
+        direction, steps = line.split()
+        motions.append((Direction[direction], int(steps)))
+    return motions
+
 
+def part1(path: str) -> int:
     head_pos = Position(0, 0)
     tail_pos = Position(0, 0)
 
-    all_tail_positions = [tail_pos]
-    for line in yield_rows(path):
-        direction, steps = line.split()
-        steps = int(steps)
-        direction = Direction[direction]
-
+    all_tail_positions = {tail_pos}
+    for direction, steps in load_motions(path):
         head_positions, tail_positions = move(head_pos, tail_pos, direction, steps)
 
         head_pos = head_positions[-1]
         tail_pos = tail_positions[-1]
 
-        all_tail_positions.extend(tail_positions)
+        all_tail_positions.update(tail_positions)
 
-    # Part 1
-    print(len(set(all_tail_positions)))
+    return len(all_tail_positions)
 
-    rope_length = 10
-    rope = Rope(rope_length)
 
-    all_tail_positions = [rope.elements[-1]]
-    for line in yield_rows(path):
-        direction, steps = line.split()
-        steps = int(steps)
-        direction = Direction[direction]
+def part2(path: str, rope_length: int = 10) -> int:
+    rope = Rope(rope_length)
 
+    all_tail_positions = {rope.elements[-1]}
+    for direction, steps in load_motions(path):
         for _ in range(steps):
             rope.move(direction)
-            all_tail_positions.append(rope.elements[-1])
+            all_tail_positions.add(rope.elements[-1])
+
+    return len(all_tail_positions)
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    # Part 1
+    print(part1(path))
 
     # Part 2
-    print(len(set(all_tail_positions)))
+    print(part2(path))
@@ -1,6 +1,8 @@
 from enum import Enum
+from typing import List, Optional, Tuple
 
-from day_02.solution import yield_rows
+from common.cache import cached_parser
+from common.reader import yield_rows
 
 
 class Command(Enum):
@@ -8,22 +10,30 @@ class Command(Enum):
     ADDX = 'addx'
 
 
-if __name__ == '__main__':
-    path = './input.txt'
+def parse_instruction(line: str) -> Tuple[Command, Optional[int]]:
+    tokens = line.split()
+    command = Command(tokens[0])
+    value = int(tokens[1]) if command == Command.ADDX else None
+    return command, value
+
+
+@cached_parser()
+def load_program(path: str) -> List[Tuple[Command, Optional[int]]]:
+    return [parse_instruction(line) for line in yield_rows(path)]
 
+
+def part1(path: str) -> int:
     reg_x = 1
     cycle = 0
 
     reg_x_history = [reg_x]
 
-    for line in yield_rows(path):
-        command = Command(line.split()[0])
+    for command, value in load_program(path):
 
         if command == Command.NOOP:
             cycle += 1
             reg_x_history.append(reg_x)
         elif command == Command.ADDX:
-            value = int(line.split()[1])
             for _ in range(1):
                 cycle += 1
                 reg_x_history.append(reg_x)
@@ -36,19 +46,18 @@ if __name__ == '__main__':
         if (i - 20) % 40 == 0:
             cycle_signal_strength = reg_x_history[i - 1] * i
             signal_strength += cycle_signal_strength
-            print(i, cycle_signal_strength)
 
-    # Part 1
-    print(signal_strength)
+    return signal_strength
+
 
+def part2(path: str) -> str:
     crt = []
     crt_row = []
 
     reg_x = 1
     cycle = 0
 
-    for line in yield_rows(path):
-        command = Command(line.split()[0])
+    for command, value in load_program(path):
 
         if command == Command.NOOP:
             if abs((cycle % 40) - reg_x) <= 1:
@@ -62,7 +71,6 @@ if __name__ == '__main__':
             cycle += 1
 
         elif command == Command.ADDX:
-            value = int(line.split()[1])
             for _ in range(1):
                 if abs((cycle % 40) - reg_x) <= 1:
                     crt_row.append('#')
@@ -85,6 +93,14 @@ if __name__ == '__main__':
             reg_x += value
             cycle += 1
 
+    return '\n'.join(''.join(row) for row in crt)
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    # Part 1
+    print(part1(path))
+
     # Part 2
-    for row in crt:
-        print(''.join(row))
+    print(part2(path))
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from typing import List, Callable, Optional
 
-from tqdm import tqdm
-
-from day_02.solution import yield_rows
+from common import instrument
+from common.cache import cached_parser
+from common.reader import yield_rows
 
 
 def _last_word(text: str) -> str:
@@ -77,70 +77,74 @@ class Monkey:
             self.throw(item, self.choose_monkey_to_throw_at(item))
 
 
-if __name__ == '__main__':
-    path = './input.txt'
-
-    n_rounds = 20
-    most_active_to_count = 2
-
-    monkeys = []
+@cached_parser()
+def load_monkey_descriptions(path: str) -> List[List[str]]:
+    monkey_descriptions = []
 
     monkey_description = []
     for line in yield_rows(path):
         if not line:
-            monkeys.append(Monkey.from_description(monkey_description, reduce_worry_level))
+            monkey_descriptions.append(monkey_description)
             monkey_description = []
         else:
             monkey_description.append(line)
 
     if monkey_description:
-        monkeys.append(Monkey.from_description(monkey_description, reduce_worry_level))
+        monkey_descriptions.append(monkey_description)
+
+    return monkey_descriptions
+
+
+def load_monkeys(path: str, reduce_worry_level_func: Optional[Callable] = None) -> List[Monkey]:
+    monkeys = [Monkey.from_description(description, reduce_worry_level_func)
+               for description in load_monkey_descriptions(path)]
 
     for monkey in monkeys:
         monkey.monkeys = monkeys
 
-    for _ in range(n_rounds):
-        for monkey in monkeys:
-            monkey.turn()
+    return monkeys
+
 
+def calculate_monkey_business(monkeys: List[Monkey], most_active_to_count: int = 2) -> int:
     monkey_business = 1
     for value in sorted([monkey.inspection_cnt for monkey in monkeys], reverse=True)[:most_active_to_count]:
         monkey_business *= value
+    return monkey_business
 
-    # Part 1
-    print(monkey_business)
 
-    n_rounds = 10000
-    most_active_to_count = 2
+def part1(path: str, n_rounds: int = 20) -> int:
+    monkeys = load_monkeys(path, reduce_worry_level)
 
-    monkeys = []
+    for _ in range(n_rounds):
+        for monkey in monkeys:
+            monkey.turn()
 
-    monkey_description = []
-    for line in yield_rows(path):
-        if not line:
-            monkeys.append(Monkey.from_description(monkey_description))
-            monkey_description = []
-        else:
-            monkey_description.append(line)
+    return calculate_monkey_business(monkeys)
 
-    if monkey_description:
-        monkeys.append(Monkey.from_description(monkey_description))
+
+def part2(path: str, n_rounds: int = 10000) -> int:
+    monkeys = load_monkeys(path)
 
     mod_reduce = 1
     for monkey in monkeys:
         mod_reduce *= monkey.test_divisor
 
     for monkey in monkeys:
-        monkey.monkeys = monkeys
         monkey.reduce_worry_level = lambda x: x % mod_reduce
 
-    for _ in tqdm(range(n_rounds)):
-        for monkey in monkeys:
-            monkey.turn()
+    with instrument.phase('day_11.rounds'):
+        for _ in range(n_rounds):
+            for monkey in monkeys:
+                monkey.turn()
 
-    monkey_business = 1
-    for value in sorted([monkey.inspection_cnt for monkey in monkeys], reverse=True)[:most_active_to_count]:
-        monkey_business *= value
+    return calculate_monkey_business(monkeys)
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    # Part 1
+    print(part1(path))
 
     # Part 2
-    print(monkey_business)
+    print(part2(path))
@@ -1,121 +1,108 @@
-from __future__ import annotations
+from typing import Optional, Tuple
 
-from collections import namedtuple
-from dataclasses import dataclass
-from typing import List, Optional
+from common import instrument
+from common.cache import cached_parser
+from common.grid import Grid
 
-import numpy as np
 
-from day_02.solution import yield_rows
+@cached_parser(version=2)
+def read_elevation_map(path: str) -> Grid:
+    return Grid.from_text(path)
 
-Coord = namedtuple('Coord', 'x y')
 
-
-def read_elevation_map(path: str) -> np.ndarray:
-    return np.array([list(line) for line in yield_rows(path)])
-
-
-def find_char(map_: np.ndarray, char: str) -> Coord:
-    for x in range(map_.shape[0]):
-        for y in range(map_.shape[1]):
-            if map_[x, y] == char:
-                return Coord(x, y)
-    raise ValueError
-
-
-def is_reachable(pos: Coord, map_: np.ndarray, current_elevation: str) -> bool:
-    return 0 <= pos.x < map_.shape[0] and \
-           0 <= pos.y < map_.shape[1] and \
-           ord(map_[pos.x, pos.y]) - ord(current_elevation) <= 1
-
-
-def draw_map(map_: np.ndarray, path: List[Coord]):
-    map_ = np.array([[0 for _ in range(map_.shape[1])] for _ in range(map_.shape[0])])
-    for index, coord in enumerate(path, start=1):
-        map_[coord.x][coord.y] = index
-    print(map_)
-
-
-@dataclass
-class Vertex:
-    coord: Coord
-    dist: int = 0
-
-    def __eq__(self, other: Vertex) -> bool:
-        return self.coord == other.coord
-
-
-def find_shortest_path_len(map_: np.ndarray, start: Coord, end: Coord) -> Optional[int]:
+def find_shortest_path_len(map_: Grid, start: int, end: int) -> Optional[int]:
     if start == end:
         return 0
 
-    vertices = [Vertex(start)]
+    data = map_.data
+    visited = bytearray(len(data))
+    visited[start] = 1
+
+    vertices = [start]
+    dist = 0
+    while vertices:
+        dist += 1
+        next_vertices = []
+        for pos in vertices:
+            if instrument.enabled:
+                instrument.count('day_12.bfs_nodes')
+            max_elevation = data[pos] + 1
+
+            for offset in map_.neighbour_offsets:
+                candidate = pos + offset
+                # border cells are higher than any elevation, so they are never reachable
+                if visited[candidate] or data[candidate] > max_elevation:
+                    continue
+                if candidate == end:
+                    return dist
+
+                visited[candidate] = 1
+                next_vertices.append(candidate)
+        vertices = next_vertices
+
+    return None
 
-    for elem in vertices:
-        pos = elem.coord
-        dist = elem.dist
-        directions = [Coord(pos.x - 1, pos.y), Coord(pos.x + 1, pos.y), Coord(pos.x, pos.y - 1),
-                      Coord(pos.x, pos.y + 1)]
 
-        for direction in directions:
-            if is_reachable(direction, map_, map_[pos.x, pos.y]):
-                if direction == end:
-                    return dist + 1
+def find_shortest_path_len_reversed_to_elevation(map_: Grid, start: int, end_elevation: str) -> Optional[int]:
+    data = map_.data
+    end_elevation = ord(end_elevation)
+    if data[start] == end_elevation:
+        return 0
 
-                candidate = Vertex(direction, dist + 1)
-                if candidate not in vertices:
-                    vertices.append(candidate)
+    visited = bytearray(len(data))
+    visited[start] = 1
+
+    vertices = [start]
+    dist = 0
+    while vertices:
+        dist += 1
+        next_vertices = []
+        for pos in vertices:
+            if instrument.enabled:
+                instrument.count('day_12.bfs_nodes')
+            min_elevation = data[pos] - 1
+
+            for offset in map_.neighbour_offsets:
+                candidate = pos + offset
+                if visited[candidate] or data[candidate] < min_elevation or data[candidate] == map_.border:
+                    continue
+                if data[candidate] == end_elevation:
+                    return dist
+
+                visited[candidate] = 1
+                next_vertices.append(candidate)
+        vertices = next_vertices
 
     return None
 
 
-def is_reachable_reversed(pos: Coord, map_: np.ndarray, current_elevation: str) -> bool:
-    return 0 <= pos.x < map_.shape[0] and \
-           0 <= pos.y < map_.shape[1] and \
-           ord(current_elevation) - ord(map_[pos.x, pos.y]) <= 1
+def load_elevation_map(path: str) -> Tuple[Grid, int, int]:
+    elevation_map = read_elevation_map(path)
 
+    start_pos = elevation_map.find(ord('S'))
+    end_pos = elevation_map.find(ord('E'))
 
-def find_shortest_path_len_reversed_to_elevation(map_: np.ndarray, start: Coord, end_elevation: str) -> Optional[int]:
-    if map_[start.x, start.y] == end_elevation:
-        return 0
+    elevation_map[start_pos] = ord('a')
+    elevation_map[end_pos] = ord('z')
 
-    vertices = [Vertex(start)]
+    return elevation_map, start_pos, end_pos
 
-    for elem in vertices:
-        pos = elem.coord
-        dist = elem.dist
-        directions = [Coord(pos.x - 1, pos.y), Coord(pos.x + 1, pos.y), Coord(pos.x, pos.y - 1),
-                      Coord(pos.x, pos.y + 1)]
 
-        for direction in directions:
-            if is_reachable_reversed(direction, map_, map_[pos.x, pos.y]):
-                if map_[direction.x, direction.y] == end_elevation:
-                    return dist + 1
+def part1(path: str) -> Optional[int]:
+    elevation_map, start_pos, end_pos = load_elevation_map(path)
+    return find_shortest_path_len(elevation_map, start_pos, end_pos)
 
-                candidate = Vertex(direction, dist + 1)
-                if candidate not in vertices:
-                    vertices.append(candidate)
 
-    return None
+def part2(path: str) -> Optional[int]:
+    elevation_map, _, end_pos = load_elevation_map(path)
+    return find_shortest_path_len_reversed_to_elevation(elevation_map, end_pos, 'a')
 
 
 if __name__ == '__main__':
     path = './input.txt'
 
-    elevation_map = read_elevation_map(path)
-
-    start_pos = find_char(elevation_map, 'S')
-    end_pos = find_char(elevation_map, 'E')
-
-    elevation_map[start_pos.x, start_pos.y] = 'a'
-    elevation_map[end_pos.x, end_pos.y] = 'z'
-
-    shortest_path_len = find_shortest_path_len(elevation_map, start_pos, end_pos)
-
     # Part 1
-    print(shortest_path_len)
-
-    shortest_path_to_any_a_len = find_shortest_path_len_reversed_to_elevation(elevation_map, end_pos, 'a')
+    print(part1(path))
 
     # Part 2
-    print(shortest_path_to_any_a_len)
+    print(part2(path))
@@ -2,7 +2,8 @@ import functools
 import json
 from typing import List, Generator, Union
 
-from day_02.solution import yield_rows
+from common.cache import cached_parser
+from common.reader import yield_rows
 
 
 def yield_pairs(path: str) -> Generator[List[List[Union[List, int]]], None, None]:
@@ -18,6 +19,11 @@ def yield_pairs(path: str) -> Generator[List[List[Union[List, int]]], None, None
         yield pair
 
 
+@cached_parser()
+def load_pairs(path: str) -> List[List[List[Union[List, int]]]]:
+    return list(yield_pairs(path))
+
+
 def is_in_order(left: List, right: List) -> bool:
     # Range instead of zip, because we want to easily check which list will run out of elements first
     for index in range(max(len(left), len(right))):
@@ -66,18 +72,16 @@ def comparison_wrapper(left: List, right: List) -> int:
     return -1 if is_in_order(left, right) else 1
 
 
-if __name__ == '__main__':
-    path = './input.txt'
-
+def part1(path: str) -> int:
     correct_indices_sum = 0
-    for index, pair in enumerate(yield_pairs(path), start=1):
+    for index, pair in enumerate(load_pairs(path), start=1):
         if is_in_order(pair[0], pair[1]):
             correct_indices_sum += index
+    return correct_indices_sum
 
-    # Part 1
-    print(correct_indices_sum)
 
-    packets = [packet for pair in yield_pairs(path) for packet in pair]
+def part2(path: str) -> int:
+    packets = [packet for pair in load_pairs(path) for packet in pair]
     divider_packets = [[[2]], [[6]]]
 
     packets = packets + divider_packets
@@ -86,6 +90,14 @@ if __name__ == '__main__':
     for index, packet in enumerate(sorted(packets, key=functools.cmp_to_key(comparison_wrapper)), start=1):
         if packet in divider_packets:
             decoder_key *= index
+    return decoder_key
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    # Part 1
+    print(part1(path))
 
     # Part 2
-    print(decoder_key)
+    print(part2(path))
@@ -1,32 +1,28 @@
 from __future__ import annotations
 
-import time
 from enum import Enum
 from typing import List, Set, Optional, Callable, Union, Tuple, Collection
 
 import numpy as np
 
-from day_02.solution import yield_rows
-from day_14.solution_sets import Coord, parse_rock_path, down, down_left, down_right
+from common import instrument
+from common.grid import Grid
+from common.reader import yield_rows
+from day_14.solution_sets import Coord, parse_rock_path
 
 
 class CaveBlock(Enum):
-    EMPTY = '.'
-    ROCK = '#'
-    SAND = 'o'
+    EMPTY = ord('.')
+    ROCK = ord('#')
+    SAND = ord('o')
 
 
 def adjust_coord(coord: Coord, x_min: int, y_min: int) -> Coord:
     return Coord(coord.x - x_min, coord.y - y_min)
 
 
-def find_rocks(matrix: np.ndarray) -> List[Coord]:
-    rocks = []
-    for y in range(matrix.shape[0]):
-        for x in range(matrix.shape[1]):
-            if matrix[y, x] == CaveBlock.ROCK.value:
-                rocks.append(Coord(x, y))
-    return rocks
+def find_bottom_rock(matrix: np.ndarray) -> int:
+    return int(np.flatnonzero((matrix == CaveBlock.ROCK.value).any(axis=1)).max())
 
 
 def min_max_range(elements: Collection, key: Callable, padding: int = 0) -> Tuple[int, int, int]:
@@ -41,23 +37,32 @@ def find_padding(points: Set[Coord]) -> int:
 
 
 class Cave:
-    def __init__(self, matrix: np.ndarray, x_min: int, y_min: int, sand_start_point: Coord,
+    def __init__(self, grid: Grid, x_min: int, y_min: int, sand_start_point: Coord,
                  bottom_rock_pos: Optional[int] = None) -> None:
-        self.matrix = matrix
+        self.grid = grid
         self.x_min = x_min
         self.y_min = y_min
         self.sand_start_point = sand_start_point
 
-        self.bottom_rock_pos = bottom_rock_pos or max(p.y for p in find_rocks(matrix))
+        self.bottom_rock_pos = bottom_rock_pos or find_bottom_rock(grid.inner)
+
+        # Sand moves are offsets of flat grid indexes
+        self.down = grid.offset(1, 0)
+        self.down_left = grid.offset(1, -1)
+        self.down_right = grid.offset(1, 1)
 
         # Trace path of last sand unit
         self.last_sand_path = []
 
+    @property
+    def matrix(self) -> np.ndarray:
+        return self.grid.inner
+
     def adjust_coord(self, coord: Coord) -> Coord:
         return adjust_coord(coord, self.x_min, self.y_min)
 
     def sand_units_count(self) -> int:
-        return (self.matrix == CaveBlock.SAND.value).sum()
+        return self.grid.count(CaveBlock.SAND.value)
 
     @classmethod
     def from_rock_paths(cls, rock_paths: List[str], sand_start_point: Coord = Coord(500, 0),
@@ -76,49 +81,57 @@ class Cave:
         y_min, y_max, y_range = min_max_range(_points, key=lambda p: p.y, padding=padding)
         x_min, x_max, x_range = min_max_range(_points, key=lambda p: p.x, padding=padding)
 
-        matrix = np.full((y_range, x_range), CaveBlock.EMPTY.value)
+        grid = Grid((y_range, x_range), fill=CaveBlock.EMPTY.value)
 
         for rock in rocks:
             rock = adjust_coord(rock, x_min, y_min)
-            matrix[rock.y, rock.x] = CaveBlock.ROCK.value
+            grid[grid.index(rock.y, rock.x)] = CaveBlock.ROCK.value
 
         sand_start_point = adjust_coord(sand_start_point, x_min, y_min)
 
-        return cls(matrix, x_min, y_min, sand_start_point)
+        return cls(grid, x_min, y_min, sand_start_point)
 
-    def is_empty(self, pos: Coord) -> bool:
-        return self.matrix[pos.y, pos.x] == CaveBlock.EMPTY.value
+    def is_empty(self, index: int) -> bool:
+        return self.grid.data[index] == CaveBlock.EMPTY.value
 
-    def produce_sand(self) -> Coord:
+    def produce_sand(self) -> int:
         # Start from last position of previous sand unit which was not an ending position
         # (ending position was removed from a list, so last element is taken)
         if self.last_sand_path:
             return self.last_sand_path.pop()
 
-        if not self.is_empty(self.sand_start_point):
+        sand_start_index = self.grid.index(self.sand_start_point.y, self.sand_start_point.x)
+        if not self.is_empty(sand_start_index):
             raise RuntimeError('There is no place for another sand unit.')
 
-        return Coord(self.sand_start_point.x, self.sand_start_point.y)
+        return sand_start_index
 
     def simulate_sand_unit(self) -> bool:
+        data = self.grid.data
+        empty = CaveBlock.EMPTY.value
+        # Sand below the lowest rock falls into the endless void
+        void_start = self.grid.index(self.bottom_rock_pos, -self.grid.padding)
+
         sand_pos = self.produce_sand()
 
         while True:
             # Trace sand unit positions
             self.last_sand_path.append(sand_pos)
 
-            if sand_pos.y >= self.bottom_rock_pos:
+            if sand_pos >= void_start:
                 # sand will fall into the endless void
                 return False
-            elif self.is_empty(down(sand_pos)):
-                sand_pos = down(sand_pos)
-            elif self.is_empty(down_left(sand_pos)):
-                sand_pos = down_left(sand_pos)
-            elif self.is_empty(down_right(sand_pos)):
-                sand_pos = down_right(sand_pos)
+            elif data[sand_pos + self.down] == empty:
+                sand_pos += self.down
+            elif data[sand_pos + self.down_left] == empty:
+                sand_pos += self.down_left
+            elif data[sand_pos + self.down_right] == empty:
+                sand_pos += self.down_right
             else:
                 # Unit of sand comes to rest
-                self.matrix[sand_pos.y, sand_pos.x] = CaveBlock.SAND.value
+                if instrument.enabled:
+                    instrument.count('day_14.sand_units')
+                data[sand_pos] = CaveBlock.SAND.value
 
                 # Remove last sand position (ending position)
                 self.last_sand_path.pop()
@@ -127,31 +140,38 @@ class Cave:
 
 class CaveWithFloor(Cave):
 
-    def __init__(self, matrix: np.ndarray, x_min: int, y_min: int, sand_start_point: Coord,
+    def __init__(self, grid: Grid, x_min: int, y_min: int, sand_start_point: Coord,
                  bottom_rock_pos: Optional[int] = None) -> None:
-        super().__init__(matrix, x_min, y_min, sand_start_point, bottom_rock_pos)
+        super().__init__(grid, x_min, y_min, sand_start_point, bottom_rock_pos)
 
         self.floor = self.bottom_rock_pos + 2
 
-    def is_empty(self, pos: Coord) -> bool:
-        return super().is_empty(pos) and pos.y != self.floor
+        # The floor is stored in the grid as a row of rock
+        if self.floor >= grid.shape[0]:
+            grid.extend(self.floor - grid.shape[0] + 1, fill=CaveBlock.EMPTY.value)
+        grid.inner[self.floor, :] = CaveBlock.ROCK.value
 
     def simulate_sand_unit(self) -> bool:
+        data = self.grid.data
+        empty = CaveBlock.EMPTY.value
+
         sand_pos = self.produce_sand()
 
         while True:
             # Trace sand unit positions
             self.last_sand_path.append(sand_pos)
 
-            if self.is_empty(down(sand_pos)):
-                sand_pos = down(sand_pos)
-            elif self.is_empty(down_left(sand_pos)):
-                sand_pos = down_left(sand_pos)
-            elif self.is_empty(down_right(sand_pos)):
-                sand_pos = down_right(sand_pos)
+            if data[sand_pos + self.down] == empty:
+                sand_pos += self.down
+            elif data[sand_pos + self.down_left] == empty:
+                sand_pos += self.down_left
+            elif data[sand_pos + self.down_right] == empty:
+                sand_pos += self.down_right
             else:
                 # Unit of sand comes to rest
-                self.matrix[sand_pos.y, sand_pos.x] = CaveBlock.SAND.value
+                if instrument.enabled:
+                    instrument.count('day_14.sand_units')
+                data[sand_pos] = CaveBlock.SAND.value
 
                 # Remove last sand position (ending position)
                 self.last_sand_path.pop()
@@ -160,30 +180,25 @@ class CaveWithFloor(Cave):
 
 
 def visualise_cave(cave: Cave) -> np.ndarray:
-    return cave.matrix.copy()
-
+    return cave.matrix.view('S1').astype('U1')
 
-if __name__ == '__main__':
-    path = './input.txt'
 
+def part1(path: str) -> int:
     rock_paths = list(yield_rows(path))
 
     cave = Cave.from_rock_paths(rock_paths)
 
-    st = time.time()
-
     sand_added = True
     while sand_added:
         sand_added = cave.simulate_sand_unit()
 
-    # Part 1
-    print(cave.sand_units_count())
+    return int(cave.sand_units_count())
 
-    print(f'Duration: {time.time() - st}')
 
-    cave = CaveWithFloor.from_rock_paths(rock_paths, padding=find_padding)
+def part2(path: str) -> int:
+    rock_paths = list(yield_rows(path))
 
-    st = time.time()
+    cave = CaveWithFloor.from_rock_paths(rock_paths, padding=find_padding)
 
     sand_added = True
     while sand_added:
@@ -192,7 +207,20 @@ if __name__ == '__main__':
         except RuntimeError:
             sand_added = False
 
+    return int(cave.sand_units_count())
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    instrument.enable()
+
+    # Part 1
+    with instrument.phase('part1'):
+        print(part1(path))
+
     # Part 2
-    print(cave.sand_units_count())
+    with instrument.phase('part2'):
+        print(part2(path))
 
-    print(f'Duration: {time.time() - st}')
+    print(instrument.report())
@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-import time
 from collections import namedtuple
 from typing import List, Set
 
-import numpy as np
-
-from day_02.solution import yield_rows
+from common import instrument
+from common.reader import yield_rows
 
 Coord = namedtuple('Coord', 'x y')
 
@@ -82,6 +80,8 @@ class Cave:
                 sand_pos = down_right(sand_pos)
             else:
                 # Unit of sand comes to rest
+                if instrument.enabled:
+                    instrument.count('day_14.sand_units')
                 self.sand_positions.add(sand_pos)
                 return True
 
@@ -109,11 +109,16 @@ class CaveWithFloor(Cave):
                 sand_pos = down_right(sand_pos)
             else:
                 # Unit of sand comes to rest
+                if instrument.enabled:
+                    instrument.count('day_14.sand_units')
                 self.sand_positions.add(sand_pos)
                 return True
 
 
 def visualise_cave(cave: Cave) -> np.ndarray:
+    # numpy is needed only for visualisation, so it is not imported with the solution
+    import numpy as np
+
     all_objects = cave.sand_positions.union(cave.rock_positions).union([cave.sand_start_point])
     min_x = min(p.x for p in all_objects)
     max_x = max(p.x for p in all_objects)
@@ -138,27 +143,22 @@ def visualise_cave(cave: Cave) -> np.ndarray:
     return cave_layout
 
 
-if __name__ == '__main__':
-    path = './input.txt'
-
+def part1(path: str) -> int:
     rock_paths = list(yield_rows(path))
 
     cave = Cave.from_rock_paths(rock_paths)
 
-    st = time.time()
-
     sand_added = True
     while sand_added:
         sand_added = cave.simulate_sand_unit()
 
-    # Part 1
-    print(len(cave.sand_positions))
+    return len(cave.sand_positions)
 
-    print(f'Duration: {time.time() - st}')
 
-    cave = CaveWithFloor.from_rock_paths(rock_paths)
+def part2(path: str) -> int:
+    rock_paths = list(yield_rows(path))
 
-    st = time.time()
+    cave = CaveWithFloor.from_rock_paths(rock_paths)
 
     sand_added = True
     while sand_added:
@@ -167,7 +167,20 @@ if __name__ == '__main__':
         except RuntimeError:
             sand_added = False
 
+    return len(cave.sand_positions)
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    instrument.enable()
+
+    # Part 1
+    with instrument.phase('part1'):
+        print(part1(path))
+
     # Part 2
-    print(len(cave.sand_positions))
+    with instrument.phase('part2'):
+        print(part2(path))
 
-    print(f'Duration: {time.time() - st}')
+    print(instrument.report())
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import time
 from typing import List, Set
 
-from day_02.solution import yield_rows
+from common import instrument
+from common.reader import yield_rows
 from day_14.solution_sets import Coord, parse_rock_path, down, down_left, down_right
 
 
@@ -61,6 +61,8 @@ class Cave:
                 sand_pos = down_right(sand_pos)
             else:
                 # Unit of sand comes to rest
+                if instrument.enabled:
+                    instrument.count('day_14.sand_units')
                 self.sand_positions.add(sand_pos)
 
                 # Remove last sand position (ending position)
@@ -94,6 +96,8 @@ class CaveWithFloor(Cave):
                 sand_pos = down_right(sand_pos)
             else:
                 # Unit of sand comes to rest
+                if instrument.enabled:
+                    instrument.count('day_14.sand_units')
                 self.sand_positions.add(sand_pos)
 
                 # Remove last sand position (ending position)
@@ -102,27 +106,22 @@ class CaveWithFloor(Cave):
                 return True
 
 
-if __name__ == '__main__':
-    path = './input.txt'
-
+def part1(path: str) -> int:
     rock_paths = list(yield_rows(path))
 
     cave = Cave.from_rock_paths(rock_paths)
 
-    st = time.time()
-
     sand_added = True
     while sand_added:
         sand_added = cave.simulate_sand_unit()
 
-    # Part 1
-    print(len(cave.sand_positions))
+    return len(cave.sand_positions)
 
-    print(f'Duration: {time.time() - st}')
 
-    cave = CaveWithFloor.from_rock_paths(rock_paths)
+def part2(path: str) -> int:
+    rock_paths = list(yield_rows(path))
 
-    st = time.time()
+    cave = CaveWithFloor.from_rock_paths(rock_paths)
 
     sand_added = True
     while sand_added:
@@ -131,7 +130,20 @@ if __name__ == '__main__':
         except RuntimeError:
             sand_added = False
 
+    return len(cave.sand_positions)
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    instrument.enable()
+
+    # Part 1
+    with instrument.phase('part1'):
+        print(part1(path))
+
     # Part 2
-    print(len(cave.sand_positions))
+    with instrument.phase('part2'):
+        print(part2(path))
 
-    print(f'Duration: {time.time() - st}')
+    print(instrument.report())
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import math
 import re
-import time
 from typing import Tuple, List, Optional
 
-from day_02.solution import yield_rows
+from common import instrument
+from common.cache import cached_parser
+from common.integers import read_integer_rows
 
 
 def manhattan_distance(p1: Tuple[int, ...], p2: Tuple[int, ...]) -> int:
@@ -136,30 +137,29 @@ def calculate_tuning_frequency(location: Tuple[int, int]) -> int:
     return location[0] * 4000000 + location[1]
 
 
-if __name__ == '__main__':
-    path = './input.txt'
-
-    sensor_logs = list(yield_rows(path))
+@cached_parser()
+def load_sensor_data(path: str) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """[(sensor_pos, beacon_pos), ...]"""
+    return [((sx, sy), (bx, by)) for sx, sy, bx, by in read_integer_rows(path, 4).tolist()]
 
-    # [(sensor_pos, beacon_pos), ...]
-    sensor_data = [parse_log(line) for line in sensor_logs]
 
+def part1(path: str, y_to_check: int = 2000000) -> int:
+    sensor_data = load_sensor_data(path)
     sensors = [Sensor.from_closest_beacon(*d) for d in sensor_data]
 
-    y_to_check = 2000000
-
-    st = time.perf_counter()
     forbidden_positions = set()
     for sensor in sensors:
         forbidden_positions.update(sensor.find_forbidden_positions_along_y(y_to_check))
 
     forbidden_positions.difference_update([s[1] for s in sensor_data])
 
-    # Part 1
-    print(len(forbidden_positions))
-    print(f'time: {time.perf_counter() - st}')
+    return len(forbidden_positions)
+
+
+def part2(path: str) -> Optional[int]:
+    sensor_data = load_sensor_data(path)
+    sensors = [Sensor.from_closest_beacon(*d) for d in sensor_data]
 
-    st = time.perf_counter()
     sensor_areas = [SensorArea(sensor) for sensor in sensors]
 
     lines_a = set()
@@ -176,10 +176,23 @@ if __name__ == '__main__':
         for line_b in lines_b:
             possible_locations.append(line_a.intersection(line_b))
 
-    # Part 2
     for location in possible_locations:
         if not is_in_range(location, sensors):
-            print(calculate_tuning_frequency(location))
-            break
+            return calculate_tuning_frequency(location)
+    return None
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    instrument.enable()
+
+    # Part 1
+    with instrument.phase('part1'):
+        print(part1(path))
+
+    # Part 2
+    with instrument.phase('part2'):
+        print(part2(path))
 
-    print(f'time: {time.perf_counter() - st}')
+    print(instrument.report())
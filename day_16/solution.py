@@ -2,9 +2,9 @@ from dataclasses import dataclass
 from functools import cache
 from typing import Set, List, Optional, Dict, Tuple
 
-from tqdm import tqdm
-
-from day_02.solution import yield_rows
+from common import instrument
+from common.cache import cached_parser
+from common.reader import yield_rows
 
 
 @dataclass
@@ -79,6 +79,7 @@ class GraphEdges:
         return None
 
 
+@cached_parser()
 def parse_input(path: str) -> Tuple[Dict[str, Node], GraphEdges]:
     nodes = {}
     edges = GraphEdges()
@@ -98,6 +99,8 @@ def parse_input(path: str) -> Tuple[Dict[str, Node], GraphEdges]:
 
 def check_paths(current_node: str, nodes_to_visit: List[str], nodes: Dict[str, Node],
                 edges: GraphEdges, time_left: int, total_pressure_released: int) -> int:
+    if instrument.enabled:
+        instrument.count('day_16.states')
     total_pressure_released += nodes[current_node].value * time_left
 
     pressures_released = []
@@ -139,24 +142,24 @@ def _find_all_paths(current_node: str, nodes_to_visit: List[str], nodes: Dict[st
     return pressures_released + to_return
 
 
-if __name__ == '__main__':
-    path = './input.txt'
+initial_node_name = 'AA'
 
-    initial_node_name = 'AA'
-    total_time = 30
 
+def part1(path: str, total_time: int = 30) -> int:
     nodes, edges = parse_input(path)
 
     meaningful_nodes = [node.name for node in nodes.values() if node.value > 0]
 
-    # Part 1
-    max_pressure = check_paths(initial_node_name, meaningful_nodes, nodes, edges, total_time, 0)
-    print(max_pressure)
+    return check_paths(initial_node_name, meaningful_nodes, nodes, edges, total_time, 0)
 
-    # Part 2
-    total_time = 26
 
-    all_possible_orders = _find_all_paths(initial_node_name, meaningful_nodes, nodes, edges, total_time, 0, [], [])
+def part2(path: str, total_time: int = 26) -> int:
+    nodes, edges = parse_input(path)
+
+    meaningful_nodes = [node.name for node in nodes.values() if node.value > 0]
+
+    with instrument.phase('day_16.find_all_paths'):
+        all_possible_orders = _find_all_paths(initial_node_name, meaningful_nodes, nodes, edges, total_time, 0, [], [])
 
     # squash possible orders
     orders = {}
@@ -169,12 +172,23 @@ if __name__ == '__main__':
             orders[order] = value
 
     best_val = 0
-    for order, value in tqdm(orders.items()):
-        elephant_meaningful_nodes = list(set(meaningful_nodes).difference(order))
+    with instrument.phase('day_16.elephant_paths'):
+        for order, value in orders.items():
+            elephant_meaningful_nodes = list(set(meaningful_nodes).difference(order))
 
-        elephant_pressure_released = check_paths(initial_node_name, elephant_meaningful_nodes, nodes, edges, total_time,
-                                                 0)
+            elephant_pressure_released = check_paths(initial_node_name, elephant_meaningful_nodes, nodes, edges,
+                                                     total_time, 0)
 
-        if value + elephant_pressure_released > best_val:
-            best_val = value + elephant_pressure_released
-    print(best_val)
+            if value + elephant_pressure_released > best_val:
+                best_val = value + elephant_pressure_released
+    return best_val
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    # Part 1
+    print(part1(path))
+
+    # Part 2
+    print(part2(path))
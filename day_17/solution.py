@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import itertools
 from collections.abc import Sequence
-from typing import List, NamedTuple
+from typing import List, NamedTuple, Tuple
 
 import numpy as np
-from tqdm import tqdm
+
+from common import instrument
+from common.grid import Grid
 
 
 class Coord(NamedTuple):
@@ -42,75 +44,88 @@ def generate_rock_coords(left: int, bottom: int, rock_type: int) -> List[Coord]:
 
 
 class Rock:
-    def __init__(self, coords: List[Coord]):
-        self.coords = coords
+    def __init__(self, cells: List[int], row_offset: int):
+        # flat indexes of the cells taken by the rock in the chamber grid
+        self.cells = cells
+        self.row_offset = row_offset
 
     @classmethod
-    def create(cls, left: int, bottom: int, rock_type: int) -> Rock:
-        return cls(generate_rock_coords(left, bottom, rock_type))
-
-    def can_move_left(self, chamber: Chamber) -> bool:
-        for coord in self.coords:
-            if not chamber.is_coord_available(coord.move_left()):
+    def create(cls, chamber: Chamber, left: int, bottom: int, rock_type: int) -> Rock:
+        coords = generate_rock_coords(left, bottom, rock_type)
+        chamber.ensure_height(max(coord.y for coord in coords))
+        return cls([chamber.index(coord) for coord in coords], chamber.grid.offset(1, 0))
+
+    def __can_move(self, chamber: Chamber, offset: int) -> bool:
+        data = chamber.grid.data
+        for cell in self.cells:
+            if data[cell + offset]:
                 return False
         return True
 
+    def can_move_left(self, chamber: Chamber) -> bool:
+        return self.__can_move(chamber, -1)
+
     def can_move_right(self, chamber: Chamber) -> bool:
-        for coord in self.coords:
-            if not chamber.is_coord_available(coord.move_right()):
-                return False
-        return True
+        return self.__can_move(chamber, 1)
 
     def can_move_down(self, chamber: Chamber) -> bool:
-        for coord in self.coords:
-            if not chamber.is_coord_available(coord.move_down()):
-                return False
-        return True
+        return self.__can_move(chamber, -self.row_offset)
 
-    def __move(self, x: int, y: int) -> None:
-        self.coords = [coord.move(x, y) for coord in self.coords]
+    def __move(self, offset: int) -> None:
+        self.cells = [cell + offset for cell in self.cells]
 
     def move_left(self) -> None:
-        self.__move(-1, 0)
+        self.__move(-1)
 
     def move_right(self) -> None:
-        self.__move(1, 0)
+        self.__move(1)
 
     def move_down(self) -> None:
-        self.__move(0, -1)
+        self.__move(-self.row_offset)
 
 
 class Chamber:
+    ROCK = 1
+
     def __init__(self, width: int, bottom: int, rock_types_count: int, jet_pattern: str) -> None:
         self.width = width
         self.bottom = bottom
 
-        self.coords_taken = set()
+        # Grid row 0 is the first row above the bottom. Walls and the bottom are the border of the grid.
+        self.grid = Grid((0, width))
+        self._tower_height = bottom
 
         self.rock_type_iter = itertools.cycle(range(rock_types_count))
         self.jet_iter = itertools.cycle(jet_pattern)
 
         self.height_history = [self.tower_height]
 
+    def index(self, coord: Coord) -> int:
+        return self.grid.index(coord.y - self.bottom - 1, coord.x)
+
+    def ensure_height(self, y: int) -> None:
+        missing_rows = y - self.bottom - self.grid.shape[0]
+        if missing_rows > 0:
+            # Grow at least twice, so the grid is resized O(log n) times
+            self.grid.extend(max(missing_rows, self.grid.shape[0]))
+
     def is_coord_available(self, coord: Coord) -> bool:
-        if coord in self.coords_taken:
-            return False
-        if coord.x < 0:
-            return False
-        if coord.x >= self.width:
-            return False
-        if coord.y <= self.bottom:
+        if coord.x < 0 or coord.x >= self.width or coord.y <= self.bottom:
             return False
-        return True
+        if coord.y - self.bottom > self.grid.shape[0]:
+            return True
+        return not self.grid[self.index(coord)]
 
     @property
     def tower_height(self) -> int:
-        return max([coord.y for coord in self.coords_taken], default=self.bottom)
+        return self._tower_height
 
     def simulate(self, num_rocks: int) -> None:
-        for _ in tqdm(range(num_rocks)):
+        data = self.grid.data
+
+        for _ in range(num_rocks):
             rock_type = next(self.rock_type_iter)
-            rock = Rock.create(2, self.tower_height + 4, rock_type)
+            rock = Rock.create(self, 2, self.tower_height + 4, rock_type)
             rock_landed = False
 
             while not rock_landed:
@@ -130,16 +145,21 @@ class Chamber:
                     rock.move_down()
                 else:
                     rock_landed = True
-                    self.coords_taken.update(rock.coords)
+                    if instrument.enabled:
+                        instrument.count('day_17.rocks')
+                    for cell in rock.cells:
+                        data[cell] = self.ROCK
+
+                    rock_top = self.grid.coord(max(rock.cells))[0] + self.bottom + 1
+                    self._tower_height = max(self._tower_height, rock_top)
 
                     self.height_history.append(self.tower_height)
 
     def print(self):
-        arr = np.ones((self.tower_height + 1, self.width))
-        for coord in self.coords_taken:
-            arr[coord.y, coord.x] = 0
+        height = self.tower_height - self.bottom
+        arr = np.where(self.grid.inner[:height] == self.ROCK, 0, 1)
 
-        arr = np.flip(arr, 0)[:-1, :]
+        arr = np.flip(arr, 0)
         print(arr)
 
 
@@ -190,20 +210,17 @@ def calculate_height(rocks_to_fall: int,
     return total_height
 
 
-if __name__ == '__main__':
-    path = './input.txt'
-
-    # number of rocks for simulation. Pattern search will be performed on the results
-    rocks_for_simulation = 10000
-
+def read_jet_pattern(path: str) -> str:
     with open(path, 'r', encoding='utf-8') as f:
-        jet_pattern = f.read().strip()
+        return f.read().strip()
 
-    chamber = Chamber(7, 0, len(rock_types), jet_pattern)
 
-    chamber.simulate(rocks_for_simulation)
+def find_height_increase_pattern(path: str, rocks_for_simulation: int) -> Tuple[List[int], List[int]]:
+    """Simulate given number of rocks and return (offset_height_increase, cycle_height_increase)."""
+    chamber = Chamber(7, 0, len(rock_types), read_jet_pattern(path))
 
-    print(chamber.tower_height)
+    with instrument.phase('day_17.simulate'):
+        chamber.simulate(rocks_for_simulation)
 
     height_history = chamber.height_history
 
@@ -213,11 +230,8 @@ if __name__ == '__main__':
 
     offset, cycle_len = find_pattern(height_increase)
 
-    if offset and cycle_len:
-        print(f'Pattern found. {offset=}, {cycle_len=}')
-    else:
-        print('pattern not found')
-        exit()
+    if not (offset and cycle_len):
+        raise ValueError('Pattern not found')
 
     # offset height
     offset_height_increase = height_increase[:offset]
@@ -225,10 +239,29 @@ if __name__ == '__main__':
     cycle_height_increase = height_increase[offset: offset + cycle_len]
 
     # sanity check
-    rocks_to_fall = rocks_for_simulation
-    _height = calculate_height(rocks_to_fall, offset_height_increase, cycle_height_increase)
-    print(_height)
-    assert _height == chamber.tower_height
+    if calculate_height(rocks_for_simulation, offset_height_increase,
+                        cycle_height_increase) != chamber.tower_height:
+        raise ValueError('Pattern does not match the simulation')
+
+    return offset_height_increase, cycle_height_increase
+
+
+def part1(path: str, rocks_for_simulation: int = 10000) -> int:
+    return calculate_height(2022, *find_height_increase_pattern(path, rocks_for_simulation))
+
+
+def part2(path: str, rocks_for_simulation: int = 10000) -> int:
+    return calculate_height(1000000000000, *find_height_increase_pattern(path, rocks_for_simulation))
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    # number of rocks for simulation. Pattern search will be performed on the results
+    rocks_for_simulation = 10000
+
+    offset_height_increase, cycle_height_increase = find_height_increase_pattern(path, rocks_for_simulation)
+    print(f'Pattern found. offset={len(offset_height_increase)}, cycle_len={len(cycle_height_increase)}')
 
     # part 1
     rocks_to_fall = 2022
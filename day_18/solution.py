@@ -1,6 +1,9 @@
 from typing import NamedTuple
 
-from day_02.solution import yield_rows
+import numpy as np
+
+from common.grid import Grid
+from common.integers import read_integer_rows
 
 
 class Coord(NamedTuple):
@@ -15,101 +18,75 @@ class Coord(NamedTuple):
         return f'({self.x}, {self.y}, {self.z})'
 
 
-def adjacent_positions(position: Coord):
-    neighbor_positions_relative = [Coord(-1, 0, 0),
-                                   Coord(1, 0, 0),
-                                   Coord(0, -1, 0),
-                                   Coord(0, 1, 0),
-                                   Coord(0, 0, -1),
-                                   Coord(0, 0, 1)]
+LAVA = 1
+WATER = 2
 
-    for rel_pos in neighbor_positions_relative:
-        yield position + rel_pos
 
+def create_grid(lava_bits_positions: set[Coord]) -> Grid:
+    """Grid of the space around the lava with one layer of empty cells on every side (coords are shifted)."""
+    coord_mins = [min(pos[i] for pos in lava_bits_positions) for i in range(3)]
+    coord_maxs = [max(pos[i] for pos in lava_bits_positions) for i in range(3)]
 
-def is_adjacent_to_water(position: Coord, water_positions: set[Coord]) -> bool:
-    for adjacent_position in adjacent_positions(position):
-        if adjacent_position in water_positions:
-            return True
-    return False
+    grid = Grid(tuple(_max - _min + 3 for _min, _max in zip(coord_mins, coord_maxs)))
+
+    lava = np.array(list(lava_bits_positions)) - coord_mins + 1
+    grid.inner[lava[:, 0], lava[:, 1], lava[:, 2]] = LAVA
+    return grid
 
 
 def calculate_surface(lava_bits_positions: set[Coord]) -> int:
-    total_surface = 0
-    for lava_bit_position in lava_bits_positions:
-        exposed_sides = 6
-        for adjacent_position in adjacent_positions(lava_bit_position):
-            if adjacent_position in lava_bits_positions:
-                exposed_sides -= 1
-        total_surface += exposed_sides
-    return total_surface
+    lava = create_grid(lava_bits_positions).inner == LAVA
 
+    # every pair of adjacent lava bits hides two sides
+    adjacent_pairs = 0
+    for axis in range(3):
+        along_axis = np.moveaxis(lava, axis, 0)
+        adjacent_pairs += int(np.count_nonzero(along_axis[1:] & along_axis[:-1]))
 
-if __name__ == '__main__':
-    path = './input.txt'
+    return 6 * int(np.count_nonzero(lava)) - 2 * adjacent_pairs
 
-    data = list(yield_rows(path))
-    data = [row.split(',') for row in data]
-    data = [[int(pos) for pos in row] for row in data]
-    data = [Coord(*row) for row in data]
 
-    lava_bits_positions = set(data)
+def calculate_exterior_surface(lava_bits_positions: set[Coord]) -> int:
+    grid = create_grid(lava_bits_positions)
+    data = grid.data
 
-    # part 1
-    print(calculate_surface(lava_bits_positions))
+    # flood the space with water, starting from a corner (which is never a lava bit)
+    start = grid.index(0, 0, 0)
+    data[start] = WATER
+    water_positions = [start]
 
-    # part 2 - simulation
+    surface = 0
+    while water_positions:
+        position = water_positions.pop()
+        for offset in grid.neighbour_offsets:
+            adjacent_position = position + offset
+            value = data[adjacent_position]
+            if value == LAVA:
+                # side of the lava bit is reachable by water
+                surface += 1
+            elif not value:
+                data[adjacent_position] = WATER
+                water_positions.append(adjacent_position)
+    return surface
 
-    # min and max value for each coord ('edges' of the 3D space)
-    coord_mins = [min(pos[i] for pos in lava_bits_positions) for i in range(3)]
-    coord_maxs = [max(pos[i] for pos in lava_bits_positions) for i in range(3)]
 
-    # initial water positions (just over the 'edges')
-    water_positions = set(
-        [Coord(coord_mins[0] - 1, y, z)
-         for y in range(coord_mins[1], coord_maxs[1] + 1)
-         for z in range(coord_mins[2], coord_maxs[2] + 1)] +
-        [Coord(coord_maxs[0] + 1, y, z)
-         for y in range(coord_mins[1], coord_maxs[1] + 1)
-         for z in range(coord_mins[2], coord_maxs[2] + 1)] +
-        [Coord(x, coord_mins[1] - 1, z)
-         for x in range(coord_mins[0], coord_maxs[0] + 1)
-         for z in range(coord_mins[2], coord_maxs[2] + 1)] +
-        [Coord(x, coord_maxs[1] + 1, z)
-         for x in range(coord_mins[0], coord_maxs[0] + 1)
-         for z in range(coord_mins[2], coord_maxs[2] + 1)] +
-        [Coord(x, y, coord_mins[2] - 1)
-         for x in range(coord_mins[0], coord_maxs[0] + 1)
-         for y in range(coord_mins[1], coord_maxs[1] + 1)] +
-        [Coord(x, y, coord_maxs[2] + 1)
-         for x in range(coord_mins[0], coord_maxs[0] + 1)
-         for y in range(coord_mins[1], coord_maxs[1] + 1)]
-    )
-
-    # empty space positions (initially positions in 'space' without lava bits)
-    empty_space_positions = set([Coord(x, y, z)
-                                 for x in range(coord_mins[0], coord_maxs[0] + 1)
-                                 for y in range(coord_mins[1], coord_maxs[1] + 1)
-                                 for z in range(coord_mins[2], coord_maxs[2] + 1)
-                                 if Coord(x, y, z) not in lava_bits_positions])
-
-    # simulate water flooding the space
-    water_expanded = True
-    while water_expanded:
-        water_expanded = False
-        water_will_reach_positions = []
-        for empty_space_position in empty_space_positions:
-            if is_adjacent_to_water(empty_space_position, water_positions):
-                water_will_reach_positions.append(empty_space_position)
-
-        if water_will_reach_positions:
-            water_expanded = True
-            water_positions.update(water_will_reach_positions)
-            empty_space_positions = empty_space_positions.difference(water_will_reach_positions)
-
-    # now treat all 'not flooded' positions as lava positions
-    lava_bits_positions.update(empty_space_positions)
-
-    # and calculate surface for 'updated' lava positions
+def load_lava_bits_positions(path: str) -> set[Coord]:
+    return {Coord(*row) for row in read_integer_rows(path, 3).tolist()}
+
+
+def part1(path: str) -> int:
+    return calculate_surface(load_lava_bits_positions(path))
+
+
+def part2(path: str) -> int:
+    return calculate_exterior_surface(load_lava_bits_positions(path))
+
+
+if __name__ == '__main__':
+    path = './input.txt'
+
+    # part 1
+    print(part1(path))
+
     # part 2
-    print(calculate_surface(lava_bits_positions))
+    print(part2(path))
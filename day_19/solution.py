@@ -3,7 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Generator
 
-from day_02.solution import yield_rows
+from common import instrument
+from common.cache import cached_parser
+from common.integers import read_integer_rows
+from common.reader import yield_rows
 
 
 @dataclass
@@ -113,6 +116,8 @@ def find_buildable_robots(state: SimulationState, blueprint: list[RobotRecipe])
 
 
 def simulate(state: SimulationState, blueprint: list[RobotRecipe], max_steps: int) -> list[SimulationState]:
+    if instrument.enabled:
+        instrument.count('day_19.states')
     prev_buildable_robots = find_buildable_robots(state, blueprint)
 
     state = state.update_resources()
@@ -124,7 +129,6 @@ def simulate(state: SimulationState, blueprint: list[RobotRecipe], max_steps: in
 
     # building a robot that was available in a previous step would never be an optimal solution
     new_buildable_robots = set(buildable_robots).difference(prev_buildable_robots)
-    print(buildable_robots, new_buildable_robots)
     if not new_buildable_robots:
         # nothing to build, waiting
         return simulate(state.from_current(), blueprint, max_steps)
@@ -143,6 +147,34 @@ def simulate(state: SimulationState, blueprint: list[RobotRecipe], max_steps: in
 
         return possible_states
 
+
+def find_max_geodes(blueprint: list[RobotRecipe], max_steps: int) -> int:
+    with instrument.phase('day_19.simulate'):
+        states = simulate(SimulationState(1, 1, 0, 0, 0, 0, 0, 0, 0), blueprint, max_steps)
+    return max(state.collected_geode for state in states)
+
+
+def blueprint_from_integers(blueprint_id: int, ore_robot_ore: int, clay_robot_ore: int, obsidian_robot_ore: int,
+                            obsidian_robot_clay: int, geode_robot_ore: int,
+                            geode_robot_obsidian: int) -> tuple[int, list[RobotRecipe]]:
+    return blueprint_id, [RobotRecipe('ore', cost_ore=ore_robot_ore),
+                          RobotRecipe('clay', cost_ore=clay_robot_ore),
+                          RobotRecipe('obsidian', cost_ore=obsidian_robot_ore, cost_clay=obsidian_robot_clay),
+                          RobotRecipe('geode', cost_ore=geode_robot_ore, cost_obsidian=geode_robot_obsidian)]
+
+
+@cached_parser()
+def load_blueprints(path: str) -> list[tuple[int, list[RobotRecipe]]]:
+    # Every blueprint has the same 7 integers (id and costs), in the same order
+    return [blueprint_from_integers(*row) for row in read_integer_rows(path, 7).tolist()]
+
+
+def part1(path: str, total_steps: int = 24) -> int:
+    blueprints = load_blueprints(path)
+
+    return sum(blueprint_id * find_max_geodes(blueprint, total_steps) for blueprint_id, blueprint in blueprints)
+
+
 if __name__ == '__main__':
     # path = 'day_19/input2.txt'
     path = './input2.txt'
@@ -0,0 +1,11 @@
+import random
+from typing import Generator
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """Calorie lists - items of every elf are separated by an empty line."""
+    for elf_index in range(250 * scale):
+        if elf_index:
+            yield ''
+        for _ in range(rng.randint(1, 15)):
+            yield str(rng.randint(1000, 60000))
@@ -0,0 +1,8 @@
+import random
+from typing import Generator
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """Strategy guide - one round per row, e.g. 'A Y'."""
+    for _ in range(2500 * scale):
+        yield f'{rng.choice("ABC")} {rng.choice("XYZ")}'
@@ -0,0 +1,50 @@
+import random
+import string
+from typing import Generator, List
+
+items = string.ascii_lowercase + string.ascii_uppercase
+
+
+def _compartment(shared_item: str, pool: List[str], rng: random.Random) -> List[str]:
+    compartment = [shared_item] + [rng.choice(pool) for _ in range(rng.randint(3, 15)) if pool]
+    rng.shuffle(compartment)
+    return compartment
+
+
+def _rucksack(badge: str, pool: List[str], rng: random.Random) -> str:
+    """
+    Compartments share exactly one item type. The badge is the only item type which can also appear in other
+    rucksacks of the group (pools of the group are disjoint).
+    """
+    candidates = pool + [badge]
+    shared_item = rng.choice(candidates)
+    remaining = [item for item in candidates if item != shared_item]
+    rng.shuffle(remaining)
+
+    split_index = rng.randint(0, len(remaining))
+    first_pool, second_pool = remaining[:split_index], remaining[split_index:]
+
+    first = _compartment(shared_item, first_pool, rng)
+    second = _compartment(shared_item, second_pool, rng)
+
+    # Make sure that the badge is in the rucksack
+    if badge not in first and badge not in second:
+        (first if badge in first_pool else second).append(badge)
+
+    # Both compartments have the same size
+    while len(first) < len(second):
+        first.append(rng.choice(first_pool) if first_pool else shared_item)
+    while len(second) < len(first):
+        second.append(rng.choice(second_pool) if second_pool else shared_item)
+
+    return ''.join(first + second)
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """Rucksacks in groups of three."""
+    for _ in range(100 * scale):
+        badge = rng.choice(items)
+        other_items = [item for item in items if item != badge]
+        rng.shuffle(other_items)
+        for pool_index in range(3):
+            yield _rucksack(badge, other_items[pool_index * 17: (pool_index + 1) * 17], rng)
@@ -0,0 +1,14 @@
+import random
+from typing import Generator
+
+
+def _section_range(rng: random.Random) -> str:
+    start = rng.randint(1, 99)
+    end = rng.randint(start, 99)
+    return f'{start}-{end}'
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """Pairs of section assignments, e.g. '2-4,6-8'."""
+    for _ in range(1000 * scale):
+        yield f'{_section_range(rng)},{_section_range(rng)}'
@@ -0,0 +1,31 @@
+import random
+import string
+from typing import Generator
+
+stacks_count = 9
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """
+    Drawing of 9 stacks of crates and the rearrangement procedure. Moves never take the last crate off a stack,
+    so every stack has a top crate at the end.
+    """
+    stack_sizes = [rng.randint(1, 8 * scale) for _ in range(stacks_count)]
+    # At least one stack has to have more than one crate, otherwise nothing can be moved
+    stack_sizes[0] = max(stack_sizes[0], 2)
+
+    for level in reversed(range(max(stack_sizes))):
+        yield ' '.join(f'[{rng.choice(string.ascii_uppercase)}]' if level < size else '   ' for size in stack_sizes)
+    yield ' ' + '   '.join(str(stack_id) for stack_id in range(1, stacks_count + 1)) + ' '
+
+    yield ''
+
+    for _ in range(500 * scale):
+        from_stack = rng.choice([index for index, size in enumerate(stack_sizes) if size > 1])
+        to_stack = rng.choice([index for index in range(stacks_count) if index != from_stack])
+        how_many = rng.randint(1, stack_sizes[from_stack] - 1)
+
+        stack_sizes[from_stack] -= how_many
+        stack_sizes[to_stack] += how_many
+
+        yield f'move {how_many} from {from_stack + 1} to {to_stack + 1}'
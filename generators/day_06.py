@@ -0,0 +1,16 @@
+import random
+import string
+from typing import Generator
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """
+    Datastream buffer. Windows of 4 distinct characters are impossible in the first third (3 letter alphabet)
+    and windows of 14 distinct characters are impossible until the last third (4 letter alphabet).
+    """
+    part_length = 1365 * scale
+    chars = [rng.choice('abc') for _ in range(part_length)]
+    chars += [rng.choice('abcd') for _ in range(part_length)]
+    chars += rng.sample(string.ascii_lowercase, 14)
+    chars += [rng.choice(string.ascii_lowercase) for _ in range(part_length - 14)]
+    yield ''.join(chars)
@@ -0,0 +1,45 @@
+import random
+import string
+from typing import Generator, List
+
+
+def _name(rng: random.Random) -> str:
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(1, 8)))
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """Terminal output of browsing a random directory tree (depth-first, every directory is listed once)."""
+    dirs_count = 180 * scale
+
+    # Random tree - parent of every directory is one of the previously created directories
+    children: List[List[int]] = [[] for _ in range(dirs_count)]
+    for dir_index in range(1, dirs_count):
+        children[rng.randrange(dir_index)].append(dir_index)
+
+    yield '$ cd /'
+
+    # (directory index, directory name); None means 'go back to the parent directory'
+    to_visit = [(0, '/')]
+    first = True
+    while to_visit:
+        entry = to_visit.pop()
+        if entry is None:
+            yield '$ cd ..'
+            continue
+
+        dir_index, dir_name = entry
+        if not first:
+            yield f'$ cd {dir_name}'
+        first = False
+
+        yield '$ ls'
+        child_names = [f'{_name(rng)}{child}' for child in children[dir_index]]
+        listing = [f'dir {name}' for name in child_names]
+        listing += [f'{rng.randint(1000, 300000)} {_name(rng)}.{rng.choice(["txt", "dat", "log", "lst"])}'
+                    for _ in range(rng.randint(0, 4))]
+        rng.shuffle(listing)
+        yield from listing
+
+        for child, name in reversed(list(zip(children[dir_index], child_names))):
+            to_visit.append(None)
+            to_visit.append((child, name))
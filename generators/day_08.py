@@ -0,0 +1,10 @@
+import math
+import random
+from typing import Generator
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """Square grid of tree heights."""
+    side = round(99 * math.sqrt(scale))
+    for _ in range(side):
+        yield ''.join(rng.choice('0123456789') for _ in range(side))
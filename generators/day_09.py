@@ -0,0 +1,8 @@
+import random
+from typing import Generator
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """Head motions, e.g. 'R 4'."""
+    for _ in range(2000 * scale):
+        yield f'{rng.choice("LRUD")} {rng.randint(1, 19)}'
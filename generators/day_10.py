@@ -0,0 +1,17 @@
+import random
+from typing import Generator
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """CPU program running for at least 240 cycles per scale unit. X register is kept close to the CRT width."""
+    reg_x = 1
+    cycle = 0
+    while cycle < 240 * scale:
+        if rng.random() < 0.3:
+            cycle += 1
+            yield 'noop'
+        else:
+            value = rng.choice([v for v in range(-15, 16) if v != 0 and -1 <= reg_x + v <= 40])
+            reg_x += value
+            cycle += 2
+            yield f'addx {value}'
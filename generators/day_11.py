@@ -0,0 +1,36 @@
+import math
+import random
+from typing import Generator
+
+divisors = [2, 3, 5, 7, 11, 13, 17, 19, 23]
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """Monkey notes. Both the number of monkeys and the number of items grow with the scale."""
+    monkeys_factor = math.ceil(math.sqrt(scale))
+    monkeys_count = 8 * monkeys_factor
+    items_factor = math.ceil(scale / monkeys_factor)
+
+    for index in range(monkeys_count):
+        if index:
+            yield ''
+
+        items = [rng.randint(50, 99) for _ in range(rng.randint(1, 8) * items_factor)]
+
+        operation_type = rng.random()
+        if index % 8 == 0 and operation_type < 0.5:
+            operation = 'old * old'
+        elif operation_type < 0.5:
+            operation = f'old * {rng.randint(2, 19)}'
+        else:
+            operation = f'old + {rng.randint(1, 8)}'
+
+        monkey_when_test_true, monkey_when_test_false = rng.sample(
+            [other for other in range(monkeys_count) if other != index], 2)
+
+        yield f'Monkey {index}:'
+        yield f'  Starting items: {", ".join(str(item) for item in items)}'
+        yield f'  Operation: new = {operation}'
+        yield f'  Test: divisible by {rng.choice(divisors)}'
+        yield f'    If true: throw to monkey {monkey_when_test_true}'
+        yield f'    If false: throw to monkey {monkey_when_test_false}'
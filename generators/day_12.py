@@ -0,0 +1,28 @@
+import math
+import random
+import string
+from typing import Generator
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """
+    Heightmap which rises from 'a' in the first column to 'z' in the last one. One row (with S and E) rises by
+    at most one step per column, so E is always reachable from S. Other squares are randomly lowered.
+    """
+    rows = max(1, round(41 * math.sqrt(scale)))
+    cols = max(26, round(161 * math.sqrt(scale)))
+    path_row = rng.randrange(rows)
+
+    for row in range(rows):
+        elevations = []
+        for col in range(cols):
+            elevation = min(25, col * 26 // cols)
+            if row != path_row and rng.random() < 0.5:
+                elevation = rng.randint(0, elevation)
+            elevations.append(string.ascii_lowercase[elevation])
+
+        if row == path_row:
+            elevations[0] = 'S'
+            elevations[-1] = 'E'
+
+        yield ''.join(elevations)
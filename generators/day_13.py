@@ -0,0 +1,38 @@
+import json
+import random
+from typing import Generator, List, Union
+
+
+def _packet_content(rng: random.Random, depth: int) -> List[Union[List, int]]:
+    content = []
+    for _ in range(rng.randint(0, 4)):
+        if depth < 4 and rng.random() < 0.3:
+            content.append(_packet_content(rng, depth + 1))
+        else:
+            content.append(rng.randint(0, 10))
+    return content
+
+
+def _packet(leading_value: int, rng: random.Random) -> List[Union[List, int]]:
+    """
+    The leading value (reached by following the first elements) is unique, so no two packets are equal
+    and the order of every pair can be determined.
+    """
+    first_element = leading_value
+    for _ in range(rng.randint(0, 2)):
+        first_element = [first_element] + _packet_content(rng, 2)
+    return [first_element] + _packet_content(rng, 1)
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """Pairs of packets separated by an empty line."""
+    pairs_count = 150 * scale
+    # 2 and 6 are used by the divider packets
+    leading_values = rng.sample([value for value in range(2 * pairs_count + 2) if value not in (2, 6)],
+                                2 * pairs_count)
+
+    for pair_index in range(pairs_count):
+        if pair_index:
+            yield ''
+        yield json.dumps(_packet(leading_values[2 * pair_index], rng), separators=(',', ':'))
+        yield json.dumps(_packet(leading_values[2 * pair_index + 1], rng), separators=(',', ':'))
@@ -0,0 +1,59 @@
+import math
+import random
+from typing import Generator, List, Set, Tuple
+
+
+def _chute(depth: int, x_min: int, x_max: int, rng: random.Random) -> Set[Tuple[int, int]]:
+    """
+    Random path of down / down-left / down-right steps from the sand source to the bottom. Rocks are never placed
+    on it, so sand always finds a way to the endless void (otherwise the cave can fill up to the source).
+    """
+    x = 500
+    chute = set()
+    for y in range(depth + 1):
+        chute.add((x, y))
+        x = min(x_max, max(x_min, x + rng.choice([-1, 0, 1])))
+    return chute
+
+
+def _rock_path(x: int, y: int, depth: int, rng: random.Random) -> List[Tuple[int, int]]:
+    if rng.random() < 0.5:
+        # Cup
+        width = rng.randint(2, 15)
+        bottom = min(depth, y + rng.randint(2, 10))
+        return [(x, y), (x, bottom), (x + width, bottom), (x + width, rng.randint(13, bottom))]
+
+    points = [(x, y)]
+    horizontal = rng.random() < 0.5
+    for _ in range(rng.randint(1, 5)):
+        length = rng.randint(1, 8)
+        if horizontal:
+            x = x + rng.choice([-length, length])
+        else:
+            y = min(depth, max(13, y + rng.choice([-length, length])))
+        horizontal = not horizontal
+        points.append((x, y))
+    return points
+
+
+def _path_rocks(points: List[Tuple[int, int]]) -> Generator[Tuple[int, int], None, None]:
+    for (x1, y1), (x2, y2) in zip(points, points[1:]):
+        for x in range(min(x1, x2), max(x1, x2) + 1):
+            for y in range(min(y1, y2), max(y1, y2) + 1):
+                yield x, y
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """Rock paths made of horizontal and vertical lines. The cave depth grows with the square root of the scale."""
+    depth = round(170 * math.sqrt(scale))
+    x_min = 500 - depth // 4
+    x_max = 500 + depth // 4
+    chute = _chute(depth, x_min, x_max, rng)
+
+    paths_count = 0
+    while paths_count < 150 * scale:
+        points = _rock_path(rng.randint(x_min, x_max), rng.randint(13, depth), depth, rng)
+        if any(rock in chute for rock in _path_rocks(points)):
+            continue
+        paths_count += 1
+        yield ' -> '.join(f'{x},{y}' for x, y in points)
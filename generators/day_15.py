@@ -0,0 +1,49 @@
+import math
+import random
+from typing import Generator, Tuple
+
+search_area_size = 4000000
+
+
+def _log(sensor: Tuple[int, int], radius: int) -> str:
+    beacon = (sensor[0] + radius, sensor[1])
+    return f'Sensor at x={sensor[0]}, y={sensor[1]}: closest beacon is at x={beacon[0]}, y={beacon[1]}'
+
+
+def _is_aligned_with_grid(value: int, grid_size: int) -> bool:
+    """Sensor area borders have to be at least 2 apart from the borders of the grid sensor areas"""
+    return value % grid_size in (1, 3, grid_size - 1, grid_size - 3)
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """
+    Sensor reports with exactly one position within the search area which is not covered by any sensor.
+
+    The search area is covered by a grid of sensors (spacing = radius). Grid sensors close to the distress beacon
+    are skipped and the surroundings of the beacon are covered by four diagonal sensors whose areas are
+    just one step away from it - the same layout which the part 2 solution relies on.
+    """
+    grid_count = math.ceil(4 * math.sqrt(scale))
+    grid_size = math.ceil(search_area_size / grid_count)
+    diagonal_offset = 2 * grid_size
+
+    while True:
+        distress_beacon = (rng.randint(0, search_area_size), rng.randint(0, search_area_size))
+        if not _is_aligned_with_grid(distress_beacon[0] - distress_beacon[1], grid_size) and \
+                not _is_aligned_with_grid(distress_beacon[0] + distress_beacon[1], grid_size):
+            break
+
+    sensors = []
+    for grid_x in range(-1, grid_count + 2):
+        for grid_y in range(-1, grid_count + 2):
+            sensor = (grid_x * grid_size, grid_y * grid_size)
+            if abs(sensor[0] - distress_beacon[0]) + abs(sensor[1] - distress_beacon[1]) > grid_size:
+                sensors.append((sensor, grid_size))
+
+    for x_direction, y_direction in [(1, 1), (1, -1), (-1, 1), (-1, -1)]:
+        sensor = (distress_beacon[0] + x_direction * diagonal_offset, distress_beacon[1] + y_direction * diagonal_offset)
+        sensors.append((sensor, 2 * diagonal_offset - 1))
+
+    rng.shuffle(sensors)
+    for sensor, radius in sensors:
+        yield _log(sensor, radius)
@@ -0,0 +1,52 @@
+import math
+import random
+import string
+from typing import Generator, List
+
+# Puzzle inputs have 15 of them, but the part 2 search takes about 4 times longer with every next one - 10 of them
+# keep it in seconds (over 5 minutes with 15)
+meaningful_valves_count = 10
+
+
+def _valve_name(index: int, width: int) -> str:
+    if index == 0:
+        # Starting valve
+        return 'AA'
+    name = ''
+    for _ in range(width):
+        index, letter_index = divmod(index, len(string.ascii_uppercase))
+        name = string.ascii_uppercase[letter_index] + name
+    return name
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """
+    Connected graph of valves. The graph grows with the scale, the number of valves with a positive flow rate
+    stays the same at meaningful_valves_count (the search space of the solution is exponential in it), whatever
+    the scale.
+    """
+    valves_count = 60 * scale
+    name_width = max(2, math.ceil(math.log(valves_count, len(string.ascii_uppercase))))
+    names = [_valve_name(index, name_width) for index in range(valves_count)]
+
+    tunnels: List[set] = [set() for _ in range(valves_count)]
+    # Spanning tree keeps the graph connected, then some extra tunnels are added
+    for index in range(1, valves_count):
+        other = rng.randrange(index)
+        tunnels[index].add(other)
+        tunnels[other].add(index)
+    for _ in range(valves_count // 2):
+        first, second = rng.sample(range(valves_count), 2)
+        tunnels[first].add(second)
+        tunnels[second].add(first)
+
+    flow_rates = [0] * valves_count
+    for index in rng.sample(range(1, valves_count), min(meaningful_valves_count, valves_count - 1)):
+        flow_rates[index] = rng.randint(3, 25)
+
+    for index in range(valves_count):
+        destinations = ', '.join(names[other] for other in sorted(tunnels[index]))
+        if len(tunnels[index]) == 1:
+            yield f'Valve {names[index]} has flow rate={flow_rates[index]}; tunnel leads to valve {destinations}'
+        else:
+            yield f'Valve {names[index]} has flow rate={flow_rates[index]}; tunnels lead to valves {destinations}'
@@ -0,0 +1,7 @@
+import random
+from typing import Generator
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """Jet pattern - a single line of '<' and '>'."""
+    yield ''.join(rng.choice('<>') for _ in range(10091 * scale))
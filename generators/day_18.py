@@ -0,0 +1,20 @@
+import math
+import random
+from typing import Generator
+
+# Share of positions inside the droplet taken by cubes. It is high enough to leave air pockets inside the droplet.
+density = 0.7
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """Unique 1x1x1 cubes forming a roughly spherical lava droplet of about 2000 cubes per scale unit."""
+    cubes_count = 2000 * scale
+    radius = (cubes_count / density / (4 / 3 * math.pi)) ** (1 / 3)
+    center = math.ceil(radius)
+
+    for x in range(2 * center + 1):
+        for y in range(2 * center + 1):
+            for z in range(2 * center + 1):
+                if (x - center) ** 2 + (y - center) ** 2 + (z - center) ** 2 <= radius ** 2 and \
+                        rng.random() < density:
+                    yield f'{x},{y},{z}'
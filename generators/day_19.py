@@ -0,0 +1,12 @@
+import random
+from typing import Generator
+
+
+def generate(scale: int, rng: random.Random) -> Generator[str, None, None]:
+    """Robot blueprints, one per row."""
+    for blueprint_id in range(1, 30 * scale + 1):
+        yield f'Blueprint {blueprint_id}: ' \
+              f'Each ore robot costs {rng.randint(2, 4)} ore. ' \
+              f'Each clay robot costs {rng.randint(2, 4)} ore. ' \
+              f'Each obsidian robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} clay. ' \
+              f'Each geode robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} obsidian.'
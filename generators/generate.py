@@ -0,0 +1,35 @@
+import argparse
+import importlib
+import os
+import random
+from typing import Generator
+
+
+def generate_rows(day: int, scale: int = 1, seed: int = 0) -> Generator[str, None, None]:
+    """Rows of a random, valid input for a given day. The scale is a multiple of the puzzle input size."""
+    if scale < 1:
+        raise ValueError('Scale has to be a positive integer')
+    generator = importlib.import_module(f'generators.day_{day:02d}')
+    return generator.generate(scale, random.Random(seed))
+
+
+def write_input(day: int, path: str, scale: int = 1, seed: int = 0) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        for row in generate_rows(day, scale, seed):
+            f.write(row)
+            f.write('\n')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a random input for a given day.')
+    parser.add_argument('day', type=int)
+    parser.add_argument('output', help='output file path')
+    parser.add_argument('--scale', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    write_input(args.day, args.output, args.scale, args.seed)
@@ -0,0 +1,51 @@
+import argparse
+import os
+import sys
+import time
+
+from common import cache, instrument
+from runner.registry import experimental, solvers, find_solver, load_solver
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='python -m runner', description='Run a single solver.')
+    parser.add_argument('day', type=int, nargs='?')
+    parser.add_argument('part', type=int, nargs='?')
+    parser.add_argument('--variant', default='default')
+    parser.add_argument('--input', help='input file, day_XX/input.txt by default')
+    parser.add_argument('--list', action='store_true', help='list registered solvers')
+    parser.add_argument('--instrument', action='store_true', help='print phase timers and counters of the solver')
+    parser.add_argument('--profile-memory', action='store_true', help='with --instrument, also print memory peaks')
+    parser.add_argument('--cache', action='store_true',
+                        help='store parsed inputs in AOC_CACHE_DIR and reuse them (off by default)')
+    args = parser.parse_args()
+
+    if args.list or args.day is None or args.part is None:
+        for (day, part, variant), target in solvers.items():
+            note = ' (experimental)' if (day, part, variant) in experimental else ''
+            print(f'day {day:2d} part {part} {variant:<12} {target}{note}')
+        sys.exit(0)
+
+    if args.cache:
+        cache.enable()
+
+    path = args.input or os.path.join(f'day_{args.day:02d}', 'input.txt')
+
+    try:
+        target = find_solver(args.day, args.part, args.variant)
+    except ValueError as e:
+        sys.exit(str(e))
+
+    st = time.perf_counter()
+    solver = load_solver(target)
+    import_time = time.perf_counter() - st
+
+    instrument.enable(args.instrument, memory=args.profile_memory)
+
+    st = time.perf_counter()
+    answer = solver(path)
+    solve_time = time.perf_counter() - st
+
+    print(answer)
+    print(f'import: {import_time:.4f} s, solve: {solve_time:.4f} s', file=sys.stderr)
+    if args.instrument and (report := instrument.report()):
+        print(report, file=sys.stderr)
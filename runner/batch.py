@@ -0,0 +1,133 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Any, Iterable, List, Optional
+
+from common import cache
+from runner.registry import experimental, solvers, find_solver, load_solver
+
+
+@dataclass(frozen=True)
+class Job:
+    day: int
+    part: int
+    variant: str
+    path: str
+
+    @property
+    def target(self) -> str:
+        return find_solver(self.day, self.part, self.variant)
+
+
+@dataclass
+class JobResult:
+    job: Job
+    answer: Any = None
+    time: float = 0.0
+    error: Optional[str] = None
+
+
+def collect_jobs(days: Iterable[int], parts: Iterable[int], inputs_dirs: Iterable[str],
+                 variants: Optional[Iterable[str]] = None, include_experimental: bool = False) -> List[Job]:
+    """
+    Create a job for every registered solver and every day_XX/*.txt file found in the input directories.
+    Experimental solvers are skipped unless include_experimental is set.
+    """
+    jobs = []
+    for inputs_dir in inputs_dirs:
+        for day in days:
+            paths = sorted(glob.glob(os.path.join(inputs_dir, f'day_{day:02d}', '*.txt')))
+            for (solver_day, part, variant) in solvers:
+                if solver_day != day or part not in parts or (variants is not None and variant not in variants):
+                    continue
+                if (solver_day, part, variant) in experimental and not include_experimental:
+                    continue
+                jobs.extend(Job(day, part, variant, path) for path in paths)
+    return jobs
+
+
+def warm_up(targets: List[str]) -> None:
+    """Import all solver modules once per worker, so jobs do not pay for the imports."""
+    for target in targets:
+        load_solver(target)
+
+
+def solve(job: Job) -> JobResult:
+    result = JobResult(job)
+    st = time.perf_counter()
+    try:
+        result.answer = load_solver(job.target)(job.path)
+    except Exception:
+        result.error = traceback.format_exc(limit=-1).strip()
+    result.time = time.perf_counter() - st
+    return result
+
+
+def run_batch(jobs: List[Job], workers: Optional[int] = None) -> List[JobResult]:
+    """Solve the jobs in a process pool, results are returned in the order of the jobs."""
+    targets = sorted({job.target for job in jobs})
+    # The biggest inputs are submitted first, so they don't end up as the last jobs of an otherwise idle pool
+    order = sorted(range(len(jobs)), key=lambda i: os.path.getsize(jobs[i].path), reverse=True)
+
+    results: List[Optional[JobResult]] = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_up, initargs=(targets,)) as executor:
+        futures = {i: executor.submit(solve, jobs[i]) for i in order}
+        for i, future in futures.items():
+            results[i] = future.result()
+    return results
+
+
+def format_report(results: List[JobResult], wall_time: float) -> str:
+    lines = []
+    for result in results:
+        job = result.job
+        answer = result.error.splitlines()[-1] if result.error else repr(result.answer)
+        if len(answer) > 40:
+            answer = answer[:37] + '...'
+        lines.append(f'day {job.day:2d} part {job.part} {job.variant:<12} {job.path:<40} '
+                     f'{result.time:9.4f} s  {"ERROR " if result.error else ""}{answer}')
+
+    failed = sum(1 for result in results if result.error)
+    total_time = sum(result.time for result in results)
+    lines.append(f'{len(results)} jobs, {failed} failed, solve time {total_time:.2f} s, wall time {wall_time:.2f} s')
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='python -m runner.batch', description='Solve many inputs in parallel.')
+    parser.add_argument('--days', type=int, nargs='+', default=list(range(1, 26)))
+    parser.add_argument('--parts', type=int, nargs='+', default=[1, 2])
+    parser.add_argument('--variants', nargs='+', help='solver variants, all registered variants by default')
+    parser.add_argument('--inputs', nargs='+', default=['.'], help='directories with day_XX/*.txt input files')
+    parser.add_argument('--workers', type=int, help='number of worker processes, CPU count by default')
+    parser.add_argument('--json', help='also write the results to this json file')
+    parser.add_argument('--include-experimental', action='store_true',
+                        help='also run experimental solvers (they may run for a very long time)')
+    parser.add_argument('--cache', action='store_true',
+                        help='store parsed inputs in AOC_CACHE_DIR and reuse them (off by default)')
+    args = parser.parse_args()
+
+    if args.cache:
+        cache.enable()
+
+    jobs = collect_jobs(args.days, args.parts, args.inputs, args.variants, args.include_experimental)
+    if not jobs:
+        sys.exit('No inputs found')
+
+    st = time.perf_counter()
+    results = run_batch(jobs, args.workers)
+    wall_time = time.perf_counter() - st
+
+    print(format_report(results, wall_time))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump([asdict(result) for result in results], f, indent=2, default=str)
+
+    sys.exit(1 if any(result.error for result in results) else 0)
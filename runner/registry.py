@@ -0,0 +1,87 @@
+import importlib
+from typing import Callable, Dict, List, Set, Tuple
+
+# (day, part, variant) -> 'module:function'
+solvers: Dict[Tuple[int, int, str], str] = {
+    (1, 1, 'default'): 'day_01.solution:part1',
+    (1, 2, 'default'): 'day_01.solution_part2:part2',
+    (1, 1, 'numpy'): 'day_01.solution_numpy:part1',
+    (1, 2, 'numpy'): 'day_01.solution_numpy:part2',
+    (1, 1, 'parallel'): 'day_01.solution_parallel:part1',
+    (1, 2, 'parallel'): 'day_01.solution_parallel:part2',
+    (2, 1, 'default'): 'day_02.solution:part1',
+    (2, 2, 'default'): 'day_02.solution_part2:part2',
+    (2, 1, 'numpy'): 'day_02.solution_numpy:part1',
+    (2, 2, 'numpy'): 'day_02.solution_numpy:part2',
+    (3, 1, 'default'): 'day_03.solution:part1',
+    (3, 2, 'default'): 'day_03.solution_part2:part2',
+    (3, 1, 'bitmask'): 'day_03.solution_bitmask:part1',
+    (3, 2, 'bitmask'): 'day_03.solution_bitmask:part2',
+    (4, 1, 'default'): 'day_04.solution:part1',
+    (4, 2, 'default'): 'day_04.solution:part2',
+    (4, 1, 'numpy'): 'day_04.solution_numpy:part1',
+    (4, 2, 'numpy'): 'day_04.solution_numpy:part2',
+    (5, 1, 'default'): 'day_05.solution:part1',
+    (5, 2, 'default'): 'day_05.solution:part2',
+    (5, 1, 'array'): 'day_05.solution_array:part1',
+    (5, 2, 'array'): 'day_05.solution_array:part2',
+    (5, 1, 'trace'): 'day_05.solution_trace:part1',
+    (5, 2, 'trace'): 'day_05.solution_trace:part2',
+    (5, 1, 'rope'): 'day_05.solution_rope:part1',
+    (5, 2, 'rope'): 'day_05.solution_rope:part2',
+    (6, 1, 'default'): 'day_06.solution:part1',
+    (6, 2, 'default'): 'day_06.solution:part2',
+    (6, 1, 'numpy'): 'day_06.solution_numpy:part1',
+    (6, 2, 'numpy'): 'day_06.solution_numpy:part2',
+    (7, 1, 'default'): 'day_07.solution:part1',
+    (7, 2, 'default'): 'day_07.solution:part2',
+    (8, 1, 'default'): 'day_08.solution:part1',
+    (8, 2, 'default'): 'day_08.solution:part2',
+    (9, 1, 'default'): 'day_09.solution:part1',
+    (9, 2, 'default'): 'day_09.solution:part2',
+    (10, 1, 'default'): 'day_10.solution:part1',
+    (10, 2, 'default'): 'day_10.solution:part2',
+    (11, 1, 'default'): 'day_11.solution:part1',
+    (11, 2, 'default'): 'day_11.solution:part2',
+    (12, 1, 'default'): 'day_12.solution:part1',
+    (12, 2, 'default'): 'day_12.solution:part2',
+    (13, 1, 'default'): 'day_13.solution:part1',
+    (13, 2, 'default'): 'day_13.solution:part2',
+    (14, 1, 'sets'): 'day_14.solution_sets:part1',
+    (14, 2, 'sets'): 'day_14.solution_sets:part2',
+    (14, 1, 'sets_optim'): 'day_14.solution_sets_optim:part1',
+    (14, 2, 'sets_optim'): 'day_14.solution_sets_optim:part2',
+    (14, 1, 'numpy_optim'): 'day_14.solution_numpy_optim:part1',
+    (14, 2, 'numpy_optim'): 'day_14.solution_numpy_optim:part2',
+    (15, 1, 'default'): 'day_15.solution:part1',
+    (15, 2, 'default'): 'day_15.solution:part2',
+    (16, 1, 'default'): 'day_16.solution:part1',
+    (16, 2, 'default'): 'day_16.solution:part2',
+    (17, 1, 'default'): 'day_17.solution:part1',
+    (17, 2, 'default'): 'day_17.solution:part2',
+    (18, 1, 'default'): 'day_18.solution:part1',
+    (18, 2, 'default'): 'day_18.solution:part2',
+    (19, 1, 'default'): 'day_19.solution:part1',
+}
+
+# Work in progress - the solvers can be run, but their answers are not verified, so they are not benchmarked
+experimental: Set[Tuple[int, int, str]] = {
+    (19, 1, 'default'),
+}
+
+
+def load_solver(target: str) -> Callable:
+    """Import the solver module (only when the solver is needed) and return the solver function."""
+    module_name, function_name = target.split(':')
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def find_solver(day: int, part: int, variant: str = 'default') -> str:
+    try:
+        return solvers[(day, part, variant)]
+    except KeyError:
+        raise ValueError(f'Solver not found: day {day}, part {part}, variant {variant!r}')
+
+
+def list_variants(day: int, part: int) -> List[str]:
+    return [variant for (solver_day, solver_part, variant) in solvers if (solver_day, solver_part) == (day, part)]
@@ -0,0 +1,153 @@
+"""
+Long-running solver service, which keeps a pool of workers with all solver modules imported.
+
+Requests and responses are json lines, read from stdin and written to stdout, or exchanged over a Unix socket
+(--socket PATH, one connection may send many requests). A request holds day, part, an optional variant and either
+`path` of the input file or the input itself as `input` (text) or `input_base64`. An optional `id` is copied to the
+response, which holds `answer` and solve `time` in seconds, or `error`. Responses on stdout are written as soon as
+the jobs are done, so they can come in a different order than the requests.
+"""
+import argparse
+import base64
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+from common import cache
+from runner.batch import warm_up
+from runner.registry import solvers, find_solver, load_solver
+
+
+def solve_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    response = {'id': request.get('id')}
+    try:
+        solver = load_solver(find_solver(request['day'], request['part'], request.get('variant', 'default')))
+
+        if 'path' in request:
+            path, tmp_path = request['path'], None
+        else:
+            data = request['input'].encode() if 'input' in request else base64.b64decode(request['input_base64'])
+            # Solvers read their input from a file
+            with tempfile.NamedTemporaryFile('wb', suffix='.txt', delete=False) as f:
+                f.write(data)
+            path = tmp_path = f.name
+
+        try:
+            st = time.perf_counter()
+            response['answer'] = solver(path)
+            response['time'] = time.perf_counter() - st
+        finally:
+            if tmp_path is not None:
+                os.remove(tmp_path)
+    except Exception as e:
+        response['error'] = f'{type(e).__name__}: {e}'
+        response['traceback'] = traceback.format_exc()
+    return response
+
+
+def encode_response(response: Dict[str, Any]) -> bytes:
+    # Answers are ints or strings, default=str covers numpy scalars
+    return json.dumps(response, default=str).encode() + b'\n'
+
+
+def create_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, initializer=warm_up, initargs=(sorted(set(solvers.values())),))
+
+
+def submit_line(pool: ProcessPoolExecutor, line: bytes) -> Future:
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        future = Future()
+        future.set_result({'id': None, 'error': f'Invalid request: {e}'})
+        return future
+    return pool.submit(solve_request, request)
+
+
+def serve_stdio(pool: ProcessPoolExecutor) -> None:
+    lock = threading.Lock()
+    out = sys.stdout.buffer
+
+    def write_response(future: Future) -> None:
+        with lock:
+            out.write(encode_response(future.result()))
+            out.flush()
+
+    futures = []
+    for line in sys.stdin.buffer:
+        if line.strip():
+            futures.append(submit_line(pool, line))
+            futures[-1].add_done_callback(write_response)
+
+    for future in futures:
+        future.result()
+
+
+def serve_socket(pool: ProcessPoolExecutor, socket_path: str) -> None:
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            # Responses of one connection keep the order of its requests
+            for line in self.rfile:
+                if line.strip():
+                    self.wfile.write(encode_response(submit_line(pool, line).result()))
+
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+
+    with socketserver.ThreadingUnixStreamServer(socket_path, Handler) as server:
+        server.daemon_threads = True
+        try:
+            server.serve_forever()
+        finally:
+            os.remove(socket_path)
+
+
+def request(socket_path: str, day: int, part: int, path: Optional[str] = None, data: Optional[bytes] = None,
+            variant: str = 'default') -> Dict[str, Any]:
+    """Send a single request to the service listening on the socket and return the response."""
+    message = {'day': day, 'part': part, 'variant': variant}
+    if path is not None:
+        message['path'] = os.path.abspath(path)
+    else:
+        message['input_base64'] = base64.b64encode(data).decode()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(message).encode() + b'\n')
+        with sock.makefile('rb') as f:
+            return json.loads(f.readline())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='python -m runner.service', description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--socket', help='listen on this Unix socket instead of stdin/stdout')
+    parser.add_argument('--workers', type=int, help='number of worker processes, CPU count by default')
+    parser.add_argument('--cache', action='store_true',
+                        help='store parsed inputs in AOC_CACHE_DIR and reuse them (off by default)')
+    args = parser.parse_args()
+
+    if args.cache:
+        cache.enable()
+
+    with create_pool(args.workers) as pool:
+        # Start the workers (and import the solvers) before the first request comes
+        pool.submit(int).result()
+
+        if args.socket:
+            # Exit cleanly (and remove the socket) when the service is stopped
+            signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+            try:
+                serve_socket(pool, args.socket)
+            except KeyboardInterrupt:
+                pass
+        else:
+            serve_stdio(pool)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Solutions are imported as top-level packages (day_05.solution), like in the runner
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,16 @@
+import random
+
+import numpy as np
+
+from day_01.solution_numpy import find_top_elves
+
+
+def test_find_top_elves_matches_sorting():
+    rng = random.Random(0)
+    for _ in range(300):
+        # Few distinct values, so there are many ties
+        totals = [rng.randint(0, 5) for _ in range(rng.randint(0, 10))]
+        by_calories = sorted(enumerate(totals), key=lambda elf: (-elf[1], elf[0]))
+        for k in range(-1, len(totals) + 2):
+            top = find_top_elves(np.array(totals, dtype=np.int64), k)
+            assert [(elf.elf, elf.calories) for elf in top] == by_calories[:max(k, 0)]
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from day_04.interval_index import AssignmentIndex
+from day_04.solution import Assignment
+
+
+def random_assignment(rng: random.Random, max_section: int = 30) -> Assignment:
+    start = rng.randint(1, max_section)
+    return Assignment(start, rng.randint(start, max_section))
+
+
+def test_empty_index():
+    index = AssignmentIndex([])
+    query = Assignment(1, 5)
+    assert len(index) == 0
+    assert index.overlapping(query) == []
+    assert index.containing(query) == []
+    assert index.count_overlapping(query) == 0
+    assert index.count_containing(query) == 0
+    assert index.count_overlapping_pairs() == 0
+
+
+def test_assignment_ending_before_start():
+    with pytest.raises(ValueError):
+        AssignmentIndex([Assignment(5, 4)])
+
+
+def test_index_matches_brute_force():
+    rng = random.Random(0)
+    for _ in range(500):
+        assignments = [random_assignment(rng) for _ in range(rng.randint(0, 40))]
+        index = AssignmentIndex(assignments)
+        # Found assignments are listed in order of start, assignments with the same start in the given order
+        by_start = sorted(assignments, key=lambda assignment: assignment.start)
+
+        for _ in range(10):
+            query = random_assignment(rng)
+            overlapping = [assignment for assignment in by_start if assignment.overlap(query)]
+            containing = [assignment for assignment in by_start if query in assignment]
+
+            assert index.overlapping(query) == overlapping
+            assert index.containing(query) == containing
+            assert index.count_overlapping(query) == len(overlapping)
+            assert index.count_containing(query) == len(containing)
+
+        overlapping_pairs = sum(first.overlap(second) for i, first in enumerate(assignments)
+                                for second in assignments[i + 1:])
+        assert index.count_overlapping_pairs() == overlapping_pairs
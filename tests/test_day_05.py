@@ -0,0 +1,78 @@
+import os
+import random
+import string
+
+import numpy as np
+import pytest
+
+from day_05.rope import RopeStack
+from day_05.solution import ArrayStack, Cargo, Stack, load_program, rearrange_cargo
+from day_05.solution_trace import trace_top_crates
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'day_05')
+SELF_MOVE = os.path.join(FIXTURES, 'self_move.txt')
+
+
+@pytest.mark.parametrize('stack_class', [Stack, ArrayStack, RopeStack])
+@pytest.mark.parametrize('task_part', [1, 2])
+def test_move_within_one_stack_changes_nothing(stack_class, task_part):
+    assert rearrange_cargo(SELF_MOVE, task_part, stack_class).get_top_elements() == 'AX'
+
+
+@pytest.mark.parametrize('task_part', [1, 2])
+def test_trace_of_move_within_one_stack_changes_nothing(task_part):
+    drawing, program = load_program(SELF_MOVE)
+    assert trace_top_crates(Cargo.from_drawing(drawing), program, task_part) == 'AX'
+
+
+def outcome(solve):
+    """Answer, or the type of the error."""
+    try:
+        return solve()
+    except (IndexError, KeyError) as e:
+        return type(e).__name__
+
+
+def random_cargo(rng: random.Random):
+    """Snapshot of up to 4 stacks (some empty) and a program with self-moves, empty moves and unknown stacks."""
+    stacks_count = rng.randint(1, 4)
+    snapshot = {stack_id: [rng.choice(string.ascii_uppercase) for _ in range(rng.randint(0, 8))]
+                for stack_id in range(1, stacks_count + 1)}
+
+    def stack_id():
+        # Now and then a stack which does not exist
+        return rng.randint(1, stacks_count + (rng.random() < 0.03))
+
+    rows = []
+    for _ in range(rng.randint(0, 25)):
+        from_stack = stack_id()
+        to_stack = from_stack if rng.random() < 0.3 else stack_id()
+        rows.append((rng.randint(0, 5), from_stack, to_stack))
+    return snapshot, np.array(rows, dtype=np.int64).reshape(-1, 3)
+
+
+def run_cargo(snapshot, program, task_part, stack_class=Stack):
+    cargo = Cargo.from_snapshot(snapshot, stack_class)
+    cargo.run(program, task_part)
+    return cargo.get_top_elements()
+
+
+@pytest.mark.parametrize('task_part', [1, 2])
+def test_trace_matches_moving_crates(task_part):
+    rng = random.Random(task_part)
+    for _ in range(3000):
+        snapshot, program = random_cargo(rng)
+        expected = outcome(lambda: run_cargo(snapshot, program, task_part))
+        assert outcome(lambda: trace_top_crates(Cargo.from_snapshot(snapshot), program, task_part)) == expected, \
+            (snapshot, program.tolist())
+
+
+@pytest.mark.parametrize('stack_class', [ArrayStack, RopeStack])
+@pytest.mark.parametrize('task_part', [1, 2])
+def test_stacks_match_linked_stack(stack_class, task_part):
+    rng = random.Random(10 + task_part)
+    for _ in range(1000):
+        snapshot, program = random_cargo(rng)
+        expected = outcome(lambda: run_cargo(snapshot, program, task_part))
+        assert outcome(lambda: run_cargo(snapshot, program, task_part, stack_class)) == expected, \
+            (snapshot, program.tolist())
@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from day_05.rope import Rope, RopeStack
+
+
+def test_empty_rope():
+    rope = Rope()
+    assert len(rope) == 0
+    assert list(rope) == []
+    rope.reverse()
+    with pytest.raises(IndexError):
+        rope.last()
+
+
+def test_rope_matches_list():
+    rng = random.Random(0)
+    for _ in range(200):
+        # Ropes and the lists they should hold
+        ropes = []
+        lists = []
+        for _ in range(3):
+            values = [rng.randrange(100) for _ in range(rng.randint(0, 20))]
+            ropes.append(Rope(values))
+            lists.append(values)
+
+        for _ in range(50):
+            i = rng.randrange(len(ropes))
+            operation = rng.choice(['split', 'extend', 'reverse', 'last', 'iter'])
+            if operation == 'split':
+                count = rng.randint(0, len(lists[i]))
+                first, rest = ropes[i].split(count)
+                assert len(ropes[i]) == 0
+                ropes[i:i + 1] = [first, rest]
+                lists[i:i + 1] = [lists[i][:count], lists[i][count:]]
+            elif operation == 'extend' and len(ropes) > 1:
+                j = rng.choice([j for j in range(len(ropes)) if j != i])
+                ropes[i].extend(ropes[j])
+                assert len(ropes[j]) == 0
+                lists[i] = lists[i] + lists[j]
+                del ropes[j], lists[j]
+            elif operation == 'reverse':
+                ropes[i].reverse()
+                lists[i].reverse()
+            elif operation == 'last':
+                # Reversal flags of the nodes are still pending, last() has to follow their parity
+                if lists[i]:
+                    assert ropes[i].last() == lists[i][-1]
+                else:
+                    with pytest.raises(IndexError):
+                        ropes[i].last()
+            elif operation == 'iter':
+                assert list(ropes[i]) == lists[i]
+
+        for rope, values in zip(ropes, lists):
+            assert len(rope) == len(values)
+            assert list(rope) == values
+
+
+def test_rope_stack_matches_list():
+    rng = random.Random(1)
+    for _ in range(200):
+        stack = RopeStack()
+        # Top at the end
+        elements = []
+        for _ in range(50):
+            operation = rng.choice(['push', 'pop', 'get', 'take_top', 'put_on_top'])
+            if operation == 'push':
+                value = rng.randrange(100)
+                stack.push(value)
+                elements.append(value)
+            elif operation in ('pop', 'get'):
+                if elements:
+                    assert getattr(stack, operation)() == elements[-1]
+                    if operation == 'pop':
+                        elements.pop()
+                else:
+                    with pytest.raises(IndexError):
+                        getattr(stack, operation)()
+            elif operation == 'take_top':
+                count = rng.randint(0, len(elements) + 1)
+                if count > len(elements):
+                    with pytest.raises(IndexError):
+                        stack.take_top(count)
+                    continue
+                segment = stack.take_top(count)
+                taken = elements[len(elements) - count:]
+                del elements[len(elements) - count:]
+                if rng.random() < 0.5:
+                    segment.reverse()
+                    taken.reverse()
+                assert list(segment) == taken
+                # The segment is put back, either as a rope or as a list
+                stack.put_on_top(segment if rng.random() < 0.5 else list(segment))
+                elements.extend(taken)
+            elif operation == 'put_on_top':
+                values = [rng.randrange(100) for _ in range(rng.randint(0, 5))]
+                stack.put_on_top(values)
+                elements.extend(values)
+
+            assert len(stack) == len(elements)
+        assert stack.get_all(top_first=False) == elements
+        assert stack.get_all() == elements[::-1]
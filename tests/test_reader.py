@@ -0,0 +1,22 @@
+import pytest
+
+from common.reader import yield_byte_rows, yield_rows
+
+
+@pytest.mark.parametrize('yield_function, first_row', [(yield_rows, 'first'), (yield_byte_rows, b'first')])
+def test_abandoned_generator_closes_the_mapping(tmp_path, yield_function, first_row):
+    path = tmp_path / 'input.txt'
+    path.write_bytes(b'first\r\nsecond\n')
+
+    rows = yield_function(str(path))
+    assert next(rows) == first_row
+    data = rows.gi_frame.f_locals['data']
+    rows.close()
+    assert data.closed
+
+
+@pytest.mark.parametrize('yield_function', [yield_rows, yield_byte_rows])
+def test_empty_file(tmp_path, yield_function):
+    path = tmp_path / 'input.txt'
+    path.write_bytes(b'')
+    assert list(yield_function(str(path))) == []